@@ -0,0 +1,13 @@
+"""
+Benchmarks for the Odoo MCP Server, run against a local fake Odoo instance.
+
+Run from the repository root, e.g. ``python -m benchmarks.bench_order_details``.
+"""
+
+import sys
+from pathlib import Path
+
+# Make ``mcpserver`` importable without installing the package
+_SRC = Path(__file__).resolve().parents[1] / "src"
+if str(_SRC) not in sys.path:
+    sys.path.insert(0, str(_SRC))
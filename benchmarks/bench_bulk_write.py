@@ -0,0 +1,62 @@
+"""
+bulk_create and bulk_write throughput by batch size.
+
+Creates partners and reprices products (a few distinct prices, so writes
+are grouped) with one Odoo call per batch; a batch size of 1 is the
+one-record-per-call baseline.
+
+    python -m benchmarks.bench_bulk_write [--records 2000] [--batch-sizes 1 10 100 1000]
+"""
+
+import argparse
+import json
+import time
+
+from .common import build_server, call_tool
+from .fake_odoo import FakeOdoo, serve
+
+DISTINCT_PRICES = 4
+
+
+def run(records: int, batch_sizes, latency: float):
+    print(f"{'tool':<12} {'batch':>6} {'round trips':>12} {'seconds':>8} {'records/s':>10}")
+    fake = FakeOdoo(products=records, partners=1, orders=0, latency=latency)
+    with serve(fake) as url:
+        mcp, _server = build_server(url)
+        for tool, arguments in (
+            (
+                "bulk_create",
+                {"model": "res.partner", "records": [
+                    {"name": f"Bulk {i}", "email": f"bulk{i}@example.com"} for i in range(records)
+                ]},
+            ),
+            (
+                "bulk_write",
+                {"model": "product.product", "updates": [
+                    {"id": i + 1, "list_price": 10.0 + i % DISTINCT_PRICES} for i in range(records)
+                ]},
+            ),
+        ):
+            for size in batch_sizes:
+                fake.reset_calls()
+                start = time.perf_counter()
+                result = json.loads(call_tool(mcp, tool, {**arguments, "chunk_size": size})[0].text)
+                elapsed = time.perf_counter() - start
+                assert result["success"], result["errors"][:3]
+                print(
+                    f"{tool:<12} {size:>6} {fake.round_trips:>12} {elapsed:>8.2f} "
+                    f"{records / elapsed:>10.0f}"
+                )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=2000)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 10, 100, 1000])
+    parser.add_argument("--latency", type=float, default=0.005, help="Injected seconds per call")
+    args = parser.parse_args()
+    run(args.records, args.batch_sizes, args.latency)
+
+
+if __name__ == "__main__":
+    main()
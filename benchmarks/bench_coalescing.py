@@ -0,0 +1,62 @@
+"""
+N identical concurrent reads with and without request coalescing.
+
+All clients call ``get_products`` with the same arguments at the same time;
+with ``ODOO_COALESCE`` they share one ``search_read`` round trip. The cache
+is disabled so every call reaches the coalescing layer.
+
+    python -m benchmarks.bench_coalescing [--clients 1 8 32] [--latency 0.05]
+"""
+
+import argparse
+import asyncio
+import time
+
+from .common import build_server
+from .fake_odoo import FakeOdoo, serve
+
+
+async def burst(mcp, clients):
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(mcp.call_tool("get_products", {"limits": 100}) for _ in range(clients))
+    )
+    return time.perf_counter() - start
+
+
+def run(client_counts, latency, pool_size):
+    print(f"{'clients':>8} {'coalesce':>9} {'round trips':>12} {'coalesced':>10} {'ms':>8}")
+    for clients in client_counts:
+        for coalesce in (0, 1):
+            fake = FakeOdoo(products=500, latency=latency)
+            with serve(fake) as url:
+                mcp, server = build_server(
+                    url,
+                    ODOO_CACHE=0,
+                    ODOO_COALESCE=coalesce,
+                    ODOO_POOL_SIZE=pool_size,
+                    ODOO_MAX_CONCURRENCY=max(clients, 1),
+                )
+                fake.reset_calls()
+                elapsed = asyncio.run(burst(mcp, clients))
+                singleflight = server.tools.singleflight
+                coalesced = sum(
+                    counts["coalesced"] for counts in singleflight.stats().values()
+                ) if singleflight else 0
+                print(
+                    f"{clients:>8} {'on' if coalesce else 'off':>9} {fake.round_trips:>12} "
+                    f"{coalesced:>10} {elapsed * 1000:>8.1f}"
+                )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--latency", type=float, default=0.05, help="Injected seconds per call")
+    parser.add_argument("--pool-size", type=int, default=8, help="ODOO_POOL_SIZE")
+    args = parser.parse_args()
+    run(args.clients, args.latency, args.pool_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Sequential calls on one connection versus concurrent calls on the pool.
+
+    python -m benchmarks.bench_connection_pool [--calls 200] [--latency 0.01]
+"""
+
+import argparse
+import time
+import xmlrpc.client
+from concurrent.futures import ThreadPoolExecutor
+
+from mcpserver.connection import OdooConnectionPool
+from mcpserver.transport import make_transport
+
+from .fake_odoo import FAKE_DATABASE, FAKE_PASSWORD, FAKE_UID, FakeOdoo, serve
+
+CALL = (
+    FAKE_DATABASE,
+    FAKE_UID,
+    FAKE_PASSWORD,
+    "product.product",
+    "search_read",
+    [[]],
+    {"fields": ["name", "list_price"], "limit": 20},
+)
+
+
+def sequential_new_connection(url, calls):
+    for _ in range(calls):
+        xmlrpc.client.ServerProxy(url).execute_kw(*CALL)
+
+
+def sequential_keep_alive(url, calls):
+    proxy = xmlrpc.client.ServerProxy(url, transport=make_transport(url, 30))
+    for _ in range(calls):
+        proxy.execute_kw(*CALL)
+
+
+def pooled_concurrent(base_url, calls, size):
+    pool = OdooConnectionPool(base_url, size=size)
+    with ThreadPoolExecutor(max_workers=size) as executor:
+        list(executor.map(lambda _: pool.execute_kw(*CALL), range(calls)))
+    pool.close()
+
+
+def run(calls, latency, pool_sizes):
+    fake = FakeOdoo(products=200, latency=latency)
+    with serve(fake) as base_url:
+        url = f"{base_url}/xmlrpc/2/object"
+        scenarios = [
+            ("sequential, new connection", lambda: sequential_new_connection(url, calls)),
+            ("sequential, keep-alive", lambda: sequential_keep_alive(url, calls)),
+        ] + [
+            (f"pooled, {size} connections", lambda size=size: pooled_concurrent(base_url, calls, size))
+            for size in pool_sizes
+        ]
+
+        print(f"{'scenario':<30} {'seconds':>8} {'calls/s':>9}")
+        for name, scenario in scenarios:
+            start = time.perf_counter()
+            scenario()
+            elapsed = time.perf_counter() - start
+            print(f"{name:<30} {elapsed:>8.2f} {calls / elapsed:>9.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.01, help="Injected seconds per call")
+    parser.add_argument("--pool-sizes", type=int, nargs="+", default=[2, 4, 8, 16])
+    args = parser.parse_args()
+    run(args.calls, args.latency, args.pool_sizes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+export_records throughput and memory by worker count and dataset size.
+
+Every case exports all partners of a fake Odoo process, running in a fresh
+client process so its peak RSS growth is measured alone. Memory should stay
+flat as the dataset grows, and workers overlap Odoo's per-call latency.
+
+    python -m benchmarks.bench_export [--records 10000 100000] [--workers 1 4 8] [--format csv]
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from .common import ROOT, build_server, call_tool, fake_odoo_process
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is reported in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_case(url, workers, chunk_size, file_format, protocol) -> dict:
+    with tempfile.TemporaryDirectory() as export_dir:
+        mcp, _server = build_server(
+            url,
+            ODOO_EXPORT_DIR=export_dir,
+            ODOO_EXPORT_WORKERS=workers,
+            ODOO_POOL_SIZE=workers,
+            ODOO_CACHE=0,
+            ODOO_PROTOCOL=protocol,
+        )
+        baseline = peak_rss_mb()
+        start = time.perf_counter()
+        result = call_tool(
+            mcp,
+            "export_records",
+            {"model": "res.partner", "fields": ["name", "email"], "file_format": file_format,
+             "chunk_size": chunk_size},
+        )
+        elapsed = time.perf_counter() - start
+        records = json.loads(result[0].text)["records"]
+        size = os.path.getsize(os.path.join(export_dir, os.listdir(export_dir)[0]))
+    return {
+        "records": records,
+        "seconds": elapsed,
+        "file_mb": size / 2**20,
+        "peak_rss_delta_mb": peak_rss_mb() - baseline,
+    }
+
+
+def run(record_counts, worker_counts, chunk_size, latency, file_format, protocol):
+    print(
+        f"{'records':>8} {'workers':>8} {'seconds':>8} {'records/s':>10} "
+        f"{'file MB':>8} {'peak MB':>8}"
+    )
+    for count in record_counts:
+        with fake_odoo_process(partners=count, products=1, orders=0, latency=latency) as url:
+            for workers in worker_counts:
+                command = [
+                    sys.executable, "-W", "ignore", "-m", "benchmarks.bench_export",
+                    "--client", url, "--workers", str(workers),
+                    "--chunk-size", str(chunk_size), "--format", file_format,
+                    "--protocol", protocol,
+                ]
+                output = subprocess.run(
+                    command, capture_output=True, text=True, check=True, cwd=ROOT
+                ).stdout
+                r = json.loads(output.strip().splitlines()[-1])
+                print(
+                    f"{r['records']:>8} {workers:>8} {r['seconds']:>8.2f} "
+                    f"{r['records'] / r['seconds']:>10.0f} {r['file_mb']:>8.1f} "
+                    f"{r['peak_rss_delta_mb']:>8.1f}"
+                )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--records", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--chunk-size", type=int, default=2000)
+    # Odoo takes a while to read a chunk; the fake itself is much faster
+    parser.add_argument("--latency", type=float, default=0.2, help="Injected seconds per call")
+    parser.add_argument("--format", choices=["ndjson", "csv"], default="ndjson")
+    parser.add_argument("--protocol", choices=["xmlrpc", "jsonrpc"], default="jsonrpc")
+    parser.add_argument("--client", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.client:
+        result = run_case(args.client, args.workers[0], args.chunk_size, args.format, args.protocol)
+        print(json.dumps(result))
+    else:
+        run(args.records, args.workers, args.chunk_size, args.latency, args.format, args.protocol)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+Point lookup latency while heavy jobs run, by scheduling mode.
+
+A client calls ``get_product_details`` back to back while other clients
+keep exports (``export_records``) and ``create_order`` chains with invoice
+and payment running. The fake Odoo serves ``--capacity`` calls at a time,
+so every call competes for the same Odoo workers. Modes:
+
+- ``off``: no admission control; calls reach Odoo in arrival order;
+- ``equal``: lanes with equal weights; interactive reads keep their
+  reserved Odoo slot;
+- ``lanes``: the default weights, interactive reads first.
+
+Lookups get faster at the expense of the heavy jobs' share of Odoo.
+
+    python -m benchmarks.bench_lanes [--seconds 10] [--capacity 4] [--latency 0.1]
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+
+from .common import build_server, fake_odoo_process
+
+# Every mode sets every variable: build_server leaves them in the environment
+MODES = {
+    "off": {"ODOO_ADAPTIVE_CONCURRENCY": 0, "ODOO_LANE_WEIGHTS": ""},
+    "equal": {"ODOO_ADAPTIVE_CONCURRENCY": 1, "ODOO_LANE_WEIGHTS": "interactive=1,write=1,bulk=1"},
+    "lanes": {"ODOO_ADAPTIVE_CONCURRENCY": 1, "ODOO_LANE_WEIGHTS": ""},
+}
+
+
+async def lookups(mcp, stop, latencies, products):
+    i = 0
+    while not stop.is_set():
+        i += 1
+        start = time.perf_counter()
+        await mcp.call_tool("get_product_details", {"product_name": f"Product {i % products + 1}"})
+        latencies.append(time.perf_counter() - start)
+
+
+async def exports(mcp, stop, done):
+    while not stop.is_set():
+        result = await mcp.call_tool(
+            "export_records", {"model": "res.partner", "fields": ["name"], "chunk_size": 500}
+        )
+        done.append(result)
+
+
+async def orders(mcp, stop, done, partners, products):
+    i = 0
+    while not stop.is_set():
+        i += 1
+        await mcp.call_tool(
+            "create_order",
+            {
+                "customer_name": f"Customer {i % partners + 1}",
+                "product_id": i % products + 1,
+                "create_invoice": True,
+                "finish_payment": True,
+            },
+        )
+        done.append(i)
+
+
+async def measure(mcp, seconds, exporters, writers, lookup_clients, partners, products):
+    stop = asyncio.Event()
+    latencies, exported, ordered = [], [], []
+    tasks = [asyncio.create_task(exports(mcp, stop, exported)) for _ in range(exporters)]
+    tasks += [
+        asyncio.create_task(orders(mcp, stop, ordered, partners, products)) for _ in range(writers)
+    ]
+    # Let the heavy jobs fill Odoo before measuring
+    await asyncio.sleep(1)
+    tasks += [
+        asyncio.create_task(lookups(mcp, stop, latencies, products)) for _ in range(lookup_clients)
+    ]
+    await asyncio.sleep(seconds)
+    stop.set()
+    await asyncio.gather(*tasks)
+    return latencies, len(exported), len(ordered)
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))] if values else 0
+
+
+def run(modes, seconds, capacity, latency, exporters, writers, lookup_clients):
+    partners, products = 2000, 500
+    print(
+        f"{'mode':>6} {'lookups':>8} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8} "
+        f"{'exports':>8} {'orders':>7}"
+    )
+    for mode in modes:
+        # A separate process, so Odoo's work does not compete with the server for the GIL
+        fake = fake_odoo_process(
+            products=products, partners=partners, orders=0, latency=latency, capacity=capacity
+        )
+        with fake as url, tempfile.TemporaryDirectory() as export_dir:
+            mcp, _server = build_server(
+                url,
+                ODOO_EXPORT_DIR=export_dir,
+                ODOO_POOL_SIZE=capacity,
+                ODOO_CACHE=0,
+                ODOO_COALESCE=0,
+                ODOO_QUEUE_TIMEOUT=60,
+                ODOO_SCHEMA_CACHE=0,
+                **MODES[mode],
+            )
+            latencies, exported, ordered = asyncio.run(
+                measure(mcp, seconds, exporters, writers, lookup_clients, partners, products)
+            )
+        print(
+            f"{mode:>6} {len(latencies):>8} {percentile(latencies, 0.5) * 1000:>8.0f} "
+            f"{percentile(latencies, 0.99) * 1000:>8.0f} {max(latencies) * 1000:>8.0f} "
+            f"{exported:>8} {ordered:>7}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--modes", nargs="+", choices=list(MODES), default=list(MODES))
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--capacity", type=int, default=4, help="Calls Odoo serves at once")
+    parser.add_argument("--latency", type=float, default=0.1, help="Injected seconds per call")
+    parser.add_argument("--exporters", type=int, default=2, help="Clients running exports")
+    parser.add_argument("--writers", type=int, default=4, help="Clients creating orders")
+    parser.add_argument("--lookups", type=int, default=2, help="Clients doing point lookups")
+    args = parser.parse_args()
+    run(
+        args.modes,
+        args.seconds,
+        args.capacity,
+        args.latency,
+        args.exporters,
+        args.writers,
+        args.lookups,
+    )
+
+
+if __name__ == "__main__":
+    main()
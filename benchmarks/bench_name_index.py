@@ -0,0 +1,88 @@
+"""
+Lookup latency of the local trigram name index versus a linear scan.
+
+    python -m benchmarks.bench_name_index [--sizes 10000 100000 1000000]
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from mcpserver.index import NameIndex
+
+WORDS = [
+    "steel", "copper", "oak", "desk", "chair", "lamp", "cable", "screw", "bolt", "panel",
+    "frame", "glass", "filter", "valve", "pump", "motor", "sensor", "switch", "drill", "saw",
+]
+
+
+def synthetic_names(count, rng):
+    return [
+        f"{rng.choice(WORDS).title()} {rng.choice(WORDS)} {rng.choice(WORDS)} {i}"
+        for i in range(1, count + 1)
+    ]
+
+
+def percentile(samples, q):
+    return statistics.quantiles(samples, n=100)[q - 1] if len(samples) > 1 else samples[0]
+
+
+def measure(search, queries):
+    samples = []
+    for query in queries:
+        start = time.perf_counter()
+        search(query)
+        samples.append((time.perf_counter() - start) * 1000)
+    return percentile(samples, 50), percentile(samples, 99)
+
+
+def run(sizes, queries_per_size, scan_limit):
+    rng = random.Random(0)
+    print(
+        f"{'names':>9} {'build s':>8} {'index p50 ms':>13} {'index p99 ms':>13} "
+        f"{'fuzzy p50 ms':>13} {'scan p50 ms':>12}"
+    )
+    for size in sizes:
+        names = synthetic_names(size, rng)
+        index = NameIndex()
+        start = time.perf_counter()
+        for record_id, name in enumerate(names, 1):
+            index.upsert(record_id, "en_US", {"name": name})
+        build = time.perf_counter() - start
+
+        # Distinctive substrings of existing names, e.g. "chair lamp 4821"
+        queries = [
+            names[rng.randrange(size)].lower().split(" ", 1)[1] for _ in range(queries_per_size)
+        ]
+        typos = [query.replace("a", "e", 1) for query in queries[: max(queries_per_size // 10, 1)]]
+
+        p50, p99 = measure(lambda q: index.search(q, limit=1), queries)
+        fuzzy_p50, _ = measure(lambda q: index.search(q, limit=1, fuzzy=True), typos)
+
+        scan = "-"
+        if size <= scan_limit:
+            lowered = [name.lower() for name in names]
+            scan_p50, _ = measure(
+                lambda q: [n for n in lowered if q in n], queries[:50]
+            )
+            scan = f"{scan_p50:.3f}"
+
+        print(
+            f"{size:>9} {build:>8.1f} {p50:>13.3f} {p99:>13.3f} {fuzzy_p50:>13.3f} {scan:>12}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000])
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument(
+        "--scan-limit", type=int, default=100000, help="Largest size also timed with a linear scan"
+    )
+    args = parser.parse_args()
+    run(args.sizes, args.queries, args.scan_limit)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+Round trips and latency of ``get_order_details`` as the order count grows.
+
+    python -m benchmarks.bench_order_details [--latency 0.005]
+"""
+
+import argparse
+
+from .common import build_server, call_tool, timed
+from .fake_odoo import FakeOdoo, serve
+
+
+def run(order_counts, latency: float, repeat: int):
+    print(f"{'orders':>8} {'round trips':>12} {'best ms':>10}")
+    for count in order_counts:
+        fake = FakeOdoo(orders=count, latency=latency)
+        with serve(fake) as url:
+            mcp, _server = build_server(url)
+            arguments = {"limits": count}
+
+            fake.reset_calls()
+            call_tool(mcp, "get_order_details", arguments)
+            round_trips = fake.round_trips
+
+            elapsed = timed(call_tool, mcp, "get_order_details", arguments, repeat=repeat)
+            print(f"{count:>8} {round_trips:>12} {elapsed:>10.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--orders", type=int, nargs="+", default=[1, 10, 50, 200, 1000])
+    parser.add_argument("--latency", type=float, default=0.002, help="Injected seconds per call")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    run(args.orders, args.latency, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Startup time and tool latency while Odoo does not answer.
+
+The "Odoo" here accepts connections and never replies, like a hung server
+behind a load balancer. Without the circuit breaker every call waits for
+the full ``ODOO_TIMEOUT``; with it only the first few do.
+
+    python -m benchmarks.bench_outage [--calls 10] [--timeout 1]
+"""
+
+import argparse
+import socket
+import threading
+import time
+from contextlib import contextmanager
+
+from .common import build_server, call_tool
+
+
+@contextmanager
+def hung_server():
+    """Accept TCP connections and never answer; yields the base URL."""
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(128)
+    accepted = []
+    stopped = threading.Event()
+
+    def accept():
+        listener.settimeout(0.1)
+        while not stopped.is_set():
+            try:
+                accepted.append(listener.accept()[0])
+            except socket.timeout:
+                continue
+
+    thread = threading.Thread(target=accept, daemon=True)
+    thread.start()
+    try:
+        host, port = listener.getsockname()
+        yield f"http://{host}:{port}"
+    finally:
+        stopped.set()
+        thread.join()
+        for conn in accepted:
+            conn.close()
+        listener.close()
+
+
+THRESHOLD = 3
+
+
+def run(calls, timeout):
+    print(
+        f"{'breaker':>8} {'startup ms':>11} {'first call s':>13} {'total s':>8} "
+        f"{'max later call s':>17}"
+    )
+    with hung_server() as url:
+        for threshold in (10**6, THRESHOLD):
+            start = time.perf_counter()
+            # No schema prefetch, whose failures would open the circuit before the calls
+            mcp, _server = build_server(
+                url,
+                ODOO_TIMEOUT=timeout,
+                ODOO_BREAKER_THRESHOLD=threshold,
+                ODOO_CACHE=0,
+                ODOO_SCHEMA_CACHE=0,
+            )
+            startup = time.perf_counter() - start
+
+            durations = []
+            for _ in range(calls):
+                start = time.perf_counter()
+                try:
+                    call_tool(mcp, "get_products", {"limits": 10})
+                except Exception:
+                    pass
+                durations.append(time.perf_counter() - start)
+            label = "off" if threshold > calls else "on"
+            print(
+                f"{label:>8} {startup * 1000:>11.1f} {durations[0]:>13.2f} "
+                f"{sum(durations):>8.2f} {max(durations[THRESHOLD:] or [0]):>17.2f}"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=10)
+    parser.add_argument("--timeout", type=float, default=1, help="ODOO_TIMEOUT in seconds")
+    args = parser.parse_args()
+    run(args.calls, args.timeout)
+
+
+if __name__ == "__main__":
+    main()
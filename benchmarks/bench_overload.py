@@ -0,0 +1,102 @@
+"""
+A burst of tool calls against a saturated Odoo, with and without the
+adaptive concurrency limit.
+
+The fake Odoo serves ``--capacity`` calls at a time, like a fixed number of
+Odoo workers, and the server may open many more connections than that.
+Without the limit every call goes straight to Odoo, queues there, and
+those that time out come back as "No product found". With it, the limit
+settles near Odoo's capacity, latency stays bounded, and the calls that
+cannot be served in time fail fast with an "overloaded" error.
+
+    python -m benchmarks.bench_overload [--clients 200] [--capacity 4] [--latency 0.05]
+"""
+
+import argparse
+import asyncio
+import time
+
+from .common import build_server
+from .fake_odoo import FakeOdoo, serve
+
+
+async def burst(mcp, clients, products):
+    async def one(i):
+        start = time.perf_counter()
+        try:
+            result = await mcp.call_tool(
+                "get_product_details", {"product_name": f"Product {i % products + 1}"}
+            )
+            text = result[0][0].text if isinstance(result, tuple) else result[0].text
+            outcome = "not found" if text.startswith("No product found") else "ok"
+        except Exception as e:
+            outcome = "overloaded" if "overloaded" in str(e) else "error"
+        return outcome, time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(one(i) for i in range(clients)))
+    return results, time.perf_counter() - start
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))] if values else 0
+
+
+def run(clients, capacity, latency, timeout, queue_timeout):
+    products = 500
+    print(
+        f"{'adaptive':>8} {'ok':>5} {'not found':>10} {'overloaded':>11} {'errors':>7} "
+        f"{'ok p50 ms':>10} {'ok p99 ms':>10} {'failed p99 ms':>14} {'seconds':>8} {'limit':>6}"
+    )
+    for adaptive in (0, 1):
+        fake = FakeOdoo(products=products, partners=5, orders=0, latency=latency, capacity=capacity)
+        with serve(fake) as url:
+            mcp, server = build_server(
+                url,
+                ODOO_ADAPTIVE_CONCURRENCY=adaptive,
+                ODOO_POOL_SIZE=clients,
+                ODOO_MAX_CONCURRENCY=clients,
+                ODOO_TIMEOUT=timeout,
+                ODOO_QUEUE_TIMEOUT=queue_timeout,
+                ODOO_QUEUE_SIZE=clients,
+                ODOO_CACHE=0,
+                ODOO_COALESCE=0,
+                # Hung calls must not open the circuit for the whole run
+                ODOO_BREAKER_THRESHOLD=10**6,
+                ODOO_SCHEMA_CACHE=0,
+            )
+            # Warm up: authenticate and let the limit see Odoo's idle latency
+            asyncio.run(burst(mcp, capacity, products))
+            results, elapsed = asyncio.run(burst(mcp, clients, products))
+
+        counts = {"ok": 0, "not found": 0, "overloaded": 0, "error": 0}
+        for outcome, _ in results:
+            counts[outcome] += 1
+        ok = [seconds for outcome, seconds in results if outcome == "ok"]
+        failed = [seconds for outcome, seconds in results if outcome != "ok"]
+        limiter = server.tools.limiters.get(server.tenants.default)
+        print(
+            f"{adaptive:>8} {counts['ok']:>5} {counts['not found']:>10} "
+            f"{counts['overloaded']:>11} {counts['error']:>7} "
+            f"{percentile(ok, 0.5) * 1000:>10.0f} {percentile(ok, 0.99) * 1000:>10.0f} "
+            f"{percentile(failed, 0.99) * 1000:>14.0f} {elapsed:>8.2f} "
+            f"{limiter.stats()['limit'] if limiter else '-':>6}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--clients", type=int, default=200, help="Concurrent tool calls")
+    parser.add_argument("--capacity", type=int, default=4, help="Calls Odoo serves at once")
+    parser.add_argument("--latency", type=float, default=0.05, help="Injected seconds per call")
+    parser.add_argument("--timeout", type=float, default=1, help="ODOO_TIMEOUT in seconds")
+    parser.add_argument("--queue-timeout", type=float, default=1, help="ODOO_QUEUE_TIMEOUT in seconds")
+    args = parser.parse_args()
+    run(args.clients, args.capacity, args.latency, args.timeout, args.queue_timeout)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Peak RSS of reading a large catalog through ``get_products``, with and
+without paging.
+
+The fake Odoo server runs in its own process and every mode is measured in
+a fresh client process, so the numbers only include the MCP server side.
+
+    python -m benchmarks.bench_products_memory [--products 100000]
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+
+from .common import ROOT, build_server, call_tool, fake_odoo_process
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is reported in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def client(url, mode, products, page_size):
+    mcp, _server = build_server(url, ODOO_CACHE=0)
+    baseline = peak_rss_mb()
+
+    fetched = 0
+    if mode == "unpaged":
+        result = call_tool(mcp, "get_products", {"limits": products})
+        fetched = len(json.loads(result[0].text)["products"])
+    else:
+        arguments = {"page_size": page_size}
+        while True:
+            page = json.loads(call_tool(mcp, "get_products", arguments)[0].text)
+            fetched += len(page["products"])
+            if not page["next_cursor"]:
+                break
+            arguments["cursor"] = page["next_cursor"]
+
+    print(json.dumps({"fetched": fetched, "peak_rss_mb": peak_rss_mb() - baseline}))
+
+
+def run(products, page_size):
+    with fake_odoo_process(products=products) as url:
+        print(f"{products} products")
+        print(f"{'mode':<22} {'fetched':>9} {'peak RSS delta MB':>18}")
+        for mode in ("unpaged", "paged"):
+            output = subprocess.run(
+                [
+                    sys.executable, "-W", "ignore", "-m", "benchmarks.bench_products_memory",
+                    "--client", mode, "--url", url,
+                    "--products", str(products), "--page-size", str(page_size),
+                ],
+                capture_output=True, text=True, check=True, cwd=ROOT,
+            ).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+            label = mode if mode == "unpaged" else f"paged ({page_size}/page)"
+            print(f"{label:<22} {result['fetched']:>9} {result['peak_rss_mb']:>18.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--products", type=int, default=100000)
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--client", choices=["unpaged", "paged"], help=argparse.SUPPRESS)
+    parser.add_argument("--url", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.client:
+        client(args.url, args.client, args.products, args.page_size)
+    else:
+        run(args.products, args.page_size)
+
+
+if __name__ == "__main__":
+    main()
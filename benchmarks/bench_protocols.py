@@ -0,0 +1,93 @@
+"""
+XML-RPC versus JSON-RPC: encode/decode time and bytes on the wire.
+
+Marshals a synthetic ``search_read`` result of ``--records`` product rows
+with each codec, then times ``get_products`` end to end over both protocols
+against the fake Odoo server.
+
+    python -m benchmarks.bench_protocols [--records 10000]
+"""
+
+import argparse
+import gzip
+import json
+import time
+import xmlrpc.client
+
+from mcpserver import transport
+
+from .common import build_server, call_tool, timed
+from .fake_odoo import FakeOdoo, serve
+
+
+def synthetic_rows(count):
+    return [
+        {
+            "id": i,
+            "name": f"Product {i}",
+            "list_price": i * 1.25,
+            "default_code": f"SKU-{i:06d}",
+            "active": True,
+            "categ_id": [i % 50 + 1, f"Category {i % 50 + 1}"],
+            "description_sale": f"Synthetic product number {i} for benchmarking",
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+def best_of(fn, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def codecs():
+    yield "xmlrpc", (
+        lambda rows: xmlrpc.client.dumps((rows,), methodresponse=True).encode(),
+        lambda body: xmlrpc.client.loads(body)[0][0],
+    )
+    yield "json (stdlib)", (
+        lambda rows: json.dumps(rows, separators=(",", ":")).encode(),
+        json.loads,
+    )
+    if transport.orjson is not None:
+        yield "json (orjson)", (transport.orjson.dumps, transport.orjson.loads)
+
+
+def run_codecs(records):
+    rows = synthetic_rows(records)
+    print(f"{records} records")
+    print(f"{'codec':<15} {'encode ms':>10} {'decode ms':>10} {'bytes':>11} {'gzip bytes':>11}")
+    for name, (encode, decode) in codecs():
+        body = encode(rows)
+        encode_ms = best_of(lambda: encode(rows))
+        decode_ms = best_of(lambda: decode(body))
+        compressed = len(gzip.compress(body, compresslevel=1))
+        print(f"{name:<15} {encode_ms:>10.1f} {decode_ms:>10.1f} {len(body):>11} {compressed:>11}")
+
+
+def run_end_to_end(records):
+    fake = FakeOdoo(products=records)
+    with serve(fake) as url:
+        print(f"\nget_products over {records} products")
+        print(f"{'protocol':<15} {'best ms':>10}")
+        for protocol, gzip_flag in (("xmlrpc", 0), ("jsonrpc", 0), ("jsonrpc", 1)):
+            mcp, _server = build_server(url, ODOO_PROTOCOL=protocol, ODOO_GZIP=gzip_flag)
+            elapsed = timed(call_tool, mcp, "get_products", {}, repeat=3)
+            label = f"{protocol}{' + gzip' if gzip_flag else ''}"
+            print(f"{label:<15} {elapsed:>10.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=10000)
+    args = parser.parse_args()
+    run_codecs(args.records)
+    run_end_to_end(args.records)
+
+
+if __name__ == "__main__":
+    main()
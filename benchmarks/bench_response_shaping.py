@@ -0,0 +1,72 @@
+"""
+Response size of get_order_details per format, field projection and budget.
+
+Compares the text layout with the 'records' and 'columns' formats, a
+projection to two fields, and the default response budget, which cuts the
+answer short with the offset to continue from.
+
+    python -m benchmarks.bench_response_shaping [--orders 100 1000]
+"""
+
+import argparse
+import json
+
+from .common import build_server, call_tool, timed
+from .fake_odoo import FakeOdoo, serve
+
+UNLIMITED = 10**9
+
+CASES = (
+    ("text", {"response_format": "text", "max_bytes": UNLIMITED}),
+    ("records", {"response_format": "records", "max_bytes": UNLIMITED}),
+    ("columns", {"response_format": "columns", "max_bytes": UNLIMITED}),
+    ("columns, 2 fields", {
+        "response_format": "columns", "fields": ["name", "amount_total"], "max_bytes": UNLIMITED,
+    }),
+    ("text, default budget", {"response_format": "text"}),
+)
+
+
+def response_text(mcp, tool, arguments) -> str:
+    return "".join(block.text for block in call_tool(mcp, tool, arguments))
+
+
+def orders_shown(text: str) -> str:
+    if text.startswith("{"):
+        result = json.loads(text)
+        return str(len(result.get("orders") or result.get("rows")))
+    return str(text.count("Order ID:"))
+
+
+def run(order_counts, latency: float, repeat: int):
+    print(
+        f"{'orders':>7} {'case':<22} {'shown':>6} {'response KB':>12} "
+        f"{'~tokens':>9} {'best ms':>9}"
+    )
+    for count in order_counts:
+        fake = FakeOdoo(orders=count, partners=50, latency=latency)
+        with serve(fake) as url:
+            mcp, _server = build_server(url, ODOO_CACHE=0)
+            for case, options in CASES:
+                arguments = {"limits": count, **options}
+                text = response_text(mcp, "get_order_details", arguments)
+                size = len(text.encode())
+                elapsed = timed(call_tool, mcp, "get_order_details", arguments, repeat=repeat)
+                # About four bytes per token for English text and JSON
+                print(
+                    f"{count:>7} {case:<22} {orders_shown(text):>6} {size / 1024:>12.1f} "
+                    f"{size // 4:>9} {elapsed:>9.1f}"
+                )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--orders", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--latency", type=float, default=0.002, help="Injected seconds per call")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    run(args.orders, args.latency, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
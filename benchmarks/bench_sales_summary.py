@@ -0,0 +1,52 @@
+"""
+Totals per customer: server-side ``read_group`` versus pulling every order.
+
+Compares ``get_sales_summary`` with ``get_order_details`` over all orders,
+which the model would then have to sum itself.
+
+    python -m benchmarks.bench_sales_summary [--orders 100 1000 10000]
+"""
+
+import argparse
+
+from .common import build_server, call_tool, timed
+from .fake_odoo import FakeOdoo, serve
+
+
+def response_bytes(mcp, tool, arguments) -> int:
+    return sum(len(block.text.encode()) for block in call_tool(mcp, tool, arguments))
+
+
+def run(order_counts, latency: float, repeat: int):
+    print(
+        f"{'orders':>7} {'tool':<20} {'round trips':>12} {'response KB':>12} {'best ms':>9}"
+    )
+    for count in order_counts:
+        fake = FakeOdoo(orders=count, partners=50, latency=latency)
+        with serve(fake) as url:
+            # No response budget, to show the cost of pulling every order
+            mcp, _server = build_server(url, ODOO_CACHE=0, ODOO_MAX_RESPONSE_BYTES=10**9)
+            for tool, arguments in (
+                ("get_order_details", {"limits": count}),
+                ("get_sales_summary", {"group_by": ["partner"], "limit": 50}),
+            ):
+                fake.reset_calls()
+                size = response_bytes(mcp, tool, arguments)
+                round_trips = fake.round_trips
+                elapsed = timed(call_tool, mcp, tool, arguments, repeat=repeat)
+                print(
+                    f"{count:>7} {tool:<20} {round_trips:>12} {size / 1024:>12.1f} {elapsed:>9.1f}"
+                )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--orders", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--latency", type=float, default=0.002, help="Injected seconds per call")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    run(args.orders, args.latency, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
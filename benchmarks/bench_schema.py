@@ -0,0 +1,57 @@
+"""
+Schema cache: startup cost cold and warm, and rejected projections.
+
+Startup loads ``fields_get`` of every prefetched model on a cold cache, and
+only checks the two-call fingerprint once the schema file is on disk. A
+projection naming a missing field is then answered without a round trip,
+instead of a failing call to Odoo.
+
+    python -m benchmarks.bench_schema [--latency 0.05]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from .common import build_server, call_tool
+from .fake_odoo import FakeOdoo, serve
+
+BAD_PROJECTION = {"limits": 10, "fields": ["name", "list_prices"]}
+
+
+def run(latency: float):
+    print(f"{'case':<34} {'round trips':>12} {'ms':>9}  answer")
+    fake = FakeOdoo(latency=latency)
+    with serve(fake) as url, tempfile.TemporaryDirectory() as schema_dir:
+        for case, env in (
+            ("startup, cold schema cache", {"ODOO_SCHEMA_DIR": schema_dir}),
+            ("startup, warm schema cache", {"ODOO_SCHEMA_DIR": schema_dir}),
+        ):
+            fake.reset_calls()
+            start = time.perf_counter()
+            build_server(url, ODOO_CACHE=0, **env)
+            elapsed = (time.perf_counter() - start) * 1000
+            print(f"{case:<34} {fake.round_trips:>12} {elapsed:>9.1f}")
+        assert os.listdir(schema_dir)
+
+        for case, enabled in (("bad projection, no schema cache", 0), ("bad projection, schema cache", 1)):
+            mcp, _server = build_server(
+                url, ODOO_CACHE=0, ODOO_SCHEMA_CACHE=enabled, ODOO_SCHEMA_DIR=schema_dir
+            )
+            fake.reset_calls()
+            start = time.perf_counter()
+            answer = call_tool(mcp, "get_products", BAD_PROJECTION)[0].text
+            elapsed = (time.perf_counter() - start) * 1000
+            print(f"{case:<34} {fake.round_trips:>12} {elapsed:>9.1f}  {answer}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--latency", type=float, default=0.05, help="Injected seconds per call")
+    args = parser.parse_args()
+    run(args.latency)
+
+
+if __name__ == "__main__":
+    main()
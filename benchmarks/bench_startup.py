@@ -0,0 +1,212 @@
+"""
+Cold start of a stdio server: import time and time to the first tools/list.
+
+Every run starts ``python -m mcpserver`` the way an MCP client does for each
+session and measures, as medians over ``--runs``:
+
+- import time of ``mcpserver.__main__``: all of it, the part spent in the
+  ``mcp`` SDK and the part spent in this package's own modules;
+- time from process start to the ``initialize`` and ``tools/list``
+  responses, against an Odoo whose every call takes ``--latency`` seconds
+  and against one that never answers. Listing the tools must not wait for
+  Odoo, so both should be about the same;
+- how long the first tool call takes when it comes ``--pause`` seconds
+  after ``tools/list``, with the Odoo handshake started at startup
+  (``ODOO_CONNECT_ON_START=1``) and on first use. With the former, the
+  handshake is over by then and the call does not pay for it. These runs
+  turn the schema prefetch off, which authenticates in the background too;
+  the ``defaults`` run keeps every setting at its default, as a deployment
+  would.
+
+Anything the server writes to stdout that is not JSON-RPC, e.g. a log line
+from a background thread, breaks the client's session, so the run fails.
+
+With ``--budget-ms`` the exit status is 1 when the time to ``tools/list``
+exceeds it, so a startup regression fails CI.
+
+    python -m benchmarks.bench_startup [--runs 5] [--latency 1] [--pause 2] [--budget-ms 3000]
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+from .bench_outage import hung_server
+from .common import ROOT, fake_odoo_process, odoo_env
+
+IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s+)(\S+)")
+
+
+def server_env(url: str, **extra) -> dict:
+    """Environment of a server at ``url``; settings not in ``extra`` keep their defaults."""
+    base = {k: v for k, v in os.environ.items() if not k.startswith("ODOO_")}
+    return dict(base, **odoo_env(url, **extra), PYTHONPATH=str(ROOT / "src"))
+
+
+def import_times(env) -> dict:
+    """Milliseconds spent importing ``mcpserver.__main__``, by origin."""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import mcpserver.__main__"],
+        capture_output=True, text=True, check=True, cwd=ROOT, env=env,
+    ).stderr
+    total = sdk = own = 0
+    for line in stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, _indent, module = match.groups()
+        if module == "mcpserver.__main__":
+            total = int(cumulative_us)
+        if module == "mcp":
+            sdk = int(cumulative_us)
+        if module.split(".")[0] == "mcpserver":
+            own += int(self_us)
+    return {"total": total / 1000, "sdk": sdk / 1000, "own": own / 1000}
+
+
+def read_message(process, request_id):
+    """Read stdout until the JSON-RPC response to ``request_id``; other output is an error."""
+    while True:
+        line = process.stdout.readline()
+        if not line:
+            raise RuntimeError(f"Server exited: {process.stderr.read()}")
+        try:
+            message = json.loads(line)
+        except ValueError:
+            raise RuntimeError(f"Server wrote to stdout: {line!r}") from None
+        if isinstance(message, dict) and message.get("id") == request_id:
+            return message
+
+
+def send(process, message):
+    process.stdin.write(json.dumps(message) + "\n")
+    process.stdin.flush()
+
+
+def time_to_tools(env, pause=None) -> dict:
+    """
+    Seconds from process start to the initialize and tools/list responses,
+    and, unless ``pause`` is None, of a tool call made ``pause`` seconds later.
+    """
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "mcpserver"],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        text=True, cwd=ROOT, env=env,
+    )
+    try:
+        send(process, {
+            "jsonrpc": "2.0", "id": 1, "method": "initialize",
+            "params": {
+                "protocolVersion": "2025-06-18",
+                "capabilities": {},
+                "clientInfo": {"name": "bench_startup", "version": "1"},
+            },
+        })
+        read_message(process, 1)
+        initialized = time.perf_counter() - start
+        send(process, {"jsonrpc": "2.0", "method": "notifications/initialized"})
+        send(process, {"jsonrpc": "2.0", "id": 2, "method": "tools/list"})
+        tools = read_message(process, 2)["result"]["tools"]
+        listed = time.perf_counter() - start
+        first_call = None
+        if pause is not None:
+            time.sleep(pause)
+            call_start = time.perf_counter()
+            send(process, {
+                "jsonrpc": "2.0", "id": 3, "method": "tools/call",
+                "params": {"name": "get_product_details", "arguments": {"product_name": "Product 1"}},
+            })
+            result = read_message(process, 3)
+            if "error" in result or result["result"].get("isError"):
+                raise RuntimeError(f"Tool call failed: {result}")
+            first_call = time.perf_counter() - call_start
+    finally:
+        process.kill()
+        process.wait()
+    return {
+        "initialize": initialized,
+        "tools_list": listed,
+        "first_call": first_call,
+        "tools": len(tools),
+    }
+
+
+def median_of(runs, fn, *args) -> dict:
+    results = [fn(*args) for _ in range(runs)]
+    return {
+        key: None if results[0][key] is None else statistics.median(r[key] for r in results)
+        for key in results[0]
+    }
+
+
+def ms(seconds) -> str:
+    return "-" if seconds is None else f"{seconds * 1000:.0f}"
+
+
+def run(runs, latency, pause, budget_ms) -> bool:
+    python = median_of(runs, _python_startup)
+    print(f"python startup: {python['seconds'] * 1000:.0f} ms")
+
+    results = {}
+    with fake_odoo_process(latency=latency) as url:
+        imports = median_of(runs, import_times, server_env(url))
+        print(
+            f"import mcpserver.__main__: {imports['total']:.0f} ms "
+            f"(mcp SDK {imports['sdk']:.0f} ms, this package {imports['own']:.0f} ms)"
+        )
+        for name, connect_on_start in (("on start", 1), ("first use", 0)):
+            env = server_env(url, ODOO_SCHEMA_CACHE=0, ODOO_CONNECT_ON_START=connect_on_start)
+            results[f"{latency:g}s, {name}"] = median_of(runs, time_to_tools, env, pause)
+        results[f"{latency:g}s, defaults"] = median_of(runs, time_to_tools, server_env(url), pause)
+
+    with hung_server() as url:
+        env = server_env(url, ODOO_SCHEMA_CACHE=0)
+        results["not answering"] = median_of(runs, time_to_tools, env)
+        results["not answering, defaults"] = median_of(runs, time_to_tools, server_env(url))
+
+    print(
+        f"{'odoo, connect':>24} {'initialize ms':>14} {'tools/list ms':>14} "
+        f"{'first call ms':>14} {'tools':>6}"
+    )
+    for name, result in results.items():
+        print(
+            f"{name:>24} {ms(result['initialize']):>14} {ms(result['tools_list']):>14} "
+            f"{ms(result['first_call']):>14} {result['tools']:>6.0f}"
+        )
+
+    worst = max(result["tools_list"] for result in results.values()) * 1000
+    if budget_ms is not None and worst > budget_ms:
+        print(f"FAIL: tools/list took {worst:.0f} ms, over the {budget_ms:.0f} ms budget")
+        return False
+    return True
+
+
+def _python_startup() -> dict:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", "pass"], check=True)
+    return {"seconds": time.perf_counter() - start}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=1, help="Injected seconds per Odoo call")
+    parser.add_argument(
+        "--pause", type=float, default=2, help="Seconds between tools/list and the first call"
+    )
+    parser.add_argument("--budget-ms", type=float, help="Fail when tools/list takes longer")
+    args = parser.parse_args()
+    if not run(args.runs, args.latency, args.pause, args.budget_ms):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Converting Odoo UTC timestamps to local time: per-call pytz + strptime (the
+old ``_format_datetime``) versus the cached ``zoneinfo`` service, one at a
+time and batched. pytz is no longer a dependency; without it the baseline is
+the same per-call conversion with ``zoneinfo``.
+
+    python -m benchmarks.bench_timezones [--count 100000] [--zone Europe/Berlin]
+"""
+
+import argparse
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+from mcpserver.timezones import TimezoneService
+
+try:
+    import pytz
+except ImportError:
+    pytz = None
+
+
+def per_call(values, zone_name):
+    results = []
+    for value in values:
+        utc_time = datetime.strptime(value, "%Y-%m-%d %H:%M:%S")
+        if pytz is not None:
+            local = utc_time.replace(tzinfo=pytz.utc).astimezone(pytz.timezone(zone_name))
+        else:
+            local = utc_time.replace(tzinfo=timezone.utc).astimezone(ZoneInfo(zone_name))
+        results.append(local.strftime("%Y-%m-%d %H:%M:%S"))
+    return results
+
+
+def synthetic_timestamps(count, rng):
+    start = datetime(2024, 1, 1)
+    # Two years of orders, so DST changes are included
+    return [
+        (start + timedelta(seconds=rng.randrange(2 * 365 * 86400))).strftime("%Y-%m-%d %H:%M:%S")
+        for _ in range(count)
+    ]
+
+
+def best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def run(count, zone_name, repeat):
+    values = synthetic_timestamps(count, random.Random(0))
+    service = TimezoneService(zone_name)
+
+    baseline, expected = best_of(lambda: per_call(values, zone_name), repeat)
+    single, single_result = best_of(lambda: [service.format(v) for v in values], repeat)
+    batch, batch_result = best_of(lambda: service.format_many(values), repeat)
+    assert single_result == expected and batch_result == expected
+
+    print(f"{count} timestamps, {zone_name}")
+    print(f"{'method':<28} {'ms':>9} {'speedup':>8}")
+    for label, seconds in (
+        (f"{'pytz' if pytz else 'zoneinfo'} + strptime per call", baseline),
+        ("zoneinfo service, per call", single),
+        ("zoneinfo service, batch", batch),
+    ):
+        print(f"{label:<28} {seconds * 1000:>9.1f} {baseline / seconds:>7.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=100000)
+    parser.add_argument("--zone", default="Europe/Berlin")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    run(args.count, args.zone, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
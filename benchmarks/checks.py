@@ -0,0 +1,197 @@
+"""
+Behaviour checks of the bulk tools against the fake Odoo: what a client gets
+back and what ends up in Odoo when part of a batch is rejected, when a write
+times out, when an export fails, and when records are read back after a write
+or an export.
+
+Each check builds its own server and fake Odoo. The exit status is 1 if any
+check fails.
+
+    python -m benchmarks.checks [--checks bulk_create_partial bulk_write_read_back ...]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import sys
+import tempfile
+import traceback
+import xmlrpc.client
+from contextlib import contextmanager
+
+from .common import build_server, call_tool
+from .fake_odoo import FakeOdoo, serve
+
+
+@contextmanager
+def server(fake: FakeOdoo, **env):
+    """A server for ``fake`` with the ``ODOO_*`` settings ``env``; the environment is restored after."""
+    saved = dict(os.environ)
+    export_dir = tempfile.mkdtemp(prefix="checks-exports-")
+    try:
+        with serve(fake) as url:
+            mcp, odoo_server = build_server(url, **{"ODOO_EXPORT_DIR": export_dir, **env})
+            try:
+                yield mcp
+            finally:
+                odoo_server.close()
+    finally:
+        os.environ.clear()
+        os.environ.update(saved)
+        shutil.rmtree(export_dir, ignore_errors=True)
+
+
+def result(mcp, tool: str, arguments: dict):
+    """The tool's result as a client reads it, parsed if it is JSON."""
+    content = call_tool(mcp, tool, arguments)
+    if isinstance(content, tuple):
+        content = content[0]
+    text = content[-1].text
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+def read_resource(mcp, uri: str) -> str:
+    return list(asyncio.run(mcp.read_resource(uri)))[0].content
+
+
+def check_bulk_create_partial():
+    """A record Odoo rejects fails alone; the others are created once."""
+    fake = FakeOdoo(partners=5)
+    records = [{"name": f"Bulk {i}"} for i in range(6)]
+    records[3] = {"name": "", "email": "nameless@example.com"}
+    with server(fake) as mcp:
+        created = result(mcp, "bulk_create", {"model": "res.partner", "records": records})
+    assert created["created"] == 5, created
+    assert [error["index"] for error in created["errors"]] == [3], created
+    assert "required" in created["errors"][0]["message"], created
+    assert created["ids"][3] is None and None not in created["ids"][:3] + created["ids"][4:], created
+    names = [row["name"] for row in fake._records["res.partner"].values()]
+    assert sorted(n for n in names if n.startswith("Bulk")) == [f"Bulk {i}" for i in range(6) if i != 3]
+
+
+def check_bulk_create_timeout():
+    """A create that times out is not sent again, and its records are reported as maybe applied."""
+    fake = FakeOdoo(partners=5)
+    fake.write_latency = 1.0
+    records = [{"name": f"Slow {i}"} for i in range(4)]
+    with server(fake, ODOO_TIMEOUT=0.3) as mcp:
+        created = result(
+            mcp, "bulk_create", {"model": "res.partner", "records": records, "chunk_size": 2}
+        )
+    assert created["created"] == 0 and len(created["errors"]) == 4, created
+    assert all("may have been applied" in e["message"] for e in created["errors"][:2]), created
+    assert all("Not sent" in e["message"] for e in created["errors"][2:]), created
+    assert fake.calls[("res.partner", "create")] == 1, fake.calls
+
+
+def check_bulk_write_partial():
+    """An update of a missing record fails alone; the others are written."""
+    fake = FakeOdoo(products=10)
+    updates = [{"id": record_id, "list_price": 5.0} for record_id in (1, 2, 999, 3)]
+    with server(fake) as mcp:
+        written = result(mcp, "bulk_write", {"model": "product.product", "updates": updates})
+    assert written["updated"] == 3, written
+    assert [error["index"] for error in written["errors"]] == [2], written
+    assert all(fake._records["product.product"][i]["list_price"] == 5.0 for i in (1, 2, 3))
+
+
+def check_bulk_write_read_back():
+    """Reads right after a write see it, whether served by the cache, the replica or Odoo."""
+    fake = FakeOdoo(products=10, latency=0.05)
+    with server(fake, ODOO_SYNC=1, ODOO_SYNC_MODELS="product.product") as mcp:
+        before = result(mcp, "get_products", {"limits": 2})
+        assert before["products"][0]["list_price"] != 1.0, before
+        written = result(
+            mcp,
+            "bulk_write",
+            {"model": "product.product", "updates": [{"id": 1, "list_price": 1.0}]},
+        )
+        assert written["success"], written
+        after = result(mcp, "get_products", {"limits": 2})
+        details = result(mcp, "get_product_details", {"product_name": "Product 1"})
+    assert after["products"][0]["list_price"] == 1.0, after
+    assert "1.0" in details, details
+
+
+def check_export_read_back():
+    """An export holds every record with its related fields, and its pages add up to the file."""
+    fake = FakeOdoo(products=250)
+    with server(fake) as mcp:
+        exported = result(
+            mcp,
+            "export_records",
+            {"model": "product.product", "filename": "products.ndjson", "chunk_size": 40},
+        )
+        with open(exported["path"], encoding="utf-8") as f:
+            content = f.read()
+        pages = "".join(
+            read_resource(mcp, f"{exported['resource']}/{page}") for page in range(exported["pages"])
+        )
+    rows = [json.loads(line) for line in content.splitlines()]
+    assert exported["records"] == len(rows) == 250, exported
+    assert [row["id"] for row in rows] == sorted(fake._records["product.product"]), "ids out of order"
+    assert all(row["name"] and "list_price" in row for row in rows), rows[0]
+    assert pages == content, "pages differ from the file"
+
+
+def check_export_failure():
+    """A failed export reports Odoo's error and leaves no partial file, even one already gone."""
+    fake = FakeOdoo(products=250)
+    export_dir = tempfile.mkdtemp(prefix="checks-exports-")
+    execute = fake._execute
+
+    def fail_mid_export(model, method, args, kwargs):
+        if method == "search_read":
+            # As if the partial file had been cleaned up before the error
+            for name in os.listdir(export_dir):
+                os.remove(os.path.join(export_dir, name))
+            raise xmlrpc.client.Fault(2, "Record rules forbid reading product.product")
+        return execute(model, method, args, kwargs)
+
+    fake._execute = fail_mid_export
+    try:
+        with server(fake, ODOO_EXPORT_DIR=export_dir) as mcp:
+            exported = result(
+                mcp, "export_records", {"model": "product.product", "filename": "products.ndjson"}
+            )
+        assert exported.startswith("Export of product.product failed:"), exported
+        assert "Record rules forbid" in exported, exported
+        assert os.listdir(export_dir) == [], os.listdir(export_dir)
+    finally:
+        shutil.rmtree(export_dir, ignore_errors=True)
+
+
+CHECKS = {
+    name[len("check_"):]: fn for name, fn in globals().items() if name.startswith("check_")
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--checks", nargs="+", choices=list(CHECKS), default=list(CHECKS))
+    args = parser.parse_args()
+
+    failed = 0
+    for name in args.checks:
+        try:
+            CHECKS[name]()
+        except Exception:
+            failed += 1
+            print(f"FAIL {name}")
+            traceback.print_exc()
+        else:
+            print(f"ok   {name}")
+    if failed:
+        print(f"{failed} of {len(args.checks)} checks failed")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
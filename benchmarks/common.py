@@ -0,0 +1,88 @@
+"""
+Shared helpers for wiring the real MCP server to a fake Odoo instance.
+"""
+
+import asyncio
+import io
+import os
+import subprocess
+import sys
+import time
+from contextlib import contextmanager, redirect_stderr
+from pathlib import Path
+
+from mcp.server.fastmcp import FastMCP
+
+from .fake_odoo import FAKE_DATABASE, FAKE_PASSWORD, FAKE_USERNAME
+
+ROOT = Path(__file__).resolve().parents[1]
+
+SCHEMA_WAIT_SECONDS = 5
+
+
+def odoo_env(url: str, **extra) -> dict:
+    """Set the ``ODOO_*`` environment variables for ``url``; returns them."""
+    env = {
+        "ODOO_URL": url,
+        "ODOO_DATABASE": FAKE_DATABASE,
+        "ODOO_USERNAME": FAKE_USERNAME,
+        "ODOO_PASSWORD": FAKE_PASSWORD,
+        **{k: str(v) for k, v in extra.items()},
+    }
+    os.environ.update(env)
+    return env
+
+
+def build_server(url: str, **extra):
+    """
+    Build an initialized ``OdooMCPServer`` pointing at ``url``.
+
+    Returns the ``FastMCP`` instance the tools were registered on together
+    with the server itself.
+    """
+    from mcpserver.config import OdooConfig
+    from mcpserver.odoo_mcp_server import OdooMCPServer
+
+    odoo_env(url, **extra)
+    mcp = FastMCP("Odoo MCP Benchmark")
+    server = OdooMCPServer(mcp, OdooConfig())
+    with redirect_stderr(io.StringIO()):
+        server.initialize_server()
+        # Keep the startup schema prefetch out of the measured round trips
+        for schema in server.tools.schemas.values():
+            schema.loaded.wait(SCHEMA_WAIT_SECONDS)
+    return mcp, server
+
+
+def call_tool(mcp: FastMCP, name: str, arguments: dict):
+    """Invoke a registered tool the same way an MCP client would."""
+    return asyncio.run(mcp.call_tool(name, arguments))
+
+
+def timed(fn, *args, repeat: int = 5, **kwargs) -> float:
+    """Return the best wall-clock time of ``repeat`` calls, in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+@contextmanager
+def fake_odoo_process(**options):
+    """
+    Run ``benchmarks.fake_odoo`` in a child process; yields its base URL.
+
+    Keeps the fake dataset out of the measuring process, e.g. for memory
+    benchmarks.
+    """
+    args = [sys.executable, "-m", "benchmarks.fake_odoo"]
+    for name, value in options.items():
+        args += [f"--{name.replace('_', '-')}", str(value)]
+    process = subprocess.Popen(args, stdout=subprocess.PIPE, text=True, cwd=ROOT)
+    try:
+        yield process.stdout.readline().strip()
+    finally:
+        process.terminate()
+        process.wait()
@@ -0,0 +1,720 @@
+"""
+In-process stand-in for an Odoo server.
+
+Serves ``/xmlrpc/2/common``, ``/xmlrpc/2/object`` and ``/jsonrpc`` over
+HTTP/1.1 from an in-memory synthetic dataset, counts every ``execute_kw`` round trip and can
+inject a fixed latency per call to mimic a remote instance, and a further
+delay per ``create`` and ``write`` to make writes time out. The counters are
+also served on ``/fake`` for benchmarks running in another process.
+"""
+
+import gzip
+import json
+import random
+import socketserver
+import threading
+import time
+import xmlrpc.client
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from xmlrpc.server import (
+    MultiPathXMLRPCServer,
+    SimpleXMLRPCDispatcher,
+    SimpleXMLRPCRequestHandler,
+)
+
+FAKE_DATABASE = "fake"
+FAKE_USERNAME = "admin"
+FAKE_PASSWORD = "admin"
+FAKE_UID = 2
+ACCESS_DENIED = 3
+
+# Benchmark-only endpoint exposing the call counters
+CONTROL_PATH = "/fake"
+
+# model -> {field: comodel}
+MANY2ONE = {
+    "product.product": {"currency_id": "res.currency"},
+    "sale.order": {"partner_id": "res.partner", "currency_id": "res.currency"},
+    "sale.order.line": {"order_id": "sale.order", "product_id": "product.product"},
+    "account.move": {"partner_id": "res.partner", "currency_id": "res.currency"},
+    "account.move.line": {"move_id": "account.move", "product_id": "product.product"},
+    "account.payment": {"journal_id": "account.journal", "move_id": "account.move"},
+    "account.payment.register": {"journal_id": "account.journal"},
+    "sale.report": {"partner_id": "res.partner", "product_id": "product.product"},
+}
+
+DATE_GROUP_FORMATS = {
+    "day": "%d %b %Y",
+    "week": "W%V %G",
+    "month": "%B %Y",
+    "year": "%Y",
+}
+
+# model -> {field: (comodel, inverse field)}
+ONE2MANY = {
+    "sale.order": {"order_line": ("sale.order.line", "order_id")},
+    "account.move": {"invoice_line_ids": ("account.move.line", "move_id")},
+}
+
+_COMMON_FIELDS = {
+    "active": ("boolean", True),
+    "write_date": ("datetime", True),
+    "create_date": ("datetime", True),
+    "display_name": ("char", False),
+}
+
+# model -> {field: (type, stored)}; reading any other field of these models fails
+FIELDS = {
+    "product.product": {
+        **_COMMON_FIELDS,
+        # Inherited from product.template, so not stored on product.product
+        "name": ("char", False),
+        "list_price": ("float", False),
+        "description_sale": ("text", False),
+        "default_code": ("char", True),
+        "barcode": ("char", True),
+        "currency_id": ("many2one", False),
+        "image_1920": ("binary", True),
+        "qty_available": ("float", False),
+    },
+    "res.partner": {
+        **_COMMON_FIELDS,
+        "name": ("char", True),
+        "email": ("char", True),
+        "phone": ("char", True),
+    },
+    "sale.order": {
+        **_COMMON_FIELDS,
+        "name": ("char", True),
+        "date_order": ("datetime", True),
+        "state": ("selection", True),
+        "partner_id": ("many2one", True),
+        "order_line": ("one2many", True),
+        "amount_total": ("monetary", True),
+        "currency_id": ("many2one", True),
+        "note": ("html", True),
+        "access_url": ("char", False),
+    },
+    "sale.order.line": {
+        **_COMMON_FIELDS,
+        "order_id": ("many2one", True),
+        "product_id": ("many2one", True),
+        "name": ("text", True),
+        "price_unit": ("float", True),
+        "product_uom_qty": ("float", True),
+        "price_subtotal": ("monetary", True),
+    },
+}
+
+# model -> fields a create must give a value, or Odoo rejects the call
+REQUIRED_FIELDS = {"res.partner": ("name",)}
+
+# model -> {field: path}; related fields, which Odoo reports as not stored
+RELATED = {
+    "product.product": {
+        name: f"product_tmpl_id.{name}"
+        for name in ("name", "list_price", "description_sale", "currency_id")
+    },
+}
+
+INSTALLED_MODULES = {"base": "17.0.1.3", "product": "17.0.1.2", "sale": "17.0.1.2", "account": "17.0.1.2"}
+
+
+class FakeOdoo:
+    """
+    Synthetic Odoo database answering the ``execute_kw`` calls the tools make.
+    """
+
+    def __init__(
+        self,
+        products: int = 100,
+        partners: int = 50,
+        orders: int = 20,
+        lines_per_order: int = 3,
+        latency: float = 0.0,
+        seed: int = 0,
+        user_tz: str = "Asia/Riyadh",
+        capacity: int = None,
+    ):
+        self.latency = latency
+        # Extra seconds taken by create and write calls, still applied after a client gave up
+        self.write_latency = 0.0
+        # Like Odoo's worker processes: calls beyond ``capacity`` wait for a free one
+        self._workers = threading.BoundedSemaphore(capacity) if capacity else None
+        self.user_tz = user_tz
+        self.uid = FAKE_UID
+        self.calls = Counter()
+        self._lock = threading.RLock()
+        self._records = defaultdict(dict)
+        self._next_id = defaultdict(lambda: 1)
+        self._populate(products, partners, orders, lines_per_order, random.Random(seed))
+
+    # ------------------------------------------------------------------
+    # Dataset
+    # ------------------------------------------------------------------
+
+    def _populate(self, products, partners, orders, lines_per_order, rng):
+        for name, version in INSTALLED_MODULES.items():
+            self._insert("ir.module.module", {"name": name, "latest_version": version, "state": "installed"})
+        self._insert("res.currency", {"name": "SAR"})
+        for name in ("Bank", "Cash"):
+            self._insert(
+                "account.journal",
+                {
+                    "name": name,
+                    "type": name.lower(),
+                    "inbound_payment_method_line_ids": [1],
+                    "outbound_payment_method_line_ids": [2],
+                },
+            )
+        for i in range(1, partners + 1):
+            self._insert("res.partner", {"name": f"Customer {i}", "email": f"customer{i}@example.com"})
+        for i in range(1, products + 1):
+            self._insert(
+                "product.product",
+                {
+                    "name": f"Product {i}",
+                    "list_price": round(rng.uniform(1, 500), 2),
+                    "description_sale": f"Synthetic product number {i}",
+                    "currency_id": 1,
+                },
+            )
+
+        start = datetime(2025, 1, 1)
+        for i in range(1, orders + 1):
+            lines = []
+            for _ in range(lines_per_order):
+                product_id = rng.randint(1, max(products, 1))
+                lines.append(
+                    (0, 0, {"product_id": product_id, "product_uom_qty": rng.randint(1, 5)})
+                )
+            self._create(
+                "sale.order",
+                {
+                    "name": f"S{i:05d}",
+                    "partner_id": rng.randint(1, max(partners, 1)),
+                    "date_order": (start + timedelta(hours=i)).strftime("%Y-%m-%d %H:%M:%S"),
+                    "state": "sale",
+                    "order_line": lines,
+                },
+            )
+
+    def _insert(self, model, vals):
+        record_id = self._next_id[model]
+        self._next_id[model] += 1
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        record = {"id": record_id, "active": True, "write_date": now, "create_date": now}
+        record.update(vals)
+        self._records[model][record_id] = record
+        return record_id
+
+    def _create(self, model, vals):
+        vals = dict(vals)
+        commands = {}
+        for field in ONE2MANY.get(model, {}):
+            commands[field] = vals.pop(field, [])
+
+        if model == "sale.order":
+            vals.setdefault("name", f"S{self._next_id[model]:05d}")
+            vals.setdefault("state", "draft")
+            vals.setdefault("currency_id", 1)
+            vals.setdefault("date_order", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+        elif model == "account.move":
+            vals.setdefault("name", f"INV/{self._next_id[model]:05d}")
+            vals.setdefault("state", "draft")
+            vals.setdefault("currency_id", 1)
+        elif model in ("sale.order.line", "account.move.line"):
+            product = self._records["product.product"].get(vals.get("product_id"), {})
+            vals.setdefault("name", product.get("name", ""))
+            vals.setdefault("price_unit", product.get("list_price", 0.0))
+            qty_field = "product_uom_qty" if model == "sale.order.line" else "quantity"
+            vals.setdefault(qty_field, 1)
+            vals["price_subtotal"] = round(vals["price_unit"] * vals[qty_field], 2)
+
+        record_id = self._insert(model, vals)
+
+        # Keep one2many fields in sync with their inverse many2one
+        for parent_field, comodel in MANY2ONE.get(model, {}).items():
+            for o2m_field, (child_model, inverse) in ONE2MANY.get(comodel, {}).items():
+                if child_model == model and inverse == parent_field and vals.get(parent_field):
+                    parent = self._records[comodel][vals[parent_field]]
+                    parent.setdefault(o2m_field, []).append(record_id)
+
+        record = self._records[model][record_id]
+        for field, (child_model, inverse) in ONE2MANY.get(model, {}).items():
+            record.setdefault(field, [])
+            for command in commands[field]:
+                if command[0] == 0:
+                    self._create(child_model, {**command[2], inverse: record_id})
+
+        self._recompute(model, record)
+        return record_id
+
+    def _recompute(self, model, record):
+        if model in ONE2MANY:
+            field, (child_model, _inverse) = next(iter(ONE2MANY[model].items()))
+            children = self._records[child_model]
+            record["amount_total"] = round(
+                sum(children[i]["price_subtotal"] for i in record.get(field, [])), 2
+            )
+        elif model in ("sale.order.line", "account.move.line"):
+            parent_model, parent_field = (
+                ("sale.order", "order_id") if model == "sale.order.line" else ("account.move", "move_id")
+            )
+            parent = self._records[parent_model].get(record.get(parent_field))
+            if parent is not None:
+                self._recompute(parent_model, parent)
+
+    # ------------------------------------------------------------------
+    # Domain evaluation and projection
+    # ------------------------------------------------------------------
+
+    def _match(self, model, record, domain):
+        stack = []
+        for term in reversed(domain):
+            if term in ("&", "|"):
+                first, second = stack.pop(), stack.pop()
+                stack.append(first and second if term == "&" else first or second)
+            elif term == "!":
+                stack.append(not stack.pop())
+            else:
+                stack.append(self._match_leaf(model, record, term))
+        return all(stack)
+
+    def _match_leaf(self, model, record, leaf):
+        field, operator, value = leaf
+        field = field.split(".")[0]
+        current = record.get(field, False)
+        if isinstance(current, list) and operator not in ("in", "not in"):
+            current = current[0] if current else False
+        match operator:
+            case "=":
+                return current == value
+            case "!=":
+                return current != value
+            case "in":
+                if isinstance(current, list):
+                    return bool(set(current) & set(value))
+                return current in value
+            case "not in":
+                return current not in value
+            case "ilike":
+                return str(value).lower() in str(current).lower()
+            case "like":
+                return str(value) in str(current)
+            case ">":
+                return current is not False and current > value
+            case ">=":
+                return current is not False and current >= value
+            case "<":
+                return current is not False and current < value
+            case "<=":
+                return current is not False and current <= value
+        raise ValueError(f"Unsupported domain operator: {operator}")
+
+    def _read_record(self, model, record, fields):
+        many2one = MANY2ONE.get(model, {})
+        names = fields or [f for f in record]
+        known = FIELDS.get(model)
+        if known is not None and fields:
+            unknown = [f for f in names if f != "id" and f not in known]
+            if unknown:
+                raise ValueError(f"Invalid field {unknown[0]!r} on model {model!r}")
+        result = {"id": record["id"]}
+        for field in names:
+            value = record.get(field, False)
+            if field in many2one and value:
+                comodel_record = self._records[many2one[field]].get(value, {})
+                value = [value, comodel_record.get("name", "")]
+            elif isinstance(value, list):
+                value = list(value)
+            result[field] = value
+        return result
+
+    def _candidates(self, model, domain):
+        """Records of ``model``, narrowed to the id range of top-level ``id`` leaves."""
+        table = self._records[model]
+        low, high = None, None
+        if "|" not in domain and "!" not in domain:
+            for leaf in domain:
+                if isinstance(leaf, (list, tuple)) and len(leaf) == 3 and leaf[0] == "id":
+                    if leaf[1] in (">=", ">"):
+                        bound = leaf[2] + (leaf[1] == ">")
+                        low = bound if low is None else max(low, bound)
+                    elif leaf[1] in ("<", "<="):
+                        bound = leaf[2] + (leaf[1] == "<=")
+                        high = bound if high is None else min(high, bound)
+        if low is None and high is None:
+            return table.values()
+        # Ids are handed out in increasing order
+        low = max(low or 1, 1)
+        high = self._next_id[model] if high is None else min(high, self._next_id[model])
+        return [table[i] for i in range(low, high) if i in table]
+
+    def _search(self, model, domain, offset=0, limit=None, order=None):
+        records = [r for r in self._candidates(model, domain) if self._match(model, r, domain)]
+        if order:
+            for part in reversed(order.split(",")):
+                field, _, direction = part.strip().partition(" ")
+                records.sort(
+                    key=lambda r: (r.get(field) is False, r.get(field)),
+                    reverse=direction.strip().lower() == "desc",
+                )
+        records = records[offset or 0 :]
+        if limit:
+            records = records[:limit]
+        return records
+
+    # ------------------------------------------------------------------
+    # XML-RPC endpoints
+    # ------------------------------------------------------------------
+
+    @property
+    def round_trips(self) -> int:
+        return sum(n for (model, _method), n in self.calls.items() if model != "common")
+
+    def rotate_uid(self):
+        """Invalidate the uid handed out so far, as a password reset would."""
+        self.uid += 1
+
+    def reset_calls(self):
+        self.calls.clear()
+
+    def version(self):
+        return {"server_version": "17.0", "server_serie": "17.0", "protocol_version": 1}
+
+    def authenticate(self, db, login, password, user_agent_env):
+        self.calls[("common", "authenticate")] += 1
+        if self.latency:
+            time.sleep(self.latency)
+        if (db, login, password) == (FAKE_DATABASE, FAKE_USERNAME, FAKE_PASSWORD):
+            return self.uid
+        return False
+
+    def execute_kw(self, db, uid, password, model, method, args, kwargs=None):
+        kwargs = kwargs or {}
+        with self._lock:
+            self.calls[(model, method)] += 1
+        if (uid, password) != (self.uid, FAKE_PASSWORD):
+            raise xmlrpc.client.Fault(ACCESS_DENIED, "Access Denied")
+        if self._workers is None:
+            return self._execute(model, method, args, kwargs)
+        with self._workers:
+            return self._execute(model, method, args, kwargs)
+
+    def _execute(self, model, method, args, kwargs):
+        if self.latency:
+            time.sleep(self.latency)
+        if self.write_latency and method in ("create", "write"):
+            time.sleep(self.write_latency)
+        with self._lock:
+            handler = getattr(self, f"_method_{method}", None)
+            if handler is None:
+                raise ValueError(f"Method {method} is not supported on {model}")
+            return handler(model, list(args), kwargs)
+
+    @staticmethod
+    def _ids(value):
+        return [value] if isinstance(value, int) else list(value)
+
+    def _method_search_read(self, model, args, kwargs):
+        domain = args[0] if args else kwargs.get("domain", [])
+        fields = args[1] if len(args) > 1 else kwargs.get("fields")
+        records = self._search(
+            model, domain, kwargs.get("offset", 0), kwargs.get("limit"), kwargs.get("order")
+        )
+        return [self._read_record(model, r, fields) for r in records]
+
+    def _method_search(self, model, args, kwargs):
+        domain = args[0] if args else kwargs.get("domain", [])
+        records = self._search(
+            model, domain, kwargs.get("offset", 0), kwargs.get("limit"), kwargs.get("order")
+        )
+        return [r["id"] for r in records]
+
+    def _method_search_count(self, model, args, kwargs):
+        domain = args[0] if args else kwargs.get("domain", [])
+        return len(self._search(model, domain))
+
+    def _method_read(self, model, args, kwargs):
+        fields = args[1] if len(args) > 1 else kwargs.get("fields")
+        table = self._records[model]
+        return [self._read_record(model, table[i], fields) for i in self._ids(args[0]) if i in table]
+
+    def _report_rows(self):
+        """``sale.report``: one row per order line, joined with its order."""
+        orders = self._records["sale.order"]
+        for line in self._records["sale.order.line"].values():
+            order = orders.get(line.get("order_id"), {})
+            yield {
+                "id": line["id"],
+                "date": order.get("date_order", False),
+                "partner_id": order.get("partner_id", False),
+                "user_id": False,
+                "state": order.get("state", False),
+                "product_id": line.get("product_id", False),
+                "product_uom_qty": line.get("product_uom_qty", 0),
+                "qty_delivered": 0,
+                "qty_invoiced": 0,
+                "price_subtotal": line.get("price_subtotal", 0.0),
+                "price_total": line.get("price_subtotal", 0.0),
+            }
+
+    @staticmethod
+    def _date_group(value, granularity):
+        if not value:
+            return False
+        date = datetime.strptime(value[:10], "%Y-%m-%d")
+        if granularity == "quarter":
+            return f"Q{(date.month - 1) // 3 + 1} {date.year}"
+        return date.strftime(DATE_GROUP_FORMATS[granularity])
+
+    def _method_read_group(self, model, args, kwargs):
+        domain = args[0] if args else kwargs.get("domain", [])
+        fields = args[1] if len(args) > 1 else kwargs.get("fields", [])
+        groupby = args[2] if len(args) > 2 else kwargs.get("groupby", [])
+        groupby = [groupby] if isinstance(groupby, str) else list(groupby)
+        if kwargs.get("lazy", True):
+            groupby = groupby[:1]
+
+        rows = self._report_rows() if model == "sale.report" else self._records[model].values()
+        measures = [spec.split(":")[0] for spec in fields if spec.split(":")[0] not in groupby]
+        many2one = MANY2ONE.get(model, {})
+
+        groups = {}
+        for row in rows:
+            if not self._match(model, row, domain):
+                continue
+            key = []
+            for spec in groupby:
+                field, _, granularity = spec.partition(":")
+                value = row.get(field, False)
+                key.append(self._date_group(value, granularity or "month") if field == "date" else value)
+            key = tuple(key)
+            group = groups.get(key)
+            if group is None:
+                group = groups[key] = {"__count": 0, **{m: 0 for m in measures}}
+                for spec, value in zip(groupby, key):
+                    field = spec.partition(":")[0]
+                    if field in many2one and value:
+                        value = [value, self._records[many2one[field]].get(value, {}).get("name", "")]
+                    group[spec] = value
+                group["__domain"] = list(domain)
+            group["__count"] += 1
+            for measure in measures:
+                group[measure] += row.get(measure) or 0
+
+        result = list(groups.values())
+        for part in reversed((kwargs.get("orderby") or "").split(",")):
+            field, _, direction = part.strip().partition(" ")
+            if field:
+                result.sort(
+                    key=lambda g: (g.get(field) is False, g.get(field)),
+                    reverse=direction.strip().lower() == "desc",
+                )
+        result = result[kwargs.get("offset") or 0 :]
+        if kwargs.get("limit"):
+            result = result[: kwargs["limit"]]
+        return result
+
+    def _method_fields_get(self, model, args, kwargs):
+        attributes = kwargs.get("attributes") or ["type", "string", "store", "relation", "related"]
+        fields = {"id": ("integer", True), **FIELDS.get(model, {})}
+        result = {}
+        for name, (field_type, stored) in fields.items():
+            description = {
+                "type": field_type,
+                "string": name.replace("_", " ").title(),
+                "store": stored,
+                "relation": MANY2ONE.get(model, {}).get(name) or ONE2MANY.get(model, {}).get(name, ("",))[0],
+            }
+            if name in RELATED.get(model, {}):
+                description["related"] = RELATED[model][name]
+            result[name] = {key: value for key, value in description.items() if key in attributes}
+        return result
+
+    def _method_context_get(self, model, args, kwargs):
+        return {"lang": "en_US", "tz": self.user_tz, "uid": self.uid}
+
+    def _check_values(self, model, vals_list):
+        """Reject the whole call, as Odoo's transaction would, if any field is unknown."""
+        known = FIELDS.get(model)
+        if known is None:
+            return
+        for vals in vals_list:
+            unknown = [f for f in vals if f not in known]
+            if unknown:
+                raise ValueError(f"Invalid field {unknown[0]!r} on model {model!r}")
+
+    def _check_required(self, model, vals_list):
+        """Reject the whole call, like a failed constraint, if a required value is missing."""
+        for vals in vals_list:
+            for field in REQUIRED_FIELDS.get(model, ()):
+                if not vals.get(field):
+                    raise ValueError(f"The field {field!r} of {model!r} is required")
+
+    def _method_create(self, model, args, kwargs):
+        vals = args[0]
+        self._check_values(model, vals if isinstance(vals, list) else [vals])
+        self._check_required(model, vals if isinstance(vals, list) else [vals])
+        if isinstance(vals, list):
+            return [self._create_with_context(model, v, kwargs) for v in vals]
+        return self._create_with_context(model, vals, kwargs)
+
+    def _create_with_context(self, model, vals, kwargs):
+        if model == "account.payment.register":
+            context = kwargs.get("context", {})
+            vals = {**vals, "line_ids": list(context.get("active_ids", []))}
+        return self._create(model, vals)
+
+    def _method_write(self, model, args, kwargs):
+        ids, vals = self._ids(args[0]), args[1]
+        self._check_values(model, [vals])
+        missing = [i for i in ids if i not in self._records[model]]
+        if missing:
+            raise ValueError(f"Record does not exist or has been deleted. (Records: {model}({missing[0]},))")
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        for record_id in ids:
+            self._records[model][record_id].update(vals, write_date=now)
+        return True
+
+    def _method_unlink(self, model, args, kwargs):
+        for record_id in self._ids(args[0]):
+            self._records[model].pop(record_id, None)
+        return True
+
+    def _set_state(self, model, ids, state):
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        for record_id in self._ids(ids):
+            self._records[model][record_id].update(state=state, write_date=now)
+        return True
+
+    def _method_action_confirm(self, model, args, kwargs):
+        return self._set_state(model, args[0], "sale")
+
+    def _method_action_post(self, model, args, kwargs):
+        return self._set_state(model, args[0], "posted")
+
+    def _method_action_create_payments(self, model, args, kwargs):
+        for wizard_id in self._ids(args[0]):
+            wizard = self._records[model][wizard_id]
+            for move_id in wizard.get("line_ids", []):
+                move = self._records["account.move"][move_id]
+                self._create(
+                    "account.payment",
+                    {"journal_id": wizard.get("journal_id"), "move_id": move_id, "amount": move.get("amount_total", 0.0)},
+                )
+                move["payment_state"] = "paid"
+        return True
+
+
+class _RequestHandler(SimpleXMLRPCRequestHandler):
+    protocol_version = "HTTP/1.1"
+    rpc_paths = ()
+
+    def do_POST(self):
+        if self.path != "/jsonrpc":
+            return super().do_POST()
+
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        params = request["params"]
+        fake = self.server.fake
+        try:
+            if params["service"] == "common":
+                result = getattr(fake, params["method"])(*params["args"])
+            else:
+                result = fake.execute_kw(*params["args"])
+            reply = {"jsonrpc": "2.0", "id": request.get("id"), "result": result}
+        except Exception as e:
+            reply = {
+                "jsonrpc": "2.0",
+                "id": request.get("id"),
+                "error": {"code": 200, "message": "Odoo Server Error", "data": {"message": str(e)}},
+            }
+
+        body = json.dumps(reply).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body, compresslevel=1)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _ThreadingServer(socketserver.ThreadingMixIn, MultiPathXMLRPCServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+@contextmanager
+def serve(fake: FakeOdoo):
+    """
+    Serve ``fake`` on an ephemeral localhost port; yields the base URL.
+    """
+
+    server = _ThreadingServer(
+        ("127.0.0.1", 0), requestHandler=_RequestHandler, allow_none=True, logRequests=False
+    )
+
+    common = SimpleXMLRPCDispatcher(allow_none=True)
+    common.register_function(fake.version, "version")
+    common.register_function(fake.authenticate, "authenticate")
+    server.add_dispatcher("/xmlrpc/2/common", common)
+
+    models = SimpleXMLRPCDispatcher(allow_none=True)
+    models.register_function(fake.execute_kw, "execute_kw")
+    server.add_dispatcher("/xmlrpc/2/object", models)
+
+    # Lets benchmarks in another process read and reset the round-trip counter
+    control = SimpleXMLRPCDispatcher(allow_none=True)
+    control.register_function(lambda: fake.round_trips, "round_trips")
+    control.register_function(lambda: fake.reset_calls() or True, "reset_calls")
+    server.add_dispatcher(CONTROL_PATH, control)
+
+    server.fake = fake
+
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        host, port = server.server_address
+        yield f"http://{host}:{port}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Serve a fake Odoo instance until interrupted.")
+    parser.add_argument("--products", type=int, default=100)
+    parser.add_argument("--partners", type=int, default=50)
+    parser.add_argument("--orders", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.0, help="Injected seconds per call")
+    parser.add_argument("--capacity", type=int, help="Calls served at once; others queue")
+    args = parser.parse_args()
+
+    fake = FakeOdoo(
+        products=args.products,
+        partners=args.partners,
+        orders=args.orders,
+        latency=args.latency,
+        capacity=args.capacity,
+    )
+    with serve(fake) as url:
+        print(url, flush=True)
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
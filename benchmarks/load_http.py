@@ -0,0 +1,217 @@
+"""
+Load test over HTTP: requests per second of a deployment by worker count.
+
+Starts the server with ``ODOO_MCP_TRANSPORT=streamable-http`` and
+``ODOO_MCP_WORKERS`` set to each count, then drives it from ``--clients``
+client processes (``--threads`` keep-alive connections each) calling
+``get_product_details`` for ``--seconds``. Two cases are worth running:
+
+- the default serves every call from the shared cache, so throughput is
+  bound by the server's CPU and scales with the cores the workers get;
+- ``--latency 0.05 --no-cache`` makes every call wait on Odoo, so
+  throughput is bound by the connection pools and scales with the workers
+  even on one core, each worker bringing its own pool.
+
+    python -m benchmarks.load_http [--workers 1 2 4] [--clients 4] [--threads 8] [--seconds 10]
+"""
+
+import argparse
+import http.client
+import json
+import multiprocessing
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+from .common import ROOT, fake_odoo_process, odoo_env
+
+HEADERS = {"Accept": "application/json, text/event-stream", "Content-Type": "application/json"}
+STARTUP_SECONDS = 30
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def post(conn, message, session=None):
+    """Send one JSON-RPC message; return the response message (if any) and headers."""
+    headers = dict(HEADERS, **({"mcp-session-id": session} if session else {}))
+    conn.request("POST", "/mcp", json.dumps(message), headers)
+    response = conn.getresponse()
+    body = response.read().decode()
+    if response.status >= 400:
+        raise RuntimeError(f"HTTP {response.status}: {body}")
+    for line in body.splitlines():
+        # Server-sent events carry the message on their "data:" line
+        if line.startswith("data:"):
+            body = line[5:]
+    return (json.loads(body) if body.strip() else None), response.headers
+
+
+def open_session(port):
+    """Connect and initialize; returns the connection and the session id, if any."""
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+    _, headers = post(
+        conn,
+        {
+            "jsonrpc": "2.0",
+            "id": 0,
+            "method": "initialize",
+            "params": {
+                "protocolVersion": "2025-06-18",
+                "capabilities": {},
+                "clientInfo": {"name": "load_http", "version": "1"},
+            },
+        },
+    )
+    session = headers.get("mcp-session-id")
+    post(conn, {"jsonrpc": "2.0", "method": "notifications/initialized"}, session)
+    return conn, session
+
+
+def call_tool(conn, session, request_id, product):
+    message, _ = post(
+        conn,
+        {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "method": "tools/call",
+            "params": {"name": "get_product_details", "arguments": {"product_name": product}},
+        },
+        session,
+    )
+    if "error" in message or message["result"].get("isError"):
+        raise RuntimeError(f"Tool call failed: {message}")
+
+
+def client_process(port, threads, seconds, products, results):
+    """Run ``threads`` connections until the deadline; report latencies in seconds."""
+    deadline = time.perf_counter() + seconds
+    latencies = []
+    errors = [0]
+
+    def worker(offset):
+        conn, session = open_session(port)
+        i = 0
+        while time.perf_counter() < deadline:
+            i += 1
+            start = time.perf_counter()
+            try:
+                call_tool(conn, session, i, f"Product {(offset + i) % products + 1}")
+                latencies.append(time.perf_counter() - start)
+            except Exception:
+                errors[0] += 1
+                conn.close()
+                conn, session = open_session(port)
+
+    pool = [threading.Thread(target=worker, args=(n * 997,)) for n in range(threads)]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    results.put((latencies, errors[0]))
+
+
+def wait_until_ready(port, server):
+    deadline = time.monotonic() + STARTUP_SECONDS
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"Server exited with {server.returncode}")
+        try:
+            conn, session = open_session(port)
+            call_tool(conn, session, 1, "Product 1")
+            return
+        except (OSError, RuntimeError):
+            time.sleep(0.2)
+    raise RuntimeError("Server did not start")
+
+
+def run_case(url, workers, clients, threads, seconds, products, cache, pool_size):
+    port = free_port()
+    env = dict(
+        os.environ,
+        **odoo_env(
+            url,
+            ODOO_MCP_TRANSPORT="streamable-http",
+            ODOO_MCP_PORT=port,
+            ODOO_MCP_WORKERS=workers,
+            ODOO_MCP_DRAIN_SECONDS=5,
+            ODOO_POOL_SIZE=pool_size,
+            ODOO_CACHE=int(cache),
+            ODOO_CACHE_TTLS="product.product=3600",
+            ODOO_SCHEMA_CACHE=0,
+        ),
+        PYTHONPATH=str(ROOT / "src"),
+    )
+    server = subprocess.Popen(
+        [sys.executable, "-m", "mcpserver"],
+        cwd=ROOT,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_until_ready(port, server)
+        results = multiprocessing.Queue()
+        processes = [
+            multiprocessing.Process(
+                target=client_process, args=(port, threads, seconds, products, results)
+            )
+            for _ in range(clients)
+        ]
+        for process in processes:
+            process.start()
+        latencies, errors = [], 0
+        for _ in processes:
+            process_latencies, process_errors = results.get()
+            latencies += process_latencies
+            errors += process_errors
+        for process in processes:
+            process.join()
+    finally:
+        server.terminate()
+        server.wait()
+
+    latencies.sort()
+    return {
+        "rps": len(latencies) / seconds,
+        "p50": latencies[len(latencies) // 2] if latencies else 0,
+        "p99": latencies[int(len(latencies) * 0.99)] if latencies else 0,
+        "errors": errors,
+    }
+
+
+def run(worker_counts, clients, threads, seconds, latency, cache, pool_size):
+    products = 500
+    print(f"{'workers':>8} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8} {'errors':>7}")
+    with fake_odoo_process(products=products, partners=10, orders=0, latency=latency) as url:
+        for workers in worker_counts:
+            r = run_case(url, workers, clients, threads, seconds, products, cache, pool_size)
+            print(
+                f"{workers:>8} {r['rps']:>8.0f} {r['p50'] * 1000:>8.1f} "
+                f"{r['p99'] * 1000:>8.1f} {r['errors']:>7}"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--clients", type=int, default=4, help="Client processes")
+    parser.add_argument("--threads", type=int, default=8, help="Connections per client process")
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--latency", type=float, default=0.0, help="Injected seconds per Odoo call")
+    parser.add_argument("--no-cache", dest="cache", action="store_false")
+    parser.add_argument("--pool-size", type=int, default=4, help="Odoo connections per worker")
+    args = parser.parse_args()
+    run(args.workers, args.clients, args.threads, args.seconds, args.latency, args.cache, args.pool_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Load test: tool-call throughput as the number of concurrent clients grows.
+
+Each client issues ``--calls`` sequential ``get_product_details`` calls; all
+clients share one server, so throughput only scales if tool calls do not
+block the event loop.
+
+    python -m benchmarks.load_tools [--clients 1 2 4 8 16] [--latency 0.05]
+"""
+
+import argparse
+import asyncio
+import time
+
+from .common import build_server
+from .fake_odoo import FakeOdoo, serve
+
+
+async def client(mcp, calls):
+    for i in range(calls):
+        await mcp.call_tool("get_product_details", {"product_name": f"Product {i + 1}"})
+
+
+async def run_clients(mcp, clients, calls):
+    start = time.perf_counter()
+    await asyncio.gather(*(client(mcp, calls) for _ in range(clients)))
+    return time.perf_counter() - start
+
+
+def run(client_counts, calls, latency, concurrency):
+    fake = FakeOdoo(products=500, latency=latency)
+    with serve(fake) as url:
+        mcp, _server = build_server(
+            url, ODOO_POOL_SIZE=concurrency, ODOO_MAX_CONCURRENCY=concurrency
+        )
+        print(f"{'clients':>8} {'calls':>7} {'seconds':>8} {'calls/s':>9}")
+        for clients in client_counts:
+            elapsed = asyncio.run(run_clients(mcp, clients, calls))
+            total = clients * calls
+            print(f"{clients:>8} {total:>7} {elapsed:>8.2f} {total / elapsed:>9.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--calls", type=int, default=20, help="Calls per client")
+    parser.add_argument("--latency", type=float, default=0.05, help="Injected seconds per call")
+    parser.add_argument("--concurrency", type=int, default=16, help="ODOO_MAX_CONCURRENCY")
+    args = parser.parse_args()
+    run(args.clients, args.calls, args.latency, args.concurrency)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,294 @@
+"""
+Benchmark suite: one scenario per MCP tool, with machine-readable results.
+
+Every scenario runs in a fresh client process against one fake Odoo process
+and reports p50/p95/p99 latency, Odoo round trips per call, throughput and
+the peak RSS growth of the client. Results can be written as JSON and
+compared with a previous run, e.g. the last release:
+
+    python -m benchmarks.suite --output results.json
+    python -m benchmarks.suite --baseline results.json --latency 0.005
+    python -m benchmarks.suite --scenarios get_products create_order --env ODOO_CACHE=0
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import resource
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import xmlrpc.client
+from datetime import datetime, timezone
+from importlib import metadata
+
+from .common import ROOT, build_server, fake_odoo_process
+from .fake_odoo import CONTROL_PATH
+
+RESULT_VERSION = 1
+
+
+def _products(dataset):
+    return lambda i: {"product_names_lang": "en", "page_size": 100}
+
+
+def _product_details(dataset):
+    return lambda i: {"product_name": f"Product {i % dataset['products'] + 1}"}
+
+
+def _order_details(dataset):
+    return lambda i: {"limits": 20}
+
+
+def _sales_summary(dataset):
+    return lambda i: {"group_by": ["partner", "date:month"], "measures": ["amount_total", "quantity"]}
+
+
+def _create_order(dataset):
+    return lambda i: {
+        "customer_name": f"Customer {i % dataset['partners'] + 1}",
+        "product_id": i % dataset["products"] + 1,
+        "create_invoice": True,
+        "finish_payment": True,
+    }
+
+
+def _create_orders_bulk(dataset):
+    return lambda i: {
+        "orders": [
+            {
+                "customer_name": f"Customer {(i * 10 + j) % dataset['partners'] + 1}",
+                "product_id": (i * 10 + j) % dataset["products"] + 1,
+                "quantity": 1,
+            }
+            for j in range(10)
+        ]
+    }
+
+
+def _export_records(dataset):
+    return lambda i: {"model": "product.product", "filename": f"suite-{i}.ndjson"}
+
+
+def _bulk_create(dataset):
+    return lambda i: {
+        "model": "res.partner",
+        "records": [
+            {"name": f"Suite {i}-{j}", "email": f"suite{i}-{j}@example.com"} for j in range(100)
+        ],
+    }
+
+
+def _bulk_write(dataset):
+    return lambda i: {
+        "model": "product.product",
+        "updates": [
+            {"id": (i * 50 + j) % dataset["products"] + 1, "list_price": float(10 + j % 4)}
+            for j in range(50)
+        ],
+    }
+
+
+# scenario name -> (tool, builder of the per-call arguments)
+SCENARIOS = {
+    "get_products": ("get_products", _products),
+    "get_product_details": ("get_product_details", _product_details),
+    "get_order_details": ("get_order_details", _order_details),
+    "get_sales_summary": ("get_sales_summary", _sales_summary),
+    "create_order": ("create_order", _create_order),
+    "create_orders_bulk": ("create_orders_bulk", _create_orders_bulk),
+    "export_records": ("export_records", _export_records),
+    "bulk_create": ("bulk_create", _bulk_create),
+    "bulk_write": ("bulk_write", _bulk_write),
+}
+
+
+def percentile(samples, q):
+    return statistics.quantiles(samples, n=100)[q - 1] if len(samples) > 1 else samples[0]
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is reported in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+async def _drive(mcp, tool, arguments, calls, concurrency):
+    """Issue ``calls`` tool calls from ``concurrency`` clients; returns per-call seconds."""
+    latencies = []
+    counter = iter(range(calls))
+
+    async def client():
+        for i in counter:
+            start = time.perf_counter()
+            await mcp.call_tool(tool, arguments(i))
+            latencies.append(time.perf_counter() - start)
+
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    return latencies
+
+
+def run_scenario(url, name, dataset, calls, concurrency, warmup, env) -> dict:
+    """Run one scenario in this process and return its result record."""
+    tool, builder = SCENARIOS[name]
+    arguments = builder(dataset)
+    # Exports go to a scratch directory unless one is given
+    export_dir = tempfile.mkdtemp(prefix="suite-exports-")
+    mcp, _server = build_server(url, **{"ODOO_EXPORT_DIR": export_dir, **env})
+    control = xmlrpc.client.ServerProxy(f"{url}{CONTROL_PATH}", allow_none=True)
+
+    if warmup:
+        asyncio.run(_drive(mcp, tool, arguments, warmup, 1))
+    baseline = peak_rss_mb()
+    control.reset_calls()
+
+    start = time.perf_counter()
+    latencies = asyncio.run(_drive(mcp, tool, arguments, calls, concurrency))
+    elapsed = time.perf_counter() - start
+    round_trips = control.round_trips()
+
+    shutil.rmtree(export_dir, ignore_errors=True)
+
+    latencies_ms = [seconds * 1000 for seconds in latencies]
+    return {
+        "scenario": name,
+        "tool": tool,
+        "calls": calls,
+        "concurrency": concurrency,
+        "p50_ms": percentile(latencies_ms, 50),
+        "p95_ms": percentile(latencies_ms, 95),
+        "p99_ms": percentile(latencies_ms, 99),
+        "mean_ms": statistics.fmean(latencies_ms),
+        "round_trips_per_call": round_trips / calls,
+        "throughput_per_s": calls / elapsed,
+        "peak_rss_delta_mb": peak_rss_mb() - baseline,
+    }
+
+
+def _environment(args) -> dict:
+    try:
+        version = metadata.version("odoo-mcp-server")
+    except metadata.PackageNotFoundError:
+        version = None
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True, cwd=ROOT,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "version": version,
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "dataset": _dataset(args),
+        "latency": args.latency,
+        "env": dict(args.env),
+    }
+
+
+def _dataset(args) -> dict:
+    return {"products": args.products, "partners": args.partners, "orders": args.orders}
+
+
+def _print_table(results, baseline):
+    previous = {r["scenario"]: r for r in (baseline or {}).get("results", [])}
+    header = (
+        f"{'scenario':<20} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+        f"{'trips/call':>10} {'calls/s':>9} {'peak MB':>8}"
+    )
+    if previous:
+        header += f" {'p50 vs base':>12}"
+    print(header)
+    for r in results:
+        line = (
+            f"{r['scenario']:<20} {r['p50_ms']:>8.2f} {r['p95_ms']:>8.2f} {r['p99_ms']:>8.2f} "
+            f"{r['round_trips_per_call']:>10.1f} {r['throughput_per_s']:>9.1f} "
+            f"{r['peak_rss_delta_mb']:>8.1f}"
+        )
+        if previous:
+            before = previous.get(r["scenario"])
+            change = f"{r['p50_ms'] / before['p50_ms'] - 1:+.0%}" if before else "-"
+            line += f" {change:>12}"
+        print(line)
+
+
+def run(args):
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    results = []
+    options = {**_dataset(args), "latency": args.latency}
+    with fake_odoo_process(**options) as url:
+        for name in args.scenarios:
+            command = [
+                sys.executable, "-W", "ignore", "-m", "benchmarks.suite",
+                "--client", name, "--url", url,
+                "--calls", str(args.calls), "--concurrency", str(args.concurrency),
+                "--warmup", str(args.warmup),
+                "--products", str(args.products), "--partners", str(args.partners),
+                "--orders", str(args.orders),
+            ]
+            for key, value in args.env:
+                command += ["--env", f"{key}={value}"]
+            output = subprocess.run(
+                command, capture_output=True, text=True, check=True, cwd=ROOT
+            ).stdout
+            results.append(json.loads(output.strip().splitlines()[-1]))
+
+    _print_table(results, baseline)
+    if args.output:
+        report = {"version": RESULT_VERSION, "environment": _environment(args), "results": results}
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Results written to {args.output}")
+
+
+def _env_pair(value: str):
+    key, sep, val = value.partition("=")
+    if not sep:
+        raise argparse.ArgumentTypeError(f"Expected KEY=VALUE, got {value}")
+    return key, val
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--calls", type=int, default=200, help="Measured calls per scenario")
+    parser.add_argument("--concurrency", type=int, default=4, help="Concurrent clients")
+    parser.add_argument("--warmup", type=int, default=5, help="Unmeasured calls first")
+    parser.add_argument("--latency", type=float, default=0.002, help="Injected seconds per call")
+    parser.add_argument("--products", type=int, default=1000)
+    parser.add_argument("--partners", type=int, default=200)
+    parser.add_argument("--orders", type=int, default=200)
+    parser.add_argument(
+        "--env", type=_env_pair, action="append", default=[],
+        help="ODOO_* setting for the server under test, e.g. ODOO_CACHE=0",
+    )
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    parser.add_argument("--baseline", help="Compare with a JSON file from an earlier run")
+    parser.add_argument("--client", choices=list(SCENARIOS), help=argparse.SUPPRESS)
+    parser.add_argument("--url", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.client:
+        result = run_scenario(
+            args.url, args.client, _dataset(args),
+            args.calls, args.concurrency, args.warmup, dict(args.env),
+        )
+        print(json.dumps(result))
+    else:
+        run(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,12 +2,21 @@ from mcpserver.deployment import mcp
 from mcpserver.odoo_mcp_server import OdooMCPServer
 from mcp.shared.exceptions import McpError
 from mcpserver.config import OdooConfig, ConfigValidationError
+from dotenv import load_dotenv
 import sys
 
 
 def main():
     try:
+        load_dotenv()
         config = OdooConfig()
+        if config.transport != "stdio":
+            # Imported here: stdio sessions start without the HTTP stack
+            from mcpserver.serving import serve
+
+            # Each worker process builds its own server
+            serve(config, mcp)
+            return
         server = OdooMCPServer(mcp, config)
         server.initialize_server()
         mcp.run()
@@ -16,10 +25,10 @@ def main():
         print(f"Configuration validation error: {cfg_err}", file=sys.stderr)
     except McpError as e:
         # You can log it on server
-        print("[MCP Server Error]", e)
+        print("[MCP Server Error]", e, file=sys.stderr)
         return 1
     except KeyboardInterrupt:
-        print("Server stopped by user.")
+        print("Server stopped by user.", file=sys.stderr)
         return "Server stopped."
     except ValueError as e:
         # Configuration errors
@@ -27,7 +36,7 @@ def main():
         print("\nPlease check your environment variables or .env file", file=sys.stderr)
         return 1
     except Exception as e:
-        print(f"Error initializing OdooMCPServer: {e}")
+        print(f"Error initializing OdooMCPServer: {e}", file=sys.stderr)
         raise e
 
 
@@ -0,0 +1,280 @@
+import contextvars
+import threading
+import time
+from collections import Counter, OrderedDict, deque
+
+from .breaker import OdooUnavailable
+
+# Lanes of tool calls: quick reads, transactional writes, and bulk reads,
+# writes and exports
+INTERACTIVE = "interactive"
+WRITE = "write"
+BULK = "bulk"
+LANES = (INTERACTIVE, WRITE, BULK)
+
+# Share of the free Odoo slots each lane gets while lanes wait for them
+DEFAULT_LANE_WEIGHTS = {INTERACTIVE: 8, WRITE: 2, BULK: 1}
+
+# Tool name of the Odoo calls made outside of a tool call (sync, index,
+# schema); they go in the bulk lane
+BACKGROUND = "background"
+
+# Starting limit, capped by the pool size; it grows from there while Odoo keeps up
+INITIAL_LIMIT = 4
+
+# Weight of a new latency sample in the baseline (exponential moving average)
+BASELINE_WEIGHT = 0.05
+
+# Seconds a call may take over the baseline without counting as a slowdown;
+# smaller differences are scheduling noise, not Odoo queueing
+MIN_SLOWDOWN = 0.01
+
+# The priority lane keeps its reserved slot for this many seconds after its last call
+RESERVE_SECONDS = 10
+
+
+class OdooOverloaded(OdooUnavailable):
+    """Odoo has no capacity left for a call in time; the caller should retry later."""
+
+
+def parse_lane_settings(raw: str, cast=int) -> dict:
+    """Parse ``"lane=value,lane=value"`` into a mapping of known lanes."""
+    settings = {}
+    for item in raw.split(","):
+        if not item.strip():
+            continue
+        lane, sep, value = item.partition("=")
+        lane = lane.strip()
+        if not sep:
+            raise ValueError(f"expected lane=value, got {item.strip()!r}")
+        if lane not in LANES:
+            raise ValueError(f"unknown lane {lane!r}, use {', '.join(LANES)}")
+        settings[lane] = cast(value)
+        if settings[lane] <= 0:
+            raise ValueError(f"{lane} must be greater than 0")
+    return settings
+
+
+class ToolCall:
+    """
+    The lane of a tool call and how long its Odoo calls may wait for
+    capacity: ``timeout`` seconds from the tool call's arrival for its first
+    call, and from the end of its previous call for the next ones, so that
+    calls of a long tool, e.g. a bulk write, are not shed for the time the
+    earlier ones took.
+
+    Once a tool call of the write lane has written, its later calls have no
+    deadline: shedding them would leave a half-done chain (an order without
+    its invoice) that a retry would duplicate.
+    """
+
+    def __init__(self, tool: str, timeout: float, lane: str = INTERACTIVE):
+        self.tool = tool
+        self.lane = lane
+        self.timeout = timeout
+        self.committed = False
+        self._since = time.monotonic()
+
+    @property
+    def deadline(self):
+        """``time.monotonic()`` deadline of the next call, or None if it must not be shed."""
+        return None if self.committed else self._since + self.timeout
+
+    def wrote(self):
+        """Record a successful write of this tool call."""
+        if self.lane == WRITE:
+            self.committed = True
+
+    def restart(self):
+        self._since = time.monotonic()
+
+
+# The tool call running in the current context
+current_call = contextvars.ContextVar("odoo_tool_call", default=None)
+
+
+class _Waiter:
+    __slots__ = ("deadline", "granted", "event")
+
+    def __init__(self, deadline):
+        self.deadline = deadline
+        self.granted = False
+        self.event = threading.Event()
+
+
+class AdaptiveLimiter:
+    """
+    Bounds the calls in flight to one Odoo instance with a limit that
+    follows its latency (AIMD).
+
+    The limit grows by one per ``limit`` calls that finish while it is fully
+    used and within ``tolerance`` times the baseline latency (a slow moving
+    average of observed latencies) or ``MIN_SLOWDOWN`` over it, whichever is
+    longer. It shrinks by the factor ``backoff``, at most once per baseline
+    latency, when a call fails to reach Odoo or takes longer than that.
+
+    Calls over the limit wait in a queue per tool within their lane. Free
+    slots go to the lanes with waiting calls in proportion to ``weights``,
+    and within a lane the tools take turns, so a burst of one tool does not
+    starve the others. While the lane with the highest weight is in use, it
+    keeps one slot the other lanes cannot take, so heavy jobs never hold
+    every slot. A call is
+    shed with ``OdooOverloaded`` when its tool's queue holds ``max_queue``
+    calls, when the expected wait would outlast its deadline, or when the
+    deadline passes while it waits.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_limit: int,
+        min_limit: int = 1,
+        max_queue: int = 64,
+        tolerance: float = 2.0,
+        backoff: float = 0.9,
+        weights: dict = None,
+    ):
+        self.name = name
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.max_queue = max_queue
+        self.tolerance = tolerance
+        self.backoff = backoff
+        self.limit = float(min(max_limit, INITIAL_LIMIT))
+        self.baseline = None  # seconds
+        self.weights = {**DEFAULT_LANE_WEIGHTS, **(weights or {})}
+        self.priority_lane = max(self.weights, key=self.weights.get)
+        self.in_flight = 0
+        self.lane_in_flight = Counter()
+        self.shed = Counter()  # tool -> calls shed
+
+        self._queues = {}  # lane -> OrderedDict of tool -> deque of waiters, in serving order
+        self._credits = Counter()  # lane -> weighted round-robin credit
+        self._decreased_at = 0.0
+        self._priority_seen_at = None
+        self._lock = threading.Lock()
+
+    def _queued(self, lane: str = None) -> int:
+        lanes = [self._queues.get(lane, {})] if lane else self._queues.values()
+        return sum(len(queue) for tools in lanes for queue in tools.values())
+
+    def _has_room(self, lane: str) -> bool:
+        free = int(self.limit) - self.in_flight
+        reserved = (
+            lane != self.priority_lane
+            and int(self.limit) > 1
+            and self._priority_seen_at is not None
+            and time.monotonic() - self._priority_seen_at < RESERVE_SECONDS
+        )
+        return free > (1 if reserved else 0)
+
+    def acquire(self, tool: str, deadline, lane: str = INTERACTIVE):
+        """
+        Wait for a slot until ``deadline`` (``time.monotonic()``) or raise
+        ``OdooOverloaded``; with no deadline, wait as long as it takes.
+        """
+        with self._lock:
+            if lane == self.priority_lane:
+                self._priority_seen_at = time.monotonic()
+            queue = self._queues.get(lane, {}).get(tool)
+            if deadline is not None and queue is not None and len(queue) >= self.max_queue:
+                self._shed(tool)
+            if deadline is not None and self.baseline is not None and not self._has_room(lane):
+                # Each of the limit's slots frees up about once per baseline
+                expected_wait = (self._queued() + 1) / int(self.limit) * self.baseline
+                if time.monotonic() + expected_wait > deadline:
+                    self._shed(tool)
+            waiter = _Waiter(deadline)
+            self._queues.setdefault(lane, OrderedDict()).setdefault(tool, deque()).append(waiter)
+            self._grant()
+            if waiter.granted:
+                return
+
+        waiter.event.wait(None if deadline is None else max(0.0, deadline - time.monotonic()))
+        with self._lock:
+            if waiter.granted:
+                return
+            tools = self._queues.get(lane, {})
+            queue = tools.get(tool)
+            if queue is not None and waiter in queue:
+                queue.remove(waiter)
+                if not queue:
+                    del tools[tool]
+                if not tools:
+                    self._queues.pop(lane, None)
+            self._shed(tool)
+
+    def release(self, lane: str = INTERACTIVE, seconds: float = None, failed: bool = False):
+        """
+        Free a slot of ``lane``. ``seconds`` is how long the call took in
+        Odoo, None if it never got there; ``failed`` means Odoo could not be
+        reached in time.
+        """
+        with self._lock:
+            self.in_flight -= 1
+            self.lane_in_flight[lane] -= 1
+            if seconds is not None:
+                self._adapt(seconds, failed)
+            self._grant()
+
+    def _adapt(self, seconds: float, failed: bool):
+        now = time.monotonic()
+        if self.baseline is None:
+            self.baseline = seconds
+        if failed or seconds > max(self.tolerance * self.baseline, self.baseline + MIN_SLOWDOWN):
+            if now - self._decreased_at >= self.baseline:
+                self.limit = max(self.min_limit, self.limit * self.backoff)
+                self._decreased_at = now
+        elif self.in_flight + 1 >= int(self.limit):
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+        if not failed:
+            self.baseline += BASELINE_WEIGHT * (seconds - self.baseline)
+
+    def _grant(self):
+        """
+        Hand free slots to the queued calls: lanes by smooth weighted
+        round-robin, and the tools of a lane one at a time.
+        """
+        now = time.monotonic()
+        while True:
+            lanes = [lane for lane in self._queues if self._has_room(lane)]
+            if not lanes:
+                return
+            for lane in set(self._credits) - set(lanes):
+                del self._credits[lane]
+            for lane in lanes:
+                self._credits[lane] += self.weights.get(lane, 1)
+            lane = max(lanes, key=self._credits.__getitem__)
+            self._credits[lane] -= sum(self.weights.get(other, 1) for other in lanes)
+
+            tools = self._queues[lane]
+            tool, queue = next(iter(tools.items()))
+            waiter = queue.popleft()
+            if queue:
+                tools.move_to_end(tool)
+            else:
+                del tools[tool]
+                if not tools:
+                    del self._queues[lane]
+            if waiter.deadline is not None and waiter.deadline - now < (self.baseline or 0):
+                # Could not finish in time; wake it up to be shed now
+                waiter.event.set()
+                continue
+            waiter.granted = True
+            self.in_flight += 1
+            self.lane_in_flight[lane] += 1
+            waiter.event.set()
+
+    def _shed(self, tool: str):
+        self.shed[tool] += 1
+        raise OdooOverloaded(f"Odoo ({self.name}) is overloaded; retry later.")
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "limit": int(self.limit),
+                "in_flight": {lane: self.lane_in_flight[lane] for lane in self.weights},
+                "queued": {lane: self._queued(lane) for lane in self.weights},
+                "baseline_ms": None if self.baseline is None else self.baseline * 1000,
+                "shed": dict(self.shed),
+            }
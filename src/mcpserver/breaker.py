@@ -0,0 +1,89 @@
+import http.client
+import sys
+import threading
+import time
+import xmlrpc.client
+
+from .connection import PoolExhausted
+
+# Odoo's fault code for a rejected login or a uid/password that is no longer valid
+ACCESS_DENIED_FAULT_CODE = 3
+
+
+class OdooUnavailable(Exception):
+    """Odoo failed repeatedly; calls fail fast until the circuit breaker lets one through."""
+
+
+def is_access_denied(fault: xmlrpc.client.Fault) -> bool:
+    return fault.faultCode == ACCESS_DENIED_FAULT_CODE or "Access Denied" in str(fault.faultString)
+
+
+def is_connection_failure(error: Exception) -> bool:
+    """True for errors meaning Odoo could not be reached or did not answer properly."""
+    if isinstance(error, (xmlrpc.client.Fault, PoolExhausted)):
+        # Odoo answered, or the pool is just busy
+        return False
+    return isinstance(error, (OSError, http.client.HTTPException, xmlrpc.client.ProtocolError))
+
+
+class CircuitBreaker:
+    """
+    Fails calls fast while Odoo is unreachable.
+
+    After ``threshold`` consecutive connection failures the circuit opens
+    for ``backoff`` seconds, doubling with every further failure up to
+    ``max_backoff``. Once that delay has passed a single call is let through
+    as a probe: its success closes the circuit, its failure opens it again
+    for longer. Every other call meanwhile raises ``OdooUnavailable``.
+    """
+
+    def __init__(self, name: str, threshold: int = 3, backoff: float = 1, max_backoff: float = 60):
+        self.name = name
+        self.threshold = threshold
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.failures = 0
+        self.opened = 0
+
+        self._retry_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self.failures >= self.threshold
+
+    def _delay(self) -> float:
+        return min(self.backoff * 2 ** (self.failures - self.threshold), self.max_backoff)
+
+    def allow(self):
+        """Raise ``OdooUnavailable`` unless a call may go to Odoo now."""
+        with self._lock:
+            if not self.is_open:
+                return
+            now = time.monotonic()
+            if now < self._retry_at:
+                raise OdooUnavailable(
+                    f"Odoo ({self.name}) is unavailable, retrying in {self._retry_at - now:.1f}s."
+                )
+            # This call probes; the others keep failing fast until it reports back
+            self._retry_at = now + self._delay()
+
+    def success(self):
+        with self._lock:
+            if self.is_open:
+                print(f"[Info] Odoo ({self.name}) is reachable again", file=sys.stderr)
+            self.failures = 0
+
+    def failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.is_open:
+                if self.failures == self.threshold:
+                    self.opened += 1
+                delay = self._delay()
+                self._retry_at = time.monotonic() + delay
+                print(
+                    f"[Error] Odoo ({self.name}) unreachable after {self.failures} attempts, "
+                    f"failing fast for {delay:.1f}s",
+                    file=sys.stderr,
+                )
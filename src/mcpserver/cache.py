@@ -0,0 +1,163 @@
+import json
+import threading
+import time
+from collections import Counter, OrderedDict
+
+# Methods whose results can be served from memory
+READ_METHODS = frozenset(
+    {"search_read", "read", "search", "search_count", "name_search", "fields_get", "read_group"}
+)
+
+# Writing to a model also stales the cached reads of these models
+RELATED_MODELS = {
+    "sale.order": ("sale.order.line",),
+    "sale.order.line": ("sale.order",),
+    "account.move": ("account.move.line", "sale.order", "sale.order.line"),
+    "account.move.line": ("account.move",),
+    "account.payment.register": ("account.move", "account.payment"),
+}
+
+DEFAULT_TTLS = {
+    "product.product": 300,
+    "res.partner": 300,
+    "account.journal": 3600,
+}
+
+MISS = object()
+
+
+def parse_ttls(raw: str) -> dict:
+    """Parse ``"model=seconds,model=seconds"`` into a TTL mapping."""
+    ttls = {}
+    for item in raw.split(","):
+        if not item.strip():
+            continue
+        model, sep, seconds = item.partition("=")
+        if not sep:
+            raise ValueError(f"expected model=seconds, got {item.strip()!r}")
+        ttls[model.strip()] = float(seconds)
+    return ttls
+
+
+def call_key(model: str, method: str, args, kwargs, scope: str = None) -> str:
+    """
+    Return a key identifying an ``execute_kw`` call by all of its arguments;
+    ``scope`` separates identical calls made against different databases.
+    """
+    return json.dumps([scope, model, method, args, kwargs], sort_keys=True, default=repr)
+
+
+class OdooCache:
+    """
+    Thread-safe TTL + LRU cache for read-only Odoo calls.
+
+    Entries are keyed on model, method, args and kwargs (so domain, fields
+    and context such as ``lang`` are all part of the key) and expire after the
+    model's TTL. Models without a TTL are never cached. Any other method on a
+    model, e.g. ``create`` or ``write``, drops the cached reads of that model
+    and its related models.
+
+    With a ``store`` (``SharedStore``) the cache is shared by the worker
+    processes of a deployment: misses are looked up in the store, values are
+    written through to it, and an entry held in memory is only used while
+    its model's generation in the store is the one it was cached under, so a
+    write through any worker stales the reads of every worker.
+
+    Callers take ``generation(model)`` before reading Odoo and pass it to
+    ``set()``: a read that a write overtook is not cached.
+    """
+
+    def __init__(self, ttls: dict = None, max_size: int = 1024, store=None):
+        self.ttls = DEFAULT_TTLS if ttls is None else ttls
+        self.max_size = max_size
+        self.store = store
+        self.hits = Counter()
+        self.misses = Counter()
+
+        self._entries = OrderedDict()  # key -> (model, expires_at, value, generation)
+        self._generations = Counter()  # model -> invalidations in this process
+        self._lock = threading.Lock()
+
+    def key(self, model: str, method: str, args, kwargs, scope: str = None):
+        """Return the cache key for a call, or None if it must not be cached."""
+        if method not in READ_METHODS or self.ttls.get(model, 0) <= 0:
+            return None
+        return call_key(model, method, args, kwargs, scope)
+
+    def generation(self, model: str):
+        """A token that changes whenever ``model`` is invalidated, here or in the store."""
+        local = self._generations[model]
+        return (local, self.store.generation(model)) if self.store is not None else (local, 0)
+
+    def get(self, key: str, model: str):
+        """Return the cached value for ``key`` or ``MISS``."""
+        generation = self.generation(model)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] > time.monotonic() and entry[3] == generation:
+                self._entries.move_to_end(key)
+                self.hits[model] += 1
+                return entry[2]
+            if entry is not None:
+                del self._entries[key]
+
+        shared = self.store.get(key) if self.store is not None else None
+        with self._lock:
+            if shared is None:
+                self.misses[model] += 1
+                return MISS
+            self.hits[model] += 1
+        value = json.loads(shared[0])
+        self._remember(key, model, value, shared[1], generation)
+        return value
+
+    def set(self, key: str, model: str, value, generation=None):
+        """
+        Cache ``value``, read from Odoo when ``model`` was at ``generation``
+        (default now); if it has been invalidated since, the value is dropped.
+        """
+        ttl = self.ttls[model]
+        if generation is None:
+            generation = self.generation(model)
+        if self.store is not None:
+            if not self.store.set(
+                key, model, json.dumps(value, default=str), ttl, generation=generation[1]
+            ):
+                return
+        self._remember(key, model, value, ttl, generation)
+
+    def _remember(self, key: str, model: str, value, ttl: float, generation):
+        with self._lock:
+            if generation[0] != self._generations[model]:
+                return
+            self._entries[key] = (model, time.monotonic() + ttl, value, generation)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, model: str):
+        """Drop every cached read of ``model`` and its related models."""
+        models = {model, *RELATED_MODELS.get(model, ())}
+        with self._lock:
+            self._generations.update(models)
+            for key in [k for k, entry in self._entries.items() if entry[0] in models]:
+                del self._entries[key]
+        if self.store is not None:
+            self.store.bump(sorted(models))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """Return per-model hit/miss counters and the current entry count."""
+        with self._lock:
+            models = sorted(set(self.hits) | set(self.misses))
+            return {
+                "entries": len(self._entries),
+                "max_size": self.max_size,
+                "models": {
+                    model: {"hits": self.hits[model], "misses": self.misses[model]}
+                    for model in models
+                },
+            }
@@ -1,6 +1,16 @@
 import os
 import re
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 from mcp.shared.exceptions import McpError, ErrorData
+from .admission import BULK, DEFAULT_LANE_WEIGHTS, INTERACTIVE, WRITE, parse_lane_settings
+from .cache import DEFAULT_TTLS, parse_ttls
+from .sync import DEFAULT_SYNC_MODELS, SYNC_FIELDS
+from .tenants import DEFAULT_TENANT, TenantProfile, load_profiles
+from .transport import PROTOCOLS
+
+# MCP transports the server can be run with
+TRANSPORTS = ("stdio", "streamable-http", "sse")
+
 
 class ConfigValidationError(Exception):
     """Internal exception for config validation failures."""
@@ -21,8 +31,221 @@ class OdooConfig:
         self.odoo_password = os.getenv("ODOO_PASSWORD")
         self.odoo_database = os.getenv("ODOO_DATABASE")
 
+        # More Odoo databases served by this process, chosen per tool call
+        self.tenants_file = os.getenv("ODOO_TENANTS_FILE")
+        self.max_tenants = self._get_number("ODOO_MAX_TENANTS", 16, int)
+        self._load_tenants()
+
+        # RPC protocol used to talk to Odoo: "xmlrpc" or "jsonrpc"
+        self.protocol = (os.getenv("ODOO_PROTOCOL") or "xmlrpc").strip().lower()
+        # Ask Odoo for gzip-compressed JSON-RPC responses
+        self.compress = self._get_flag("ODOO_GZIP", True)
+        # Authenticate with the default tenant in the background at startup
+        self.connect_on_start = self._get_flag("ODOO_CONNECT_ON_START", True)
+
+        # Connection pool tuning
+        self.pool_size = self._get_number("ODOO_POOL_SIZE", 4, int)
+        self.timeout = self._get_number("ODOO_TIMEOUT", 30, float)
+        self.pool_timeout = self._get_number("ODOO_POOL_TIMEOUT", 30, float)
+        self.pool_idle_timeout = self._get_number("ODOO_POOL_IDLE_TIMEOUT", 60, float)
+
+        # Circuit breaker: fail fast after this many consecutive connection
+        # failures, for a backoff doubling from ODOO_BREAKER_BACKOFF seconds
+        self.breaker_threshold = self._get_number("ODOO_BREAKER_THRESHOLD", 3, int)
+        self.breaker_backoff = self._get_number("ODOO_BREAKER_BACKOFF", 1, float)
+        self.breaker_max_backoff = self._get_number("ODOO_BREAKER_MAX_BACKOFF", 60, float)
+
+        # Adaptive limit of the calls in flight to each Odoo database, between
+        # 1 and its pool size; calls over it wait in a queue per tool and are
+        # shed with an "overloaded" error after ODOO_QUEUE_TIMEOUT seconds
+        self.adaptive_concurrency = self._get_flag("ODOO_ADAPTIVE_CONCURRENCY", True)
+        self.queue_timeout = self._get_number("ODOO_QUEUE_TIMEOUT", 10, float)
+        self.queue_size = self._get_number("ODOO_QUEUE_SIZE", 64, int)
+
+        # Maximum number of tool calls running at the same time; with the
+        # adaptive limit they are not all talking to Odoo
+        self.max_concurrency = self._get_number(
+            "ODOO_MAX_CONCURRENCY",
+            self.pool_size * 4 if self.adaptive_concurrency else self.pool_size,
+            int,
+        )
+
+        # Lanes of tool calls (interactive reads, writes, bulk work):
+        # ODOO_LANE_WEIGHTS="interactive=8,write=2,bulk=1" shares Odoo capacity
+        # among them, ODOO_LANE_CONCURRENCY caps the tool calls of each
+        self.lane_weights = self._get_lane_settings("ODOO_LANE_WEIGHTS", DEFAULT_LANE_WEIGHTS, float)
+        self.lane_concurrency = self._get_lane_settings(
+            "ODOO_LANE_CONCURRENCY",
+            {
+                INTERACTIVE: self.max_concurrency,
+                WRITE: max(1, self.max_concurrency // 2),
+                BULK: max(1, self.max_concurrency // 4),
+            },
+            int,
+        )
+
+        # Read cache: ODOO_CACHE_TTLS="product.product=300,res.partner=600"
+        self.cache_enabled = self._get_flag("ODOO_CACHE", True)
+        self.cache_size = self._get_number("ODOO_CACHE_SIZE", 1024, int)
+        self.cache_ttls = self._get_ttls("ODOO_CACHE_TTLS")
+
+        # Timezone of dates shown to users; defaults to the Odoo user's tz
+        self.timezone = (os.getenv("ODOO_TIMEZONE") or "").strip() or None
+
+        # Default size budget of a tool response; larger ones are cut short
+        # with a hint on how to get the rest
+        self.max_response_bytes = self._get_number("ODOO_MAX_RESPONSE_BYTES", 100_000, int)
+
+        # Local product/partner name index, answering name lookups without Odoo
+        self.name_index = self._get_flag("ODOO_NAME_INDEX", False)
+        self.index_refresh = self._get_number("ODOO_INDEX_REFRESH", 60, float)
+        self.index_languages = [
+            lang.strip()
+            for lang in (os.getenv("ODOO_INDEX_LANGUAGES") or "en_US,ar_001").split(",")
+            if lang.strip()
+        ]
+
+        # Field metadata cache, persisted across restarts
+        self.schema_cache = self._get_flag("ODOO_SCHEMA_CACHE", True)
+        self.schema_dir = os.getenv("ODOO_SCHEMA_DIR") or os.path.join(
+            os.path.expanduser("~"), ".cache", "odoo-mcp-server"
+        )
+
+        # export_records: output directory, records per chunk, chunks read at once
+        self.export_dir = os.getenv("ODOO_EXPORT_DIR") or os.path.join(
+            os.path.expanduser("~"), "odoo-mcp-exports"
+        )
+        self.export_chunk_size = self._get_number("ODOO_EXPORT_CHUNK_SIZE", 2000, int)
+        self.export_workers = self._get_number("ODOO_EXPORT_WORKERS", self.pool_size, int)
+
+        # bulk_create/bulk_write: records per create/write call
+        self.bulk_chunk_size = self._get_number("ODOO_BULK_CHUNK_SIZE", 100, int)
+
+        # MCP transport: "stdio", or HTTP ("streamable-http", "sse") served by
+        # ODOO_MCP_WORKERS processes, each with its own Odoo connection pools
+        self.transport = (os.getenv("ODOO_MCP_TRANSPORT") or "stdio").strip().lower()
+        self.host = os.getenv("ODOO_MCP_HOST") or "127.0.0.1"
+        self.port = self._get_number("ODOO_MCP_PORT", 8000, int)
+        self.workers = self._get_number("ODOO_MCP_WORKERS", 1, int)
+        # Seconds in-flight requests get to finish on shutdown
+        self.drain_seconds = self._get_number("ODOO_MCP_DRAIN_SECONDS", 30, float)
+        # Directory of the state (cache, metrics) the workers share
+        self.shared_state_dir = os.getenv("ODOO_SHARED_STATE_DIR") or None
+
+        # Share one round trip among identical concurrent reads
+        self.coalesce = self._get_flag("ODOO_COALESCE", True)
+
+        # Instrumentation, exposed as the odoo://metrics MCP resource
+        self.metrics_enabled = self._get_flag("ODOO_METRICS", True)
+        slow_call_ms = self._get_number("ODOO_SLOW_CALL_MS", None, float)
+        self.slow_call_seconds = slow_call_ms / 1000 if slow_call_ms else None
+
+        # Local replicas of read-mostly models, kept in sync in the background
+        self.sync_enabled = self._get_flag("ODOO_SYNC", False)
+        self.sync_models = [
+            model.strip()
+            for model in (os.getenv("ODOO_SYNC_MODELS") or ",".join(DEFAULT_SYNC_MODELS)).split(",")
+            if model.strip()
+        ]
+        self.sync_interval = self._get_number("ODOO_SYNC_INTERVAL", 30, float)
+        self.sync_reconcile_interval = self._get_number("ODOO_SYNC_RECONCILE_INTERVAL", 600, float)
+        self.sync_max_staleness = self._get_number("ODOO_SYNC_MAX_STALENESS", 300, float)
+        self.sync_state_file = os.getenv("ODOO_SYNC_STATE_FILE") or os.path.join(
+            os.path.expanduser("~"),
+            ".cache",
+            "odoo-mcp-server",
+            f"sync-{self.odoo_database or 'default'}.json",
+        )
+
         self._validate()
 
+    def _load_tenants(self):
+        """
+        Build the tenant profiles: the ``ODOO_*`` connection settings are the
+        ``default`` tenant, ``ODOO_TENANTS_FILE`` adds more. Without the
+        ``ODOO_*`` settings, ``ODOO_DEFAULT_TENANT`` (or the first tenant in
+        the file) becomes the default and fills them in.
+        """
+        self.tenant_profiles = {}
+        if self.tenants_file:
+            try:
+                self.tenant_profiles = load_profiles(self.tenants_file)
+            except (OSError, ValueError) as e:
+                raise ConfigValidationError(f"ODOO_TENANTS_FILE is invalid: {e}")
+
+        env_tenant = self.odoo_url or not self.tenant_profiles
+        self.default_tenant = os.getenv("ODOO_DEFAULT_TENANT") or (
+            DEFAULT_TENANT if env_tenant else next(iter(self.tenant_profiles))
+        )
+        if env_tenant:
+            if all((self.odoo_url, self.odoo_username, self.odoo_password, self.odoo_database)):
+                self.tenant_profiles[DEFAULT_TENANT] = TenantProfile(
+                    DEFAULT_TENANT,
+                    self.odoo_url,
+                    self.odoo_database,
+                    self.odoo_username,
+                    self.odoo_password,
+                )
+        elif self.default_tenant in self.tenant_profiles:
+            profile = self.tenant_profiles[self.default_tenant]
+            self.odoo_url = profile.url
+            self.odoo_database = profile.database
+            self.odoo_username = profile.username
+            self.odoo_password = profile.password
+
+    @property
+    def multi_tenant(self) -> bool:
+        return len(self.tenant_profiles) > 1
+
+    @staticmethod
+    def _get_ttls(name):
+        """Read per-model cache TTLs, falling back to the built-in defaults."""
+        raw = os.getenv(name)
+        if raw is None or raw.strip() == "":
+            return dict(DEFAULT_TTLS)
+        try:
+            return {**DEFAULT_TTLS, **parse_ttls(raw)}
+        except ValueError as e:
+            raise ConfigValidationError(f"{name} is invalid: {e}")
+
+    @staticmethod
+    def _get_lane_settings(name, defaults, cast):
+        """Read per-lane values over ``defaults``."""
+        raw = os.getenv(name)
+        if raw is None or raw.strip() == "":
+            return dict(defaults)
+        try:
+            return {**defaults, **parse_lane_settings(raw, cast)}
+        except ValueError as e:
+            raise ConfigValidationError(f"{name} is invalid: {e}")
+
+    @staticmethod
+    def _get_number(name, default, cast):
+        """Read a positive number from the environment, falling back to ``default``."""
+        raw = os.getenv(name)
+        if raw is None or raw.strip() == "":
+            return default
+        try:
+            value = cast(raw)
+        except ValueError:
+            raise ConfigValidationError(f"{name} must be a number - got: {raw}")
+        if value <= 0:
+            raise ConfigValidationError(f"{name} must be greater than 0 - got: {raw}")
+        return value
+
+    @staticmethod
+    def _get_flag(name, default):
+        """Read a boolean flag (1/0, true/false, yes/no) from the environment."""
+        raw = os.getenv(name)
+        if raw is None or raw.strip() == "":
+            return default
+        value = raw.strip().lower()
+        if value in ("1", "true", "yes", "on"):
+            return True
+        if value in ("0", "false", "no", "off"):
+            return False
+        raise ConfigValidationError(f"{name} must be a boolean - got: {raw}")
+
     def _validate(self):
         missing = []
         if not self.odoo_url:
@@ -41,6 +264,43 @@ class OdooConfig:
         if not self._URL_PATTERN.match(self.odoo_url):
             raise ConfigValidationError(f"ODOO_URL must start with http:// or https:// - got: {self.odoo_url}")
 
+        if self.default_tenant not in self.tenant_profiles:
+            raise ConfigValidationError(
+                f"ODOO_DEFAULT_TENANT is not a configured tenant - got: {self.default_tenant}"
+            )
+        for profile in self.tenant_profiles.values():
+            if not self._URL_PATTERN.match(profile.url):
+                raise ConfigValidationError(
+                    f"Tenant {profile.name} URL must start with http:// or https:// - got: {profile.url}"
+                )
+
+        unknown_models = [m for m in self.sync_models if m not in SYNC_FIELDS]
+        if unknown_models:
+            raise ConfigValidationError(
+                f"ODOO_SYNC_MODELS supports {', '.join(SYNC_FIELDS)} - got: {', '.join(unknown_models)}"
+            )
+
+        if self.timezone:
+            try:
+                ZoneInfo(self.timezone)
+            except (ZoneInfoNotFoundError, ValueError):
+                raise ConfigValidationError(f"ODOO_TIMEZONE is not a known timezone - got: {self.timezone}")
+
+        if self.protocol not in PROTOCOLS:
+            raise ConfigValidationError(
+                f"ODOO_PROTOCOL must be one of {', '.join(PROTOCOLS)} - got: {self.protocol}"
+            )
+
+        if self.transport not in TRANSPORTS:
+            raise ConfigValidationError(
+                f"ODOO_MCP_TRANSPORT must be one of {', '.join(TRANSPORTS)} - got: {self.transport}"
+            )
+        if self.workers > 1 and self.transport != "streamable-http":
+            # stdio has one client; SSE streams are tied to the worker holding the session
+            raise ConfigValidationError(
+                f"ODOO_MCP_WORKERS > 1 requires ODOO_MCP_TRANSPORT=streamable-http - got: {self.transport}"
+            )
+
         # (Optional) Validate password strength or username format
         # if len(self.odoo_username) < 3:
         #     raise ConfigValidationError("ODOO_USERNAME too short (min 3 chars)")
@@ -0,0 +1,101 @@
+import queue
+import threading
+import time
+import xmlrpc.client
+from contextlib import contextmanager
+
+from .transport import create_connection
+
+
+class PoolExhausted(TimeoutError):
+    """No pooled connection became free in time; Odoo itself may be fine."""
+
+
+class OdooConnectionPool:
+    """
+    Bounded, thread-safe pool of persistent Odoo connections.
+
+    RPC clients are not safe to share between threads, so each caller checks
+    out its own connection (with its own keep-alive socket) for the duration
+    of a call and returns it afterwards.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        protocol: str = "xmlrpc",
+        size: int = 4,
+        timeout: float = 30,
+        acquire_timeout: float = 30,
+        idle_timeout: float = 60,
+        compress: bool = True,
+    ):
+        self.url = url
+        self.protocol = protocol
+        self.size = size
+        self.timeout = timeout
+        self.acquire_timeout = acquire_timeout
+        self.idle_timeout = idle_timeout
+        self.compress = compress
+
+        self._slots = threading.BoundedSemaphore(size)
+        self._idle = queue.LifoQueue()
+        self._closed = False
+
+    def _new_connection(self):
+        return create_connection(self.protocol, self.url, self.timeout, self.compress)
+
+    def _acquire(self):
+        if self._closed:
+            raise RuntimeError("Odoo connection pool is closed.")
+        if not self._slots.acquire(timeout=self.acquire_timeout):
+            raise PoolExhausted(
+                f"No Odoo connection available after {self.acquire_timeout}s "
+                f"(pool size {self.size})."
+            )
+        try:
+            connection = self._idle.get_nowait()
+        except queue.Empty:
+            return self._new_connection()
+
+        if connection.is_stale(self.idle_timeout):
+            connection.close()
+        return connection
+
+    def _release(self, connection, broken: bool = False):
+        if broken or self._closed:
+            connection.close()
+        connection.last_used = time.monotonic()
+        if not self._closed:
+            self._idle.put(connection)
+        self._slots.release()
+
+    @contextmanager
+    def connection(self):
+        """Check out a connection for exclusive use by the current thread."""
+        connection = self._acquire()
+        broken = False
+        try:
+            yield connection
+        except xmlrpc.client.Fault:
+            # The server answered, the connection itself is fine
+            raise
+        except Exception:
+            broken = True
+            raise
+        finally:
+            self._release(connection, broken)
+
+    def execute_kw(self, *args):
+        """Run ``execute_kw`` on a pooled connection."""
+        with self.connection() as connection:
+            return connection.execute_kw(*args)
+
+    def close(self):
+        """Close all idle connections and refuse further checkouts."""
+        self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
@@ -0,0 +1,152 @@
+import csv
+import json
+import math
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from .shaping import compact_value
+
+EXPORT_FORMATS = ("ndjson", "csv")
+
+# Bytes of an export file returned by one read of its resource
+EXPORT_PAGE_BYTES = 1 << 20
+
+
+class NdjsonWriter:
+    """One JSON object per line, with Odoo's values as returned."""
+
+    def __init__(self, f, fields=None, types=None):
+        self._f = f
+
+    def write(self, rows):
+        self._f.writelines(
+            json.dumps(row, ensure_ascii=False, separators=(",", ":"), default=str) + "\n"
+            for row in rows
+        )
+
+
+class CsvWriter:
+    """
+    A header and one line per record. Related records are given by name,
+    x2many ids space-separated and Odoo's ``False`` for an empty non-boolean
+    field as an empty cell. ``types`` maps fields to their ``fields_get``
+    type; without it ``False`` is always empty.
+    """
+
+    def __init__(self, f, fields=None, types=None):
+        self._writer = csv.writer(f)
+        self._fields = fields
+        self._header_written = False
+        self._booleans = {name for name, kind in (types or {}).items() if kind == "boolean"}
+
+    def _cell(self, field, value):
+        if value is False and field not in self._booleans:
+            return ""
+        value = compact_value(value)
+        if isinstance(value, list):
+            return " ".join(str(v) for v in value)
+        return value
+
+    def write(self, rows):
+        if not rows:
+            return
+        if not self._header_written:
+            if self._fields is None:
+                # Odoo chose the fields; take them from the first record
+                self._fields = list(rows[0])
+            self._writer.writerow(self._fields)
+            self._header_written = True
+        self._writer.writerows([self._cell(f, row.get(f)) for f in self._fields] for row in rows)
+
+
+WRITERS = {"ndjson": NdjsonWriter, "csv": CsvWriter}
+
+
+def plan_chunks(first_id: int, last_id: int, total: int, chunk_size: int):
+    """
+    Split ``first_id..last_id`` into ``[start, end)`` id ranges holding about
+    ``chunk_size`` of the ``total`` matching records each, assuming they are
+    spread evenly over the id space. The ranges differ in width by at most
+    one id, so the last chunk is not left with a small remainder.
+    """
+    count = max(1, math.ceil(total / chunk_size))
+    span, extra = divmod(last_id - first_id + 1, count)
+    chunks = []
+    start = first_id
+    for index in range(count):
+        end = start + span + (index < extra)
+        if end > start:
+            chunks.append((start, end))
+        start = end
+    return chunks
+
+
+def export_model(fetch, model, domain, fields, writer, chunk_size, workers, progress=None):
+    """
+    Read every ``model`` record matching ``domain`` into ``writer``, ordered
+    by id, and return how many were written.
+
+    The id space is split into chunks read by ``workers`` threads at once.
+    At most twice that many chunks are held in memory; each is written as
+    soon as the chunks before it are. ``fetch(model, method, args, kwargs)``
+    performs the Odoo call and ``progress(done, total)`` is called after
+    every chunk.
+    """
+    total = fetch(model, "search_count", [domain], {})
+    if not total:
+        return 0
+    first = fetch(model, "search", [domain], {"order": "id asc", "limit": 1})
+    last = fetch(model, "search", [domain], {"order": "id desc", "limit": 1})
+    chunks = deque(plan_chunks(first[0], last[0], total, chunk_size))
+
+    options = {"order": "id asc"}
+    if fields is not None:
+        options["fields"] = fields
+
+    def read_chunk(start, end):
+        return fetch(
+            model,
+            "search_read",
+            [[*domain, ["id", ">=", start], ["id", "<", end]]],
+            options,
+        )
+
+    written = 0
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="odoo-export") as executor:
+        pending = deque()
+        while chunks or pending:
+            while chunks and len(pending) < workers * 2:
+                pending.append(executor.submit(read_chunk, *chunks.popleft()))
+            rows = pending.popleft().result()
+            writer.write(rows)
+            written += len(rows)
+            if progress is not None:
+                progress(written, total)
+    return written
+
+
+def page_count(path: str, page_bytes: int = EXPORT_PAGE_BYTES) -> int:
+    """Number of pages ``read_page`` splits the file at ``path`` into."""
+    return max(1, math.ceil(os.path.getsize(path) / page_bytes))
+
+
+def read_page(path: str, page: int, page_bytes: int = EXPORT_PAGE_BYTES) -> str:
+    """
+    Lines of the file at ``path`` that start in bytes ``[page * page_bytes,
+    (page + 1) * page_bytes)``, so every line is in exactly one page and only
+    that page is read. A page within a very long line is empty.
+    """
+    start, end = page * page_bytes, (page + 1) * page_bytes
+    lines = []
+    with open(path, "rb") as f:
+        if start:
+            # Skip the line that started in the previous page
+            f.seek(start - 1)
+            f.readline()
+        while f.tell() < end:
+            line = f.readline()
+            if not line:
+                break
+            lines.append(line)
+    return b"".join(lines).decode("utf-8")
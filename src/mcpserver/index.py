@@ -0,0 +1,280 @@
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+
+from .keyset import iter_by_id
+
+# Records read per ``search_read`` call while loading an index
+INDEX_FETCH_CHUNK_SIZE = 5000
+
+# Minimum trigram similarity for a fuzzy match
+FUZZY_THRESHOLD = 0.3
+
+
+def _trigrams(text: str) -> set:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+class NameIndex:
+    """
+    In-memory trigram index over record names for ``ilike``-style lookups.
+
+    Each entry is one record in one language. A search intersects the posting
+    lists of the query's trigrams, starting from the rarest, then checks the
+    remaining candidates for a real substring match. Results are ranked exact
+    match first, then prefix, word prefix and any substring, shorter names
+    first.
+    """
+
+    def __init__(self, langs=("en_US",)):
+        self.langs = list(langs)
+        self._lang_rank = {lang: rank for rank, lang in enumerate(self.langs)}
+
+        self._names = []  # entry -> lowercased name, None once removed
+        self._rows = []  # entry -> (record_id, lang, row)
+        self._entries = {}  # (record_id, lang) -> entry
+        self._postings = defaultdict(list)  # trigram -> entries
+        self._dead = 0
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def upsert(self, record_id: int, lang: str, row: dict):
+        """Index ``row['name']`` for ``record_id`` in ``lang``, replacing any old entry."""
+        with self._lock:
+            self._remove_entry((record_id, lang))
+            name = (row.get("name") or "").lower()
+            entry = len(self._names)
+            self._names.append(name)
+            self._rows.append((record_id, lang, row))
+            self._entries[(record_id, lang)] = entry
+            for trigram in _trigrams(name):
+                self._postings[trigram].append(entry)
+            # A replaced entry is dead too, so records rewritten again and again compact here
+            if self._dead > len(self._entries):
+                self._compact()
+
+    def remove(self, record_id: int):
+        """Drop ``record_id`` in every language."""
+        with self._lock:
+            for lang in self.langs:
+                self._remove_entry((record_id, lang))
+            if self._dead > len(self._entries):
+                self._compact()
+
+    def _remove_entry(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._names[entry] = None
+            self._dead += 1
+
+    def _compact(self):
+        live = [self._rows[e] for e in self._entries.values()]
+        self._names, self._rows, self._entries = [], [], {}
+        self._postings = defaultdict(list)
+        self._dead = 0
+        for record_id, lang, row in live:
+            self.upsert(record_id, lang, row)
+
+    def _candidates(self, query: str):
+        trigrams = _trigrams(query)
+        if not trigrams:
+            # Too short for trigrams, fall back to a scan
+            return (e for e, name in enumerate(self._names) if name is not None)
+
+        postings = sorted((self._postings.get(t, ()) for t in trigrams), key=len)
+        if not postings[0]:
+            return ()
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            # Once the candidates are few, checking them directly is cheaper
+            # than walking another long posting list
+            if not candidates or len(posting) > 8 * len(candidates):
+                break
+            candidates.intersection_update(posting)
+        return candidates
+
+    def _rank(self, query: str, entry: int):
+        name = self._names[entry]
+        record_id, lang, _row = self._rows[entry]
+        if name == query:
+            match = 0
+        elif name.startswith(query):
+            match = 1
+        elif f" {query}" in name:
+            match = 2
+        else:
+            match = 3
+        return (match, len(name), self._lang_rank.get(lang, len(self.langs)), record_id)
+
+    def search(self, query: str, limit: int = 10, fuzzy: bool = False) -> list:
+        """
+        Return up to ``limit`` ``(record_id, lang, row)`` tuples whose name
+        contains ``query`` (case-insensitive), best match first.
+
+        With ``fuzzy`` and no substring match, fall back to names that share
+        enough trigrams with the query.
+        """
+        query = (query or "").strip().lower()
+        if not query:
+            return []
+
+        with self._lock:
+            matches = [
+                e
+                for e in self._candidates(query)
+                if self._names[e] is not None and query in self._names[e]
+            ]
+            if matches:
+                matches.sort(key=lambda e: self._rank(query, e))
+            elif fuzzy:
+                matches = self._fuzzy(query)
+
+            seen, results = set(), []
+            for entry in matches:
+                record_id, lang, row = self._rows[entry]
+                if record_id in seen:
+                    continue
+                seen.add(record_id)
+                results.append((record_id, lang, row))
+                if len(results) >= limit:
+                    break
+            return results
+
+    def _fuzzy(self, query: str) -> list:
+        trigrams = _trigrams(query)
+        # Similar names share most trigrams, so candidates are drawn from the
+        # rarest half only and then scored on all of them
+        rarest = sorted(trigrams, key=lambda t: len(self._postings.get(t, ())))
+        shared = Counter()
+        for trigram in rarest[: max(len(rarest) // 2, 1)]:
+            shared.update(self._postings.get(trigram, ()))
+
+        scored = []
+        for entry in shared:
+            name = self._names[entry]
+            if name is None:
+                continue
+            name_trigrams = _trigrams(name)
+            score = len(trigrams & name_trigrams) / len(trigrams | name_trigrams)
+            if score >= FUZZY_THRESHOLD:
+                scored.append((-score, len(name), entry))
+        scored.sort()
+        return [entry for _score, _length, entry in scored]
+
+
+class OdooNameIndex(NameIndex):
+    """
+    ``NameIndex`` over one Odoo model, loaded in the background on first use
+    and then refreshed incrementally: every ``refresh_interval`` seconds only
+    records whose ``write_date`` moved past the last seen watermark are
+    re-read. Archived records are dropped, and every ``reconcile_interval``
+    seconds the id set is compared with Odoo's to drop deleted ones.
+
+    Lookups never wait for a refresh; until the first load completes
+    (``loaded``), and after a write through this server until a refresh that
+    started after it completes (``stale``), callers should ask Odoo instead.
+
+    ``fetch(model, method, args, kwargs)`` performs the uncached Odoo call.
+    """
+
+    def __init__(
+        self,
+        model: str,
+        fields,
+        fetch,
+        langs=("en_US",),
+        refresh_interval: float = 60,
+        reconcile_interval: float = 600,
+    ):
+        super().__init__(langs)
+        self.model = model
+        self.fields = list(fields)
+        self.refresh_interval = refresh_interval
+        self.reconcile_interval = reconcile_interval
+        self.watermark = None
+        self.loaded = False
+        self.generation = 0  # writes to the model through this server
+        self._refreshed_generation = 0  # generation the last refresh started at
+
+        self._fetch = fetch
+        self._refreshed_at = float("-inf")
+        self._reconciled_at = time.monotonic()
+        self._refresh_lock = threading.Lock()
+
+    @property
+    def stale(self) -> bool:
+        return self._refreshed_generation != self.generation
+
+    def mark_written(self):
+        """Note a write to the model; the index is stale until the next refresh."""
+        with self._lock:
+            self.generation += 1
+
+    def ensure_fresh(self):
+        """Start a background refresh if the index is stale or older than ``refresh_interval``."""
+        if not self.stale and time.monotonic() - self._refreshed_at < self.refresh_interval:
+            return
+        if not self._refresh_lock.acquire(blocking=False):
+            # Already refreshing
+            return
+        threading.Thread(
+            target=self._refresh_in_background, name=f"index-{self.model}", daemon=True
+        ).start()
+
+    def refresh(self):
+        """Refresh now, after any refresh already running."""
+        self._refresh_lock.acquire()
+        self._refresh_in_background()
+
+    def _refresh_in_background(self):
+        # Runs with self._refresh_lock held, which it releases
+        generation = self.generation
+        try:
+            self._refresh()
+            if self.loaded and time.monotonic() - self._reconciled_at >= self.reconcile_interval:
+                self._reconcile()
+                self._reconciled_at = time.monotonic()
+        except Exception as e:
+            print(f"[Error] Refreshing the {self.model} name index failed: {e}", file=sys.stderr)
+            return
+        finally:
+            self._refresh_lock.release()
+        self._refreshed_at = time.monotonic()
+        self._refreshed_generation = generation
+        self.loaded = True
+
+    def _reconcile(self):
+        """Drop records deleted in Odoo."""
+        ids = set(self._fetch(self.model, "search", [[["active", "=", True]]], {}))
+        with self._lock:
+            deleted = {record_id for record_id, _lang in self._entries} - ids
+        for record_id in deleted:
+            self.remove(record_id)
+
+    def _refresh(self):
+        domain = [["active", "in", [True, False]]]
+        if self.watermark:
+            # ">=" so records written in the same second are not missed
+            domain.append(["write_date", ">=", self.watermark])
+
+        watermark = self.watermark
+        for lang in self.langs:
+            for rows in iter_by_id(
+                self._fetch,
+                self.model,
+                domain,
+                self.fields + ["active", "write_date"],
+                INDEX_FETCH_CHUNK_SIZE,
+                context={"lang": lang},
+            ):
+                for row in rows:
+                    if row.get("active") is False:
+                        self.remove(row["id"])
+                    else:
+                        self.upsert(row["id"], lang, row)
+                    if row.get("write_date") and (watermark is None or row["write_date"] > watermark):
+                        watermark = row["write_date"]
+        self.watermark = watermark
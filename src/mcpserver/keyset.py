@@ -0,0 +1,20 @@
+def iter_by_id(fetch, model: str, domain, fields, chunk_size: int, after_id: int = 0, context=None):
+    """
+    Yield the records of ``model`` matching ``domain`` with an id above
+    ``after_id``, in chunks of ``chunk_size`` ordered by id.
+
+    Uses an ``id > last_id`` keyset instead of offsets, so each chunk is an
+    index range scan on Odoo's side and only one chunk is held at a time.
+    ``fetch(model, method, args, kwargs)`` performs the Odoo call.
+    """
+    kwargs = {"fields": fields, "order": "id asc", "limit": chunk_size}
+    if context:
+        kwargs["context"] = context
+    while True:
+        page = fetch(model, "search_read", [list(domain) + [["id", ">", after_id]]], kwargs)
+        if not page:
+            return
+        yield page
+        if len(page) < chunk_size:
+            return
+        after_id = page[-1]["id"]
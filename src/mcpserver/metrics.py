@@ -0,0 +1,190 @@
+import contextvars
+import sys
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+ROUND_TRIP_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+# Odoo round trips made by the tool call running in the current context
+_round_trips = contextvars.ContextVar("odoo_round_trips", default=None)
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus style."""
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.count += 1
+        self.sum += value
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+
+    def render(self, name: str, labels: str) -> list:
+        sep = "," if labels else ""
+        lines = [
+            f'{name}_bucket{{{labels}{sep}le="{bound}"}} {count}'
+            for bound, count in zip(self.buckets, self.counts)
+        ]
+        lines.append(f'{name}_bucket{{{labels}{sep}le="+Inf"}} {self.count}')
+        lines.append(f"{name}_sum{{{labels}}} {self.sum}")
+        lines.append(f"{name}_count{{{labels}}} {self.count}")
+        return lines
+
+
+def _labels(**labels) -> str:
+    return ",".join(f'{key}="{value}"' for key, value in labels.items())
+
+
+class Metrics:
+    """
+    Per-call instrumentation for Odoo RPCs and MCP tools.
+
+    Records latency histograms, call and error counts and payload sizes per
+    Odoo model/method, and latency, error counts and Odoo round trips per
+    tool invocation. ``render`` produces the Prometheus text format.
+    Calls slower than ``slow_call_seconds`` are logged.
+    """
+
+    def __init__(self, slow_call_seconds: float = None):
+        self.slow_call_seconds = slow_call_seconds
+        self.extra_sources = []  # callables returning [(gauge name, labels, value)]
+
+        self._lock = threading.Lock()
+        self._odoo_calls = defaultdict(int)  # (model, method, outcome) -> count
+        self._odoo_latency = defaultdict(lambda: Histogram(LATENCY_BUCKETS))
+        self._odoo_sent = defaultdict(lambda: Histogram(SIZE_BUCKETS))
+        self._odoo_received = defaultdict(lambda: Histogram(SIZE_BUCKETS))
+        self._tool_calls = defaultdict(int)  # (tool, outcome) -> count
+        self._tool_latency = defaultdict(lambda: Histogram(LATENCY_BUCKETS))
+        self._tool_round_trips = defaultdict(lambda: Histogram(ROUND_TRIP_BUCKETS))
+
+    def observe_odoo_call(
+        self,
+        model: str,
+        method: str,
+        seconds: float,
+        error: bool = False,
+        sent_bytes: int = 0,
+        received_bytes: int = 0,
+    ):
+        counter = _round_trips.get()
+        if counter is not None:
+            counter[0] += 1
+
+        key = (model, method)
+        with self._lock:
+            self._odoo_calls[(model, method, "error" if error else "ok")] += 1
+            self._odoo_latency[key].observe(seconds)
+            if sent_bytes:
+                self._odoo_sent[key].observe(sent_bytes)
+            if received_bytes:
+                self._odoo_received[key].observe(received_bytes)
+
+        if self.slow_call_seconds is not None and seconds >= self.slow_call_seconds:
+            print(
+                f"[Slow] Odoo call {model}.{method} took {seconds * 1000:.0f} ms",
+                file=sys.stderr,
+            )
+
+    @contextmanager
+    def tool_call(self, tool: str):
+        """Time a tool invocation and count the Odoo round trips it makes."""
+        counter = [0]
+        token = _round_trips.set(counter)
+        start = time.perf_counter()
+        error = False
+        try:
+            yield
+        except Exception:
+            error = True
+            raise
+        finally:
+            seconds = time.perf_counter() - start
+            _round_trips.reset(token)
+            with self._lock:
+                self._tool_calls[(tool, "error" if error else "ok")] += 1
+                self._tool_latency[tool].observe(seconds)
+                self._tool_round_trips[tool].observe(counter[0])
+            if self.slow_call_seconds is not None and seconds >= self.slow_call_seconds:
+                print(
+                    f"[Slow] Tool {tool} took {seconds * 1000:.0f} ms "
+                    f"with {counter[0]} Odoo round trips",
+                    file=sys.stderr,
+                )
+
+    def render(self) -> str:
+        """Return all metrics in the Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            lines.append("# TYPE odoo_rpc_calls_total counter")
+            for (model, method, outcome), count in sorted(self._odoo_calls.items()):
+                labels = _labels(model=model, method=method, outcome=outcome)
+                lines.append(f"odoo_rpc_calls_total{{{labels}}} {count}")
+
+            for name, histograms in (
+                ("odoo_rpc_duration_seconds", self._odoo_latency),
+                ("odoo_rpc_request_bytes", self._odoo_sent),
+                ("odoo_rpc_response_bytes", self._odoo_received),
+            ):
+                lines.append(f"# TYPE {name} histogram")
+                for (model, method), histogram in sorted(histograms.items()):
+                    lines.extend(histogram.render(name, _labels(model=model, method=method)))
+
+            lines.append("# TYPE mcp_tool_calls_total counter")
+            for (tool, outcome), count in sorted(self._tool_calls.items()):
+                lines.append(f"mcp_tool_calls_total{{{_labels(tool=tool, outcome=outcome)}}} {count}")
+
+            for name, histograms in (
+                ("mcp_tool_duration_seconds", self._tool_latency),
+                ("mcp_tool_odoo_round_trips", self._tool_round_trips),
+            ):
+                lines.append(f"# TYPE {name} histogram")
+                for tool, histogram in sorted(histograms.items()):
+                    lines.extend(histogram.render(name, _labels(tool=tool)))
+
+        gauges = defaultdict(list)
+        for source in self.extra_sources:
+            for name, labels, value in source():
+                gauges[name].append(f"{name}{{{_labels(**labels)}}} {value}")
+        for name, series in sorted(gauges.items()):
+            lines.append(f"# TYPE {name} gauge")
+            lines.extend(series)
+
+        return "\n".join(lines) + "\n"
+
+
+def merge_expositions(texts) -> str:
+    """
+    Combine the ``render()`` output of several processes, e.g. the workers
+    of one deployment, into one: series with the same name and labels are
+    summed, in the order they first appear.
+    """
+    families = {}  # metric name -> {series: value}
+    for text in texts:
+        series_values = None
+        for line in text.splitlines():
+            if line.startswith("# TYPE "):
+                name = line.split()[2]
+                series_values = families.setdefault(name, {"# TYPE": line})
+            elif line and series_values is not None:
+                series, _, value = line.rpartition(" ")
+                series_values[series] = series_values.get(series, 0) + float(value)
+
+    lines = []
+    for series_values in families.values():
+        for series, value in series_values.items():
+            if series == "# TYPE":
+                lines.append(value)
+            else:
+                lines.append(f"{series} {int(value) if value.is_integer() else value}")
+    return "\n".join(lines) + "\n"
@@ -1,60 +1,75 @@
-import os
-import xmlrpc.client
-import socket
-from dotenv import load_dotenv
+import sys
+import threading
+from .connection import OdooConnectionPool
+from .tenants import TenantRegistry
 from .tools import OdooTools
-load_dotenv()
 
 class OdooMCPServer:
 
     def __init__(self, mcp, config):
         self.mcp = mcp
-        self.common = None
-        self.models = None
-        self.uid = None
+        self.tenants = None
 
         self.config = config
 
     def initialize_server(self):
         self._connect_to_odoo()
         self._add_tools()
-        print("OdooMCPServer initialized and tools added.")
+        print("OdooMCPServer initialized and tools added.", file=sys.stderr)
     def _connect_to_odoo(self):
 
-        # Initialize XML-RPC connections
-        # Odoo server connection
+        # Tenants open their pool and authenticate on first use, so startup
+        # does not wait for Odoo; an unreachable Odoo trips a circuit breaker.
+        # The default tenant's handshake starts right away in the background
+        # and the first call waits for it instead of starting its own.
 
-        timeout = 30  # seconds
-        transport = xmlrpc.client.Transport()
-        transport.timeout = timeout
+        self.tenants = TenantRegistry(
+            self.config.tenant_profiles,
+            self._open_pool,
+            max_active=self.config.max_tenants,
+            default=self.config.default_tenant,
+            breaker_threshold=self.config.breaker_threshold,
+            breaker_backoff=self.config.breaker_backoff,
+            breaker_max_backoff=self.config.breaker_max_backoff,
+        )
+        print(
+            f"Using Odoo at {self.config.odoo_url} with database {self.config.odoo_database} and user {self.config.odoo_username}",
+            file=sys.stderr,
+        )
+        if self.config.connect_on_start:
+            threading.Thread(target=self._handshake, name="odoo-handshake", daemon=True).start()
+        if self.config.multi_tenant:
+            print(f"Serving Odoo tenants: {', '.join(self.tenants.names())}", file=sys.stderr)
 
+    def _handshake(self):
+        """Authenticate with the default tenant ahead of the first call."""
         try:
+            self.tenants.connect()
+            print(f"[Info] Connected to Odoo tenant {self.tenants.default}", file=sys.stderr)
+        except Exception as e:
+            # The first call retries, or fails fast while the circuit is open
             print(
-                f"Connecting to Odoo at {self.config.odoo_url} with database {self.config.odoo_database} and user {self.config.odoo_username}"
-            )
-            self.common = xmlrpc.client.ServerProxy(
-                f"{self.config.odoo_url}/xmlrpc/2/common", transport=transport
-            )
-            self.uid = self.common.authenticate(
-                self.config.odoo_database, self.config.odoo_username, self.config.odoo_password, {}
-            )
-            self.models = xmlrpc.client.ServerProxy(
-                f"{self.config.odoo_url}/xmlrpc/2/object", transport=transport
+                f"[Error] Could not connect to Odoo tenant {self.tenants.default}: {e}",
+                file=sys.stderr,
             )
-            print(f"Connected to Odoo as user ID {self.uid}")
-
-        except xmlrpc.client.Fault as e:
-            print(f"XML-RPC Fault: {e.faultCode} - {e.faultString}")
-            raise e
-        except socket.timeout:
-            print("Connection timed out, coulddn't connect to Odoo server.")
-            raise e
-        except TimeoutError:
-            print("TimeoutError: The connection took too long to respond.")
-            raise e
-        except Exception as e:
-            print(f"An unexpected error occurred: {e}")
-            raise e
+
+    def _open_pool(self, profile):
+        """Create the connection pool of ``profile``; no network calls are made."""
+        # Each thread checks out its own keep-alive connection
+        return OdooConnectionPool(
+            profile.url,
+            protocol=self.config.protocol,
+            size=profile.pool_size or self.config.pool_size,
+            timeout=self.config.timeout,
+            acquire_timeout=self.config.pool_timeout,
+            idle_timeout=self.config.pool_idle_timeout,
+            compress=self.config.compress,
+        )
 
     def _add_tools(self):
-        self.tools = OdooTools(self.mcp, self.config, self)
\ No newline at end of file
+        self.tools = OdooTools(self.mcp, self.config, self)
+
+    def close(self):
+        """Stop background work and close every Odoo connection."""
+        self.tools.close()
+        self.tenants.close()
@@ -0,0 +1,172 @@
+import hashlib
+import json
+import sys
+import threading
+
+from .state import load_state, save_state
+
+# Models whose field metadata is prefetched
+SCHEMA_MODELS = (
+    "product.product",
+    "res.partner",
+    "sale.order",
+    "sale.order.line",
+    "account.journal",
+    "sale.report",
+)
+
+# Attributes kept from ``fields_get``
+FIELD_ATTRIBUTES = ["type", "string", "store", "relation", "related"]
+
+# Field types left out when all fields ("*") are requested
+HEAVY_FIELD_TYPES = ("binary", "html")
+
+STATE_VERSION = 2
+
+
+def _readable(attributes) -> bool:
+    """
+    Whether ``"*"`` reads a field: stored ones and related ones, which Odoo
+    reports as not stored (e.g. product.product's ``name``, inherited from
+    product.template) but reads as cheaply. Other computed fields are left out.
+    """
+    return attributes.get("store", True) or bool(attributes.get("related"))
+
+
+class UnknownFields(ValueError):
+    """A projection names fields the model does not have."""
+
+    def __init__(self, model: str, fields):
+        super().__init__(f"Unknown fields on {model}: {', '.join(fields)}.")
+        self.model = model
+        self.fields = list(fields)
+
+
+class SchemaCache:
+    """
+    Field metadata (``fields_get``) of the models the tools read.
+
+    ``load()`` checks a fingerprint of the installed modules and custom
+    fields with two ``search_read`` calls; if it matches the one saved in
+    ``state_file``, the metadata is taken from there, otherwise every model's
+    ``fields_get`` is called and the file rewritten. Until it has loaded, or
+    if Odoo could not be asked, ``fields()`` returns None and projections are
+    sent unchecked.
+
+    ``fetch(model, method, args, kwargs)`` performs the uncached Odoo call.
+    """
+
+    def __init__(self, fetch, models=SCHEMA_MODELS, state_file: str = None, identity: dict = None):
+        self.models = tuple(models)
+        self.state_file = state_file
+        self.identity = identity or {}
+        self.loaded = threading.Event()
+        self.from_disk = False
+
+        self._fetch = fetch
+        self._fields = {}  # model -> {field: attributes}
+
+    def load(self):
+        try:
+            fingerprint = self._fingerprint()
+            state = self._load_state()
+            if state is not None and state.get("fingerprint") == fingerprint:
+                self._fields = state["models"]
+                self.from_disk = True
+            else:
+                self._fields = {
+                    model: self._fetch(model, "fields_get", [], {"attributes": FIELD_ATTRIBUTES})
+                    for model in self.models
+                }
+                self._save_state(fingerprint)
+        except Exception as e:
+            print(f"[Error] Could not load the Odoo schema: {e}", file=sys.stderr)
+        finally:
+            self.loaded.set()
+
+    def _fingerprint(self) -> str:
+        """Hash of what decides the schema: installed module versions and custom fields."""
+        modules = self._fetch(
+            "ir.module.module",
+            "search_read",
+            [[["state", "=", "installed"]]],
+            {"fields": ["name", "latest_version"], "order": "name"},
+        )
+        custom_fields = self._fetch(
+            "ir.model.fields",
+            "search_read",
+            [[["model", "in", list(self.models)], ["state", "=", "manual"]]],
+            {"fields": ["model", "name", "ttype", "store"], "order": "model, name"},
+        )
+        payload = [
+            [[m["name"], m["latest_version"]] for m in modules],
+            [[f["model"], f["name"], f["ttype"], f["store"]] for f in custom_fields],
+        ]
+        return hashlib.sha256(json.dumps(payload).encode()).hexdigest()
+
+    # --- Lookups ---
+
+    def fields(self, model: str):
+        """``{field: attributes}`` of ``model``, or None if unknown."""
+        return self._fields.get(model)
+
+    def ensure(self, model: str):
+        """``fields()`` of ``model``, reading its ``fields_get`` if it was not prefetched."""
+        if model not in self._fields and self.loaded.is_set():
+            try:
+                self._fields[model] = self._fetch(
+                    model, "fields_get", [], {"attributes": FIELD_ATTRIBUTES}
+                )
+            except Exception as e:
+                print(f"[Error] Could not read the fields of {model}: {e}", file=sys.stderr)
+        return self.fields(model)
+
+    def check(self, model: str, fields):
+        """Raise ``UnknownFields`` if ``model`` is known and lacks any of ``fields``."""
+        schema = self.fields(model)
+        if schema is None:
+            return
+        unknown = [f for f in fields if f != "id" and f not in schema]
+        if unknown:
+            raise UnknownFields(model, unknown)
+
+    def select(self, model: str, requested, default) -> list:
+        """
+        The fields to read: ``requested`` after checking them, where ``"*"``
+        stands for every stored or related field but binary and HTML ones,
+        else ``default`` without the fields this database lacks.
+        """
+        schema = self.fields(model)
+        if schema is None:
+            return [f for f in requested or default if f != "*"]
+        if requested:
+            self.check(model, [f for f in requested if f != "*"])
+            fields = []
+            for field in requested:
+                if field == "*":
+                    fields.extend(
+                        name
+                        for name, attributes in schema.items()
+                        if _readable(attributes) and attributes.get("type") not in HEAVY_FIELD_TYPES
+                    )
+                else:
+                    fields.append(field)
+            return fields
+        return [f for f in default if f in schema]
+
+    # --- Persistence ---
+
+    def _load_state(self):
+        state = load_state(self.state_file, STATE_VERSION, self.identity, "schema cache")
+        if state is None or set(state.get("models", {})) != set(self.models):
+            return None
+        return state
+
+    def _save_state(self, fingerprint: str):
+        state = {
+            "version": STATE_VERSION,
+            "identity": self.identity,
+            "fingerprint": fingerprint,
+            "models": self._fields,
+        }
+        save_state(self.state_file, state, "schema cache")
@@ -0,0 +1,83 @@
+import contextlib
+import os
+import sys
+import tempfile
+
+import uvicorn
+from dotenv import load_dotenv
+from mcp.server.fastmcp import FastMCP
+
+from .config import OdooConfig
+from .odoo_mcp_server import OdooMCPServer
+from .store import SHARED_STATE_FILE, SharedStore
+
+# Import string of the app factory each worker process calls
+APP_FACTORY = "mcpserver.serving:create_app"
+
+
+def create_app(mcp: FastMCP = None, config: OdooConfig = None):
+    """
+    Build an initialized server and return its ASGI app. With several
+    workers uvicorn calls this once in every worker process.
+    """
+    if config is None:
+        load_dotenv()
+        config = OdooConfig()
+    mcp = mcp or FastMCP("Odoo MCP Server")
+    server = OdooMCPServer(mcp, config)
+    server.initialize_server()
+    return http_app(mcp, server, config)
+
+
+def http_app(mcp: FastMCP, server: OdooMCPServer, config: OdooConfig):
+    """
+    The ASGI app of ``mcp`` for ``config.transport``; shutting it down
+    closes ``server``'s Odoo connections once requests have drained.
+    """
+    if config.workers > 1:
+        # Requests of one client land on any worker, so none can hold its session
+        mcp.settings.stateless_http = True
+    app = mcp.sse_app() if config.transport == "sse" else mcp.streamable_http_app()
+
+    mcp_lifespan = app.router.lifespan_context
+
+    @contextlib.asynccontextmanager
+    async def lifespan(app):
+        async with mcp_lifespan(app):
+            yield
+        server.close()
+        print(f"[Info] Worker {os.getpid()} stopped", file=sys.stderr)
+
+    app.router.lifespan_context = lifespan
+    return app
+
+
+def serve(config: OdooConfig, mcp: FastMCP = None):
+    """
+    Serve over HTTP until interrupted. On SIGINT/SIGTERM new connections are
+    refused and in-flight requests get ``config.drain_seconds`` to finish.
+    """
+    options = {
+        "host": config.host,
+        "port": config.port,
+        "timeout_graceful_shutdown": config.drain_seconds,
+    }
+    if config.workers == 1:
+        uvicorn.run(create_app(mcp, config), **options)
+        return
+
+    with contextlib.ExitStack() as stack:
+        if not config.shared_state_dir:
+            # Workers inherit the environment, and with it this directory
+            config.shared_state_dir = stack.enter_context(
+                tempfile.TemporaryDirectory(prefix="odoo-mcp-")
+            )
+            os.environ["ODOO_SHARED_STATE_DIR"] = config.shared_state_dir
+        os.makedirs(config.shared_state_dir, exist_ok=True)
+        # Metrics of an earlier run would be summed with this one's
+        SharedStore(os.path.join(config.shared_state_dir, SHARED_STATE_FILE)).clear_metrics()
+        print(
+            f"[Info] Starting {config.workers} workers sharing {config.shared_state_dir}",
+            file=sys.stderr,
+        )
+        uvicorn.run(APP_FACTORY, factory=True, workers=config.workers, **options)
@@ -0,0 +1,88 @@
+import json
+
+# "text" is the human-readable layout of the text tools; "records" is a list
+# of flat dicts and "columns" one list of column names plus a row per record
+RESPONSE_FORMATS = ("text", "records", "columns")
+
+
+def check_format(response_format: str, allowed=RESPONSE_FORMATS):
+    """Return an error message if ``response_format`` is not one of ``allowed``."""
+    if response_format not in allowed:
+        return f"Unsupported format: {response_format}. Use one of {', '.join(allowed)}."
+    return None
+
+
+def project(requested, default, required=("id",)) -> list:
+    """
+    The fields to read: ``requested`` (or ``default``) plus ``required``,
+    without duplicates, in order.
+    """
+    fields = list(required)
+    for field in requested or default:
+        if field not in fields:
+            fields.append(field)
+    return fields
+
+
+def compact_value(value):
+    """Many2one ``[id, name]`` pairs become their name; other values pass through."""
+    if (
+        isinstance(value, list)
+        and len(value) == 2
+        and isinstance(value[0], int)
+        and isinstance(value[1], str)
+    ):
+        return value[1]
+    return value
+
+
+def shape_records(records, fields, response_format: str = "records"):
+    """Keep ``fields`` of each record, compacted, as ``records`` or ``columns``."""
+    if response_format == "columns":
+        return {
+            "columns": list(fields),
+            "rows": [[compact_value(record.get(f)) for f in fields] for record in records],
+        }
+    return [{f: compact_value(record.get(f)) for f in fields} for record in records]
+
+
+def shape_within_budget(records, fields, response_format: str, max_bytes: int):
+    """
+    ``shape_records`` of as many leading ``records`` as fit in ``max_bytes``.
+    Returns the shaped result and how many records it holds.
+    """
+    shaped = shape_records(records, fields, response_format)
+    rows = shaped["rows"] if response_format == "columns" else shaped
+    kept = fit_to_budget(rows, max_bytes)
+    del rows[kept:]
+    return shaped, kept
+
+
+def to_json(value) -> str:
+    """
+    Serialize ``value`` without whitespace. Returning this instead of a dict
+    skips FastMCP's indented rendering, which is several times larger.
+    """
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+def encoded_size(value) -> int:
+    """Bytes ``value`` takes in a response."""
+    if isinstance(value, str):
+        return len(value.encode())
+    return len(to_json(value).encode())
+
+
+def fit_to_budget(items, max_bytes: int) -> int:
+    """
+    Return how many leading ``items`` fit in ``max_bytes`` once encoded.
+    At least one item is always kept so callers make progress.
+    """
+    if not max_bytes:
+        return len(items)
+    used = 0
+    for count, item in enumerate(items):
+        used += encoded_size(item) + 2  # separator
+        if used > max_bytes and count:
+            return count
+    return len(items)
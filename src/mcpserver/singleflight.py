@@ -0,0 +1,75 @@
+import threading
+from collections import Counter
+
+from .cache import RELATED_MODELS
+
+
+class _Call:
+    def __init__(self, model: str):
+        self.model = model
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Coalesces identical concurrent Odoo reads.
+
+    While a call for a key is in flight, further calls for the same key wait
+    for it and share its result (or its error) instead of making their own
+    round trip. A write to a model ``forget``s the in-flight reads of that
+    model and its related models, so reads issued after the write start a
+    fresh call.
+    """
+
+    def __init__(self):
+        self.calls = Counter()
+        self.coalesced = Counter()
+
+        self._in_flight = {}  # key -> _Call
+        self._lock = threading.Lock()
+
+    def do(self, key: str, model: str, fn):
+        """Return ``fn()``, sharing one execution among concurrent callers of ``key``."""
+        with self._lock:
+            call = self._in_flight.get(key)
+            leader = call is None
+            if leader:
+                call = self._in_flight[key] = _Call(model)
+                self.calls[model] += 1
+            else:
+                self.coalesced[model] += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                if self._in_flight.get(key) is call:
+                    del self._in_flight[key]
+            call.done.set()
+
+    def forget(self, model: str):
+        """Stop sharing the in-flight reads of ``model`` and its related models."""
+        models = {model, *RELATED_MODELS.get(model, ())}
+        with self._lock:
+            for key in [k for k, call in self._in_flight.items() if call.model in models]:
+                del self._in_flight[key]
+
+    def stats(self) -> dict:
+        """Return per-model counts of executed and coalesced calls."""
+        with self._lock:
+            return {
+                model: {"calls": self.calls[model], "coalesced": self.coalesced[model]}
+                for model in sorted(set(self.calls) | set(self.coalesced))
+            }
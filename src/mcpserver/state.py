@@ -0,0 +1,47 @@
+import json
+import os
+import sys
+import tempfile
+
+
+def load_state(path: str, version: int, identity: dict, what: str):
+    """
+    The JSON state saved in ``path``, or None if there is none, it is
+    unreadable, or it was saved by another ``version`` or for another Odoo
+    ``identity``. ``what`` names the state in error messages.
+    """
+    if not path or not os.path.exists(path):
+        return None
+    try:
+        with open(path, encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"[Error] Ignoring unreadable {what} {path}: {e}", file=sys.stderr)
+        return None
+    if state.get("version") != version or state.get("identity") != identity:
+        return None
+    return state
+
+
+def save_state(path: str, state: dict, what: str):
+    """
+    Write ``state`` to ``path`` as JSON, replacing the old file at once.
+    Each save writes its own temporary file, so worker processes saving the
+    same state do not clobber each other's; the last one to finish wins.
+    """
+    if not path:
+        return
+    directory = os.path.dirname(path) or "."
+    tmp_file = None
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_file = tempfile.mkstemp(
+            dir=directory, prefix=f"{os.path.basename(path)}.", suffix=".tmp"
+        )
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp_file, path)
+    except OSError as e:
+        print(f"[Error] Could not save the {what} to {path}: {e}", file=sys.stderr)
+        if tmp_file is not None and os.path.exists(tmp_file):
+            os.remove(tmp_file)
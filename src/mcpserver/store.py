@@ -0,0 +1,109 @@
+import sqlite3
+import threading
+import time
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS generations (model TEXT PRIMARY KEY, value INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS cache (
+    key TEXT PRIMARY KEY, model TEXT NOT NULL, expires REAL NOT NULL, value TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS cache_model ON cache (model);
+CREATE TABLE IF NOT EXISTS metrics (worker TEXT PRIMARY KEY, updated REAL NOT NULL, text TEXT NOT NULL);
+"""
+
+# Name of the store's file in the shared state directory
+SHARED_STATE_FILE = "shared-state.sqlite"
+
+# Expired cache rows are deleted once every this many writes
+PRUNE_EVERY = 256
+
+
+class SharedStore:
+    """
+    State shared by the worker processes of one deployment, in a SQLite file.
+
+    Holds a second-level cache of Odoo reads, a generation counter per model
+    that is bumped on every write so each worker's in-memory cache notices
+    writes made by the others, and the latest metrics of every worker.
+    Each thread uses its own connection.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        self._writes = 0
+        self._db().executescript(_SCHEMA)
+
+    def _db(self) -> sqlite3.Connection:
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            self._local.db = db
+        return db
+
+    # --- Cache ---
+
+    def generation(self, model: str) -> int:
+        row = self._db().execute("SELECT value FROM generations WHERE model = ?", (model,)).fetchone()
+        return row[0] if row else 0
+
+    def bump(self, models):
+        """Mark ``models`` as written to and drop their shared cache entries."""
+        db = self._db()
+        with db:
+            db.execute("BEGIN IMMEDIATE")
+            for model in models:
+                db.execute(
+                    "INSERT INTO generations VALUES (?, 1) "
+                    "ON CONFLICT (model) DO UPDATE SET value = value + 1",
+                    (model,),
+                )
+                db.execute("DELETE FROM cache WHERE model = ?", (model,))
+
+    def get(self, key: str):
+        """Return ``(serialized value, seconds left)`` of a live entry, or None."""
+        row = self._db().execute("SELECT value, expires FROM cache WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        left = row[1] - time.time()
+        return (row[0], left) if left > 0 else None
+
+    def set(self, key: str, model: str, value: str, ttl: float, generation: int = None) -> bool:
+        """
+        Store an entry, unless ``model`` has moved past ``generation`` (the
+        generation its value was read at); True if it was stored.
+        """
+        db = self._db()
+        if generation is None:
+            db.execute(
+                "INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?)",
+                (key, model, time.time() + ttl, value),
+            )
+            stored = True
+        else:
+            # One statement, so a bump cannot land between the check and the insert
+            stored = db.execute(
+                "INSERT OR REPLACE INTO cache SELECT ?, ?, ?, ? "
+                "WHERE COALESCE((SELECT value FROM generations WHERE model = ?), 0) = ?",
+                (key, model, time.time() + ttl, value, model, generation),
+            ).rowcount > 0
+        self._writes += 1
+        if self._writes % PRUNE_EVERY == 0:
+            db.execute("DELETE FROM cache WHERE expires < ?", (time.time(),))
+        return stored
+
+    # --- Metrics ---
+
+    def publish_metrics(self, worker: str, text: str):
+        self._db().execute(
+            "INSERT OR REPLACE INTO metrics VALUES (?, ?, ?)", (worker, time.time(), text)
+        )
+
+    def clear_metrics(self):
+        self._db().execute("DELETE FROM metrics")
+
+    def metrics(self) -> list:
+        """The latest metrics text of every worker."""
+        return [row[0] for row in self._db().execute("SELECT text FROM metrics ORDER BY worker")]
@@ -0,0 +1,357 @@
+import sys
+import threading
+import time
+
+from .cache import MISS, RELATED_MODELS
+from .keyset import iter_by_id
+from .state import load_state, save_state
+
+# Fields kept in the local replica of each model
+SYNC_FIELDS = {
+    "product.product": ["name", "list_price", "description_sale", "default_code", "active"],
+    "res.partner": ["name", "email", "active"],
+    "account.journal": [
+        "name",
+        "type",
+        "inbound_payment_method_line_ids",
+        "outbound_payment_method_line_ids",
+        "active",
+    ],
+    "sale.order": [
+        "name",
+        "date_order",
+        "state",
+        "order_line",
+        "amount_total",
+        "currency_id",
+        "partner_id",
+    ],
+}
+
+DEFAULT_SYNC_MODELS = ("product.product", "res.partner", "account.journal")
+
+# Records read per ``search_read`` call while syncing
+SYNC_FETCH_CHUNK_SIZE = 5000
+
+STATE_VERSION = 1
+
+
+class UnsupportedQuery(Exception):
+    """The replica cannot answer this query; it must go to Odoo."""
+
+
+def _match_leaf(record, leaf):
+    field, operator, value = leaf
+    if "." in field or field not in record:
+        raise UnsupportedQuery(field)
+    current = record[field]
+    if isinstance(current, list):
+        if len(current) != 2 or not isinstance(current[0], int) or not isinstance(current[1], str):
+            # x2many fields are not evaluated locally
+            raise UnsupportedQuery(field)
+        # many2one [id, name] matches on its name for like, on its id otherwise
+        current = current[1] if operator in ("ilike", "like") else current[0]
+    match operator:
+        case "=":
+            return current == value
+        case "!=":
+            return current != value
+        case "in":
+            return current in value
+        case "not in":
+            return current not in value
+        case "ilike":
+            return str(value).lower() in str(current).lower()
+        case "like":
+            return str(value) in str(current)
+        case ">":
+            return current is not False and current > value
+        case ">=":
+            return current is not False and current >= value
+        case "<":
+            return current is not False and current < value
+        case "<=":
+            return current is not False and current <= value
+    raise UnsupportedQuery(operator)
+
+
+def _match(record, domain) -> bool:
+    """Evaluate an Odoo domain (prefix notation, implicit AND) against a record."""
+    stack = []
+    for term in reversed(domain):
+        if term in ("&", "|"):
+            first, second = stack.pop(), stack.pop()
+            stack.append(first and second if term == "&" else first or second)
+        elif term == "!":
+            stack.append(not stack.pop())
+        else:
+            stack.append(_match_leaf(record, term))
+    return all(stack)
+
+
+def _mentions(domain, field) -> bool:
+    return any(isinstance(term, (list, tuple)) and term[0] == field for term in domain)
+
+
+class ModelReplica:
+    """
+    Local copy of the synced fields of one Odoo model.
+
+    Answers ``search_read`` and ``read`` calls in memory, including archived
+    record filtering, for domains built from plain field comparisons.
+    """
+
+    def __init__(self, model: str, fields, lang: str = "en_US"):
+        self.model = model
+        self.fields = list(fields)
+        self.lang = lang
+        self.has_active = "active" in self.fields
+        self.watermark = None
+        self.synced_at = None  # wall clock of the last successful sync
+        self.generation = 0  # writes to the model through this server
+        self.synced_generation = None  # generation the last successful sync started at
+        self.records = {}
+        self._lock = threading.RLock()
+
+    @property
+    def stale(self) -> bool:
+        """True until a sync that started after the last write has succeeded."""
+        return self.synced_generation != self.generation
+
+    def mark_written(self):
+        with self._lock:
+            self.generation += 1
+
+    # --- Sync ---
+
+    def pull(self, fetch) -> bool:
+        """Pull records written since the watermark; True if anything changed."""
+        domain = [["active", "in", [True, False]]] if self.has_active else []
+        if self.watermark:
+            # ">=" so records written in the same second are not missed
+            domain.append(["write_date", ">=", self.watermark])
+
+        changed = False
+        watermark = self.watermark
+        for rows in iter_by_id(
+            fetch,
+            self.model,
+            domain,
+            self.fields + ["write_date"],
+            SYNC_FETCH_CHUNK_SIZE,
+            context={"lang": self.lang},
+        ):
+            with self._lock:
+                for row in rows:
+                    if self.records.get(row["id"]) != row:
+                        self.records[row["id"]] = row
+                        changed = True
+                    if row.get("write_date") and (watermark is None or row["write_date"] > watermark):
+                        watermark = row["write_date"]
+
+        self.watermark = watermark
+        return changed
+
+    def reconcile(self, fetch) -> bool:
+        """Drop records deleted in Odoo; True if anything was removed."""
+        domain = [["active", "in", [True, False]]] if self.has_active else []
+        ids = set(fetch(self.model, "search", [domain], {}))
+        with self._lock:
+            deleted = [record_id for record_id in self.records if record_id not in ids]
+            for record_id in deleted:
+                del self.records[record_id]
+        return bool(deleted)
+
+    # --- Queries ---
+
+    def _project(self, record, fields):
+        return {"id": record["id"], **{field: record[field] for field in fields if field != "id"}}
+
+    def _check_fields(self, fields):
+        if not fields or any(f != "id" and f not in self.fields for f in fields):
+            raise UnsupportedQuery("fields")
+
+    def search_read(self, args, kwargs):
+        domain = args[0] if args else kwargs.get("domain", [])
+        fields = args[1] if len(args) > 1 else kwargs.get("fields")
+        self._check_fields(fields)
+        if self.has_active and not _mentions(domain, "active"):
+            domain = [["active", "=", True]] + list(domain)
+
+        if not kwargs.get("order") and (kwargs.get("limit") or kwargs.get("offset")):
+            # Which records a page holds depends on the model's _order, which
+            # the replica does not know (res.partner: complete_name, id desc)
+            raise UnsupportedQuery("order")
+
+        with self._lock:
+            records = [r for r in self.records.values() if _match(r, domain)]
+
+        for part in reversed((kwargs.get("order") or "id").split(",")):
+            field, _, direction = part.strip().partition(" ")
+            if field != "id" and field not in self.fields:
+                raise UnsupportedQuery(field)
+            records.sort(
+                key=lambda r: (r[field] is False, r[field]),
+                reverse=direction.strip().lower() == "desc",
+            )
+
+        offset = kwargs.get("offset") or 0
+        limit = kwargs.get("limit")
+        records = records[offset : offset + limit if limit else None]
+        return [self._project(r, fields) for r in records]
+
+    def read(self, args, kwargs):
+        ids = [args[0]] if isinstance(args[0], int) else list(args[0])
+        fields = args[1] if len(args) > 1 else kwargs.get("fields")
+        self._check_fields(fields)
+        with self._lock:
+            if any(record_id not in self.records for record_id in ids):
+                raise UnsupportedQuery("ids")
+            return [self._project(self.records[record_id], fields) for record_id in ids]
+
+    # --- Persistence ---
+
+    def dump(self) -> dict:
+        with self._lock:
+            return {
+                "fields": self.fields,
+                "lang": self.lang,
+                "watermark": self.watermark,
+                "synced_at": self.synced_at,
+                "records": list(self.records.values()),
+            }
+
+    def load(self, state: dict):
+        if state.get("fields") != self.fields or state.get("lang") != self.lang:
+            return
+        with self._lock:
+            self.records = {row["id"]: row for row in state.get("records", [])}
+            self.watermark = state.get("watermark")
+            self.synced_at = state.get("synced_at")
+            self.synced_generation = self.generation
+
+
+class SyncEngine:
+    """
+    Keeps local replicas of selected models in step with Odoo.
+
+    A background thread pulls records changed since each model's
+    ``write_date`` watermark every ``interval`` seconds and reconciles the id
+    sets every ``reconcile_interval`` seconds to drop deleted records. State
+    is persisted to ``state_file`` so a restart starts warm. Reads are served
+    from a replica only while its last sync is younger than ``max_staleness``
+    and no write through this server has touched the model since.
+
+    ``fetch(model, method, args, kwargs)`` performs the uncached Odoo call.
+    """
+
+    def __init__(
+        self,
+        fetch,
+        models=DEFAULT_SYNC_MODELS,
+        interval: float = 30,
+        reconcile_interval: float = 600,
+        max_staleness: float = 300,
+        state_file: str = None,
+        identity: dict = None,
+        lang: str = "en_US",
+    ):
+        self.replicas = {model: ModelReplica(model, SYNC_FIELDS[model], lang) for model in models}
+        self.interval = interval
+        self.reconcile_interval = reconcile_interval
+        self.max_staleness = max_staleness
+        self.state_file = state_file
+        self.identity = identity or {}
+
+        self._fetch = fetch
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+        self._reconciled_at = 0.0
+        self._load_state()
+
+    # --- Scheduling ---
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="odoo-sync", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        self._wake.set()
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self.sync_once()
+            self._wake.wait(self.interval)
+            self._wake.clear()
+
+    def sync_once(self):
+        """Pull every replica once, reconciling deletions when due."""
+        reconcile = time.monotonic() - self._reconciled_at >= self.reconcile_interval
+        changed = False
+        for replica in self.replicas.values():
+            # Taken first: a write landing mid-pull keeps the replica stale
+            generation = replica.generation
+            try:
+                changed |= replica.pull(self._fetch)
+                if reconcile:
+                    changed |= replica.reconcile(self._fetch)
+                replica.synced_at = time.time()
+                replica.synced_generation = generation
+            except Exception as e:
+                replica.synced_generation = None
+                print(f"[Error] Syncing {replica.model} failed: {e}", file=sys.stderr)
+        if reconcile:
+            self._reconciled_at = time.monotonic()
+        if changed:
+            self._save_state()
+
+    def notify_write(self, model: str):
+        """
+        Stop serving ``model`` and its related models from their replicas
+        until they are synced again, and sync right away.
+        """
+        for name in (model, *RELATED_MODELS.get(model, ())):
+            replica = self.replicas.get(name)
+            if replica is not None:
+                replica.mark_written()
+                self._wake.set()
+
+    # --- Reads ---
+
+    def serve(self, model: str, method: str, args, kwargs):
+        """Answer a read from the replica, or return ``MISS`` to go to Odoo."""
+        replica = self.replicas.get(model)
+        if replica is None or method not in ("search_read", "read") or replica.stale:
+            return MISS
+        if replica.synced_at is None or time.time() - replica.synced_at > self.max_staleness:
+            return MISS
+        if (kwargs.get("context") or {}).get("lang", replica.lang) != replica.lang:
+            return MISS
+        if set(kwargs) - {"fields", "offset", "limit", "order", "context", "domain"}:
+            return MISS
+        try:
+            if method == "search_read":
+                return replica.search_read(args, kwargs)
+            return replica.read(args, kwargs)
+        except (UnsupportedQuery, TypeError, ValueError):
+            return MISS
+
+    # --- Persistence ---
+
+    def _load_state(self):
+        state = load_state(self.state_file, STATE_VERSION, self.identity, "sync state")
+        if state is None:
+            return
+        for model, replica_state in state.get("models", {}).items():
+            if model in self.replicas:
+                self.replicas[model].load(replica_state)
+
+    def _save_state(self):
+        state = {
+            "version": STATE_VERSION,
+            "identity": self.identity,
+            "models": {model: replica.dump() for model, replica in self.replicas.items()},
+        }
+        save_state(self.state_file, state, "sync state")
@@ -0,0 +1,274 @@
+import contextvars
+import json
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+import xmlrpc.client
+
+from .breaker import CircuitBreaker, is_access_denied, is_connection_failure
+
+DEFAULT_TENANT = "default"
+
+# Name of the tenant the current tool call is running for
+current_tenant = contextvars.ContextVar("odoo_tenant", default=None)
+
+
+class TenantProfile:
+    """Connection settings of one Odoo database."""
+
+    def __init__(
+        self,
+        name: str,
+        url: str,
+        database: str,
+        username: str,
+        password: str,
+        pool_size: int = None,
+    ):
+        self.name = name
+        self.url = url
+        self.database = database
+        self.username = username
+        self.password = password
+        self.pool_size = pool_size
+
+
+def load_profiles(path: str) -> dict:
+    """
+    Read tenant profiles from a JSON file shaped like::
+
+        {"acme": {"url": "https://acme.odoo.com", "database": "acme",
+                  "username": "bot", "password_env": "ACME_PASSWORD",
+                  "pool_size": 2}}
+
+    ``password_env`` names an environment variable holding the password and
+    may be used instead of ``password``. Raises ``ValueError`` on bad input.
+    """
+    with open(path, encoding="utf-8") as f:
+        raw = json.load(f)
+    if not isinstance(raw, dict):
+        raise ValueError("expected an object mapping tenant names to profiles")
+
+    profiles = {}
+    for name, entry in raw.items():
+        if not isinstance(entry, dict):
+            raise ValueError(f"tenant {name}: expected an object")
+        password = entry.get("password")
+        if password is None and entry.get("password_env"):
+            password = os.getenv(entry["password_env"])
+        missing = [
+            key
+            for key, value in (
+                ("url", entry.get("url")),
+                ("database", entry.get("database")),
+                ("username", entry.get("username")),
+                ("password", password),
+            )
+            if not value
+        ]
+        if missing:
+            raise ValueError(f"tenant {name}: missing {', '.join(missing)}")
+        pool_size = entry.get("pool_size")
+        if pool_size is not None and (not isinstance(pool_size, int) or pool_size <= 0):
+            raise ValueError(f"tenant {name}: pool_size must be a positive integer")
+        profiles[name] = TenantProfile(
+            name, entry["url"], entry["database"], entry["username"], password, pool_size
+        )
+    return profiles
+
+
+class Tenant:
+    """
+    A tenant with an open connection pool. ``uid`` is None until the first
+    call authenticates, and again after Odoo rejects it.
+    """
+
+    def __init__(self, profile: TenantProfile, pool, breaker: CircuitBreaker):
+        self.profile = profile
+        self.pool = pool
+        self.breaker = breaker
+        self.uid = None
+        self.leases = 0
+        self.last_used = time.monotonic()
+        self._auth_lock = threading.Lock()
+
+    def _authenticate(self) -> int:
+        with self.pool.connection() as connection:
+            uid = connection.authenticate(
+                self.profile.database, self.profile.username, self.profile.password
+            )
+        if not uid:
+            raise PermissionError(f"Odoo rejected the login of tenant {self.profile.name}")
+        return uid
+
+    def _ensure_uid(self, stale_uid=None) -> int:
+        """Authenticate once, or again if ``stale_uid`` was rejected."""
+        with self._auth_lock:
+            if self.uid is None or self.uid == stale_uid:
+                self.uid = None
+                self.uid = self._authenticate()
+            return self.uid
+
+    def connect(self) -> int:
+        """Open a pooled connection and authenticate now instead of on the first call."""
+        return self.call(lambda connection, uid: uid)
+
+    def call(self, fn):
+        """
+        Return ``fn(connection, uid)`` run on a pooled connection.
+
+        Authenticates on first use and, if Odoo denies access (the password
+        changed or the user was reset), re-authenticates and retries once.
+        Connection failures feed the circuit breaker, which fails calls fast
+        with ``OdooUnavailable`` while Odoo is down.
+        """
+        self.breaker.allow()
+        stale_uid = None
+        for attempt in range(2):
+            uid = None
+            try:
+                uid = self._ensure_uid(stale_uid)
+                with self.pool.connection() as connection:
+                    result = fn(connection, uid)
+            except xmlrpc.client.Fault as e:
+                self.breaker.success()
+                # A rejected login is final; a rejected call may be a stale uid
+                if attempt == 0 and uid is not None and is_access_denied(e):
+                    print(
+                        f"[Info] Odoo denied access to tenant {self.profile.name}, re-authenticating",
+                        file=sys.stderr,
+                    )
+                    stale_uid = uid
+                    continue
+                raise
+            except Exception as e:
+                if is_connection_failure(e):
+                    self.breaker.failure()
+                raise
+            self.breaker.success()
+            return result
+
+
+class TenantRegistry:
+    """
+    Routes Odoo calls to one of many databases.
+
+    A tenant's connection pool is opened through ``open_pool(profile)`` on
+    first use, and it authenticates with its first call. At most
+    ``max_active`` tenants keep a pool open; when another one is needed, the
+    least recently used tenant that no call is using is closed. It is
+    reopened the next time it is used. Each tenant has a circuit breaker
+    that outlives eviction.
+    """
+
+    def __init__(
+        self,
+        profiles: dict,
+        open_pool,
+        max_active: int = 16,
+        default: str = DEFAULT_TENANT,
+        breaker_threshold: int = 3,
+        breaker_backoff: float = 1,
+        breaker_max_backoff: float = 60,
+    ):
+        self.profiles = profiles
+        self.max_active = max_active
+        self.default = default
+        self.evictions = 0
+        self.breakers = {
+            name: CircuitBreaker(name, breaker_threshold, breaker_backoff, breaker_max_backoff)
+            for name in profiles
+        }
+
+        self._open_pool = open_pool
+        self._active = OrderedDict()  # name -> Tenant, least recently used first
+        self._lock = threading.Lock()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.profiles
+
+    def names(self) -> list:
+        return sorted(self.profiles)
+
+    def get(self, name: str = None) -> Tenant:
+        """Return the tenant ``name`` (default tenant if None), opening its pool if needed."""
+        name = name or self.default
+        if name not in self.profiles:
+            raise KeyError(f"Unknown tenant: {name}")
+
+        tenant = self._touch(name)
+        if tenant is not None:
+            return tenant
+
+        # Opening a pool makes no network calls, so it is done under the lock
+        with self._lock:
+            tenant = self._active.get(name)
+            if tenant is None:
+                profile = self.profiles[name]
+                tenant = Tenant(profile, self._open_pool(profile), self.breakers[name])
+                self._active[name] = tenant
+                self._evict()
+            return tenant
+
+    def _touch(self, name: str):
+        with self._lock:
+            tenant = self._active.get(name)
+            if tenant is not None:
+                self._active.move_to_end(name)
+                tenant.last_used = time.monotonic()
+            return tenant
+
+    def _evict(self):
+        # Caller holds self._lock. Tenants in use are skipped, so the number
+        # of open pools may exceed max_active while they all are busy.
+        for name in list(self._active):
+            if len(self._active) <= self.max_active:
+                break
+            tenant = self._active[name]
+            if tenant.leases:
+                continue
+            del self._active[name]
+            tenant.pool.close()
+            self.evictions += 1
+            print(f"[Info] Closed idle Odoo tenant {name}", file=sys.stderr)
+
+    @contextmanager
+    def lease(self, name: str = None):
+        """Use tenant ``name`` for the duration of the block; it is not evicted meanwhile."""
+        name = name or self.default
+        while True:
+            tenant = self.get(name)
+            with self._lock:
+                # It may have been evicted between get() and here
+                if self._active.get(name) is tenant:
+                    tenant.leases += 1
+                    break
+        try:
+            yield tenant
+        finally:
+            with self._lock:
+                tenant.leases -= 1
+                self._evict()
+
+    def connect(self, name: str = None) -> int:
+        """Open tenant ``name``'s pool and authenticate; calls made meanwhile wait for it."""
+        with self.lease(name) as tenant:
+            return tenant.connect()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "active": list(self._active),
+                "max_active": self.max_active,
+                "evictions": self.evictions,
+                "open_circuits": [name for name, breaker in self.breakers.items() if breaker.is_open],
+            }
+
+    def close(self):
+        with self._lock:
+            for tenant in self._active.values():
+                tenant.pool.close()
+            self._active.clear()
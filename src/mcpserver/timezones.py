@@ -0,0 +1,75 @@
+import sys
+import threading
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+FALLBACK_TIMEZONE = "UTC"
+
+
+def _zone(name: str):
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError):
+        print(f"[Error] Unknown timezone {name}, using {FALLBACK_TIMEZONE}", file=sys.stderr)
+        return timezone.utc
+
+
+class TimezoneService:
+    """
+    Converts Odoo's UTC timestamps (``YYYY-MM-DD HH:MM:SS``) to local time.
+
+    The zone is ``configured`` if set, else the Odoo user's ``tz`` as
+    returned by ``fetch_user_context()`` (``res.users.context_get``), else
+    UTC. It is resolved once per ``scope`` (tenant) and cached.
+    ``format_many`` converts a whole result set, looking the UTC offset up
+    once per quarter hour instead of once per timestamp: zones with a
+    :30 or :45 offset (America/St_Johns, Asia/Kathmandu) change it on the
+    quarter hour in UTC.
+    """
+
+    def __init__(self, configured: str = None, fetch_user_context=None):
+        self.configured = configured
+        self._fetch_user_context = fetch_user_context
+        self._zones = {}  # scope -> zone
+        self._lock = threading.Lock()
+
+    def zone(self, scope: str = None):
+        zone = self._zones.get(scope)
+        if zone is not None:
+            return zone
+
+        if self.configured:
+            zone = _zone(self.configured)
+        else:
+            context = self._fetch_user_context() if self._fetch_user_context else None
+            if not isinstance(context, dict):
+                # Odoo could not be asked; try again next time
+                return timezone.utc
+            zone = _zone(context.get("tz") or FALLBACK_TIMEZONE)
+        with self._lock:
+            self._zones[scope] = zone
+        return zone
+
+    def format(self, value: str, scope: str = None) -> str:
+        """Return ``value`` in local time, in the same format; falsy values pass through."""
+        return self.format_many([value], scope)[0]
+
+    def format_many(self, values, scope: str = None) -> list:
+        """Convert many timestamps in one pass; see ``format``."""
+        zone = self.zone(scope)
+        offsets = {}  # ("YYYY-MM-DD HH", quarter) -> UTC offset of that quarter hour
+        results = []
+        for value in values:
+            if not value:
+                results.append(value)
+                continue
+            # fromisoformat is several times faster than strptime
+            utc = datetime.fromisoformat(value)
+            quarter = (value[:13], utc.minute // 15)
+            offset = offsets.get(quarter)
+            if offset is None:
+                offset = offsets[quarter] = (
+                    utc.replace(tzinfo=timezone.utc).astimezone(zone).utcoffset() or timedelta()
+                )
+            results.append((utc + offset).isoformat(sep=" "))
+        return results
@@ -1,80 +1,810 @@
-from typing import Any, List
-from mcp.server.fastmcp import FastMCP
-from datetime import datetime
-import pytz
+from typing import Annotated, Any, Dict, List, Optional
+from mcp.server.fastmcp import Context, FastMCP
+from pydantic import Field
+import anyio
+import base64
+import contextlib
+import functools
+import contextvars
+import inspect
+import weakref
+import json
+import os
+import sys
+import threading
+import time
 import xmlrpc
 import traceback
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from .admission import (
+    BACKGROUND,
+    BULK,
+    INTERACTIVE,
+    LANES,
+    WRITE,
+    AdaptiveLimiter,
+    ToolCall,
+    current_call,
+)
+from .breaker import OdooUnavailable, is_connection_failure
+from .connection import PoolExhausted
+from .export import EXPORT_FORMATS, EXPORT_PAGE_BYTES, WRITERS, export_model, page_count, read_page
+from .keyset import iter_by_id
+from .cache import MISS, READ_METHODS, RELATED_MODELS, OdooCache, call_key
+from .metrics import Metrics, merge_expositions
+from .schema import SchemaCache, UnknownFields
+from .shaping import (
+    check_format,
+    compact_value,
+    fit_to_budget,
+    project,
+    shape_records,
+    shape_within_budget,
+    to_json,
+)
+from .singleflight import SingleFlight
+from .tenants import current_tenant
+from .timezones import TimezoneService
+from .sync import SyncEngine
+
+# Maximum number of ``sale.order.line`` ids read per ``execute_kw`` call.
+ORDER_LINE_CHUNK_SIZE = 1000
+
+ORDER_LINE_FIELDS = [
+    "product_id",
+    "name",
+    "price_unit",
+    "product_uom_qty",
+    "price_subtotal",
+]
+
+# Order line fields in the structured formats of get_order_details
+ORDER_LINE_OUTPUT_FIELDS = ["product_id", "product_uom_qty", "price_unit", "price_subtotal"]
+
+PRODUCT_FIELDS = ["name", "list_price"]
+
+PRODUCT_DETAIL_FIELDS = ["name", "list_price", "description_sale"]
+
+# Default number of products per get_products page
+PRODUCT_PAGE_SIZE = 200
+
+# Maximum number of products read per ``execute_kw`` call while paging.
+PRODUCT_FETCH_CHUNK_SIZE = 1000
+
+# Maximum number of orders created per ``execute_kw`` call by create_orders_bulk.
+ORDER_BULK_CHUNK_SIZE = 100
+
+# Partners read per customer name when several names are resolved in one search
+PARTNER_MATCHES_PER_NAME = 20
+
+ORDER_DISPLAY_FIELDS = [
+    "name",
+    "date_order",
+    "state",
+    "order_line",
+    "amount_total",
+    "currency_id",
+]
+
+# Seconds between two publications of a worker's metrics to the shared store
+METRICS_PUBLISH_INTERVAL = 5
+
+# Extra Odoo calls one bulk_create/bulk_write call spends isolating rejected records
+BULK_RETRY_CALLS = 32
+
+# get_sales_summary group-by names -> ``sale.report`` fields
+SALES_GROUP_FIELDS = {
+    "partner": "partner_id",
+    "product": "product_id",
+    "salesperson": "user_id",
+    "state": "state",
+    "date": "date",
+}
+
+DATE_GRANULARITIES = ("day", "week", "month", "quarter", "year")
+
+# get_sales_summary measure names -> ``sale.report`` fields
+SALES_MEASURE_FIELDS = {
+    "amount_total": "price_total",
+    "amount_untaxed": "price_subtotal",
+    "quantity": "product_uom_qty",
+    "quantity_delivered": "qty_delivered",
+    "quantity_invoiced": "qty_invoiced",
+}
+
+# Default number of groups returned by get_sales_summary
+SALES_SUMMARY_LIMIT = 100
+
+# Error of the records a bulk tool did not send once Odoo failed
+NOT_SENT = "Not sent, as Odoo failed on an earlier chunk; retry later."
+
+# get_order_details calls reading at most this many orders are interactive
+INTERACTIVE_ORDER_COUNT = 10
+
+
+def _encode_cursor(last_id: int) -> str:
+    """Build the opaque continuation token returned by paged tools."""
+    return base64.urlsafe_b64encode(json.dumps({"after": last_id}).encode()).decode()
+
+
+def _order_details_lane(arguments: dict) -> str:
+    """Lookups of a few orders go in the interactive lane, larger reads in the bulk lane."""
+    limits, order_ids = arguments.get("limits"), arguments.get("order_ids")
+    count = limits if isinstance(limits, int) and limits > 0 else None
+    if order_ids:
+        count = len(order_ids) if count is None else min(count, len(order_ids))
+    return INTERACTIVE if count is not None and count <= INTERACTIVE_ORDER_COUNT else BULK
+
+
+def _decode_cursor(cursor: str) -> int:
+    """Return the last id seen from a continuation token."""
+    try:
+        after = json.loads(base64.urlsafe_b64decode(cursor.encode()))["after"]
+    except (ValueError, TypeError, KeyError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    if not isinstance(after, int):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return after
 
 
 class OdooTools:
 
     def __init__(self, mcp: FastMCP, config, odoo_server):
         self.mcp = mcp
-        self._add_mcp_tools()
         self.config = config
         self.odoo_server = odoo_server
+        self._limiter = anyio.CapacityLimiter(config.max_concurrency)
+        # Tool calls of each lane running at once, within max_concurrency
+        self._lane_limiters = {
+            lane: anyio.CapacityLimiter(config.lane_concurrency[lane]) for lane in LANES
+        }
+        # Runs independent Odoo calls of a single tool call side by side
+        self._executor = ThreadPoolExecutor(
+            max_workers=config.pool_size, thread_name_prefix="odoo-rpc"
+        )
+        # State shared with the other worker processes of an HTTP deployment
+        self.store = None
+        if config.shared_state_dir:
+            # sqlite3 is only imported by deployments with several workers
+            from .store import SHARED_STATE_FILE, SharedStore
 
-    def _execute_odoo(self, model: str, method: str, args, **kwargs) -> Any:
-        """Helper to safely execute Odoo XML-RPC calls."""
+            os.makedirs(config.shared_state_dir, exist_ok=True)
+            self.store = SharedStore(os.path.join(config.shared_state_dir, SHARED_STATE_FILE))
+        self._stopped = threading.Event()
+        self.cache = (
+            OdooCache(config.cache_ttls, config.cache_size, self.store)
+            if config.cache_enabled
+            else None
+        )
+        self.singleflight = SingleFlight() if config.coalesce else None
+        # tenant -> AdaptiveLimiter of its Odoo calls, created on first use
+        self.limiters = {}
+        self._limiters_lock = threading.Lock()
+        self.timezones = TimezoneService(config.timezone, self._fetch_user_context)
+        # MCP session -> tenant picked with select_tenant
+        self._session_tenants = weakref.WeakKeyDictionary()
+        self.metrics = None
+        if config.metrics_enabled:
+            self._init_metrics()
+        self.sync = None
+        if config.sync_enabled:
+            self._init_sync()
+        self.product_index = None
+        self.partner_index = None
+        if config.name_index:
+            self._init_name_indexes()
+        # tenant -> SchemaCache, created on the tenant's first use
+        self.schemas = {}
+        self._schemas_lock = threading.Lock()
+        self._schema()
+        self._add_mcp_tools()
+
+    def _init_metrics(self):
+        """Create the metrics registry and expose it as the ``odoo://metrics`` resource."""
+        self.metrics = Metrics(self.config.slow_call_seconds)
+        self.metrics.extra_sources.append(self._cache_metrics)
+        if self.store is not None:
+            threading.Thread(target=self._publish_metrics, name="odoo-metrics", daemon=True).start()
+
+        @self.mcp.resource("odoo://metrics", mime_type="text/plain")
+        def odoo_metrics() -> str:
+            """Odoo RPC and MCP tool metrics in the Prometheus text format."""
+            if self.store is None:
+                return self.metrics.render()
+            # Summed over every worker process
+            self.store.publish_metrics(str(os.getpid()), self.metrics.render())
+            return merge_expositions(self.store.metrics())
+
+    def _publish_metrics(self):
+        """Keep this worker's metrics in the shared store up to date."""
+        while not self._stopped.wait(METRICS_PUBLISH_INTERVAL):
+            try:
+                self.store.publish_metrics(str(os.getpid()), self.metrics.render())
+            except Exception as e:
+                print(f"[Error] Could not publish metrics: {e}", file=sys.stderr)
+
+    def _cache_metrics(self):
+        """Cache, coalescing, tenant, circuit and replica gauges for the metrics resource."""
+        gauges = []
+        if self.cache is not None:
+            for model, counts in self.cache.stats()["models"].items():
+                gauges.append(("odoo_cache_hits", {"model": model}, counts["hits"]))
+                gauges.append(("odoo_cache_misses", {"model": model}, counts["misses"]))
+        if self.singleflight is not None:
+            for model, counts in self.singleflight.stats().items():
+                gauges.append(("odoo_coalesced_calls", {"model": model}, counts["coalesced"]))
+        for name, breaker in self.odoo_server.tenants.breakers.items():
+            gauges.append(("odoo_circuit_open", {"tenant": name}, int(breaker.is_open)))
+        if self.config.multi_tenant:
+            tenants = self.odoo_server.tenants.stats()
+            gauges.append(("odoo_tenants_active", {}, len(tenants["active"])))
+            gauges.append(("odoo_tenant_evictions", {}, tenants["evictions"]))
+        for name, limiter in list(self.limiters.items()):
+            stats = limiter.stats()
+            gauges.append(("odoo_concurrency_limit", {"tenant": name}, stats["limit"]))
+            for lane in LANES:
+                labels = {"tenant": name, "lane": lane}
+                gauges.append(("odoo_calls_in_flight", labels, stats["in_flight"].get(lane, 0)))
+                gauges.append(("odoo_calls_queued", labels, stats["queued"].get(lane, 0)))
+            for tool, count in stats["shed"].items():
+                gauges.append(("odoo_calls_shed", {"tenant": name, "tool": tool}, count))
+        if self.sync is not None:
+            for model, replica in self.sync.replicas.items():
+                gauges.append(("odoo_replica_records", {"model": model}, len(replica.records)))
+        return gauges
+
+    def close(self):
+        """Stop the background work; in-flight tool calls must have finished."""
+        self._stopped.set()
+        if self.sync is not None:
+            self.sync.stop()
+        self._executor.shutdown(wait=False)
+        if self.store is not None and self.metrics is not None:
+            self.store.publish_metrics(str(os.getpid()), self.metrics.render())
+
+    def _init_sync(self):
+        """Create the replica sync engine and start its background thread."""
+        self.sync = SyncEngine(
+            self._call_odoo,
+            models=self.config.sync_models,
+            interval=self.config.sync_interval,
+            reconcile_interval=self.config.sync_reconcile_interval,
+            max_staleness=self.config.sync_max_staleness,
+            state_file=self.config.sync_state_file,
+            identity={
+                "url": self.config.odoo_url,
+                "database": self.config.odoo_database,
+                "username": self.config.odoo_username,
+            },
+        )
+        self.sync.start()
+
+    def _init_name_indexes(self):
+        """Create the local product/partner name indexes and load them in the background."""
+        from .index import OdooNameIndex
+
+        fetch = self._call_odoo
+        self.product_index = OdooNameIndex(
+            "product.product",
+            ["name", "list_price", "description_sale"],
+            fetch,
+            langs=self.config.index_languages,
+            refresh_interval=self.config.index_refresh,
+            reconcile_interval=self.config.sync_reconcile_interval,
+        )
+        self.partner_index = OdooNameIndex(
+            "res.partner",
+            ["name"],
+            fetch,
+            refresh_interval=self.config.index_refresh,
+            reconcile_interval=self.config.sync_reconcile_interval,
+        )
+        for index in (self.product_index, self.partner_index):
+            index.ensure_fresh()
+
+    def _tool(self, lane=INTERACTIVE):
+        """
+        Register a blocking tool body as an ``async def`` MCP tool.
+
+        The body runs in a worker thread so a slow Odoo call never blocks the
+        event loop; at most ``max_concurrency`` bodies run at the same time,
+        and at most the concurrency of ``lane`` of those in that lane: quick
+        reads (``INTERACTIVE``), transactional writes (``WRITE``) or bulk
+        reads, writes and exports (``BULK``). The lane also decides the
+        share of Odoo capacity its calls get under load. ``lane`` may also be
+        a function of the call's arguments (with defaults) returning a lane,
+        for tools whose cost depends on them.
+        """
+
+        def decorator(fn):
+            signature = inspect.signature(fn)
+            # Bodies declaring ``ctx`` get the MCP context, e.g. to report progress
+            takes_context = "ctx" in signature.parameters
+
+            def lane_of(args, kwargs) -> str:
+                if not callable(lane):
+                    return lane
+                try:
+                    bound = signature.bind_partial(*args, **kwargs)
+                except TypeError:
+                    # FastMCP reports the bad arguments
+                    return BULK
+                bound.apply_defaults()
+                return lane(bound.arguments)
+
+            def run(tenant, call, *args, **kwargs):
+                token = current_tenant.set(tenant)
+                call_token = current_call.set(call)
+                try:
+                    # Keeps the tenant's pool open for the whole tool call
+                    with self.odoo_server.tenants.lease(tenant):
+                        if self.metrics is None:
+                            return fn(*args, **kwargs)
+                        with self.metrics.tool_call(fn.__name__):
+                            return fn(*args, **kwargs)
+                finally:
+                    current_call.reset(call_token)
+                    current_tenant.reset(token)
+
+            @functools.wraps(fn)
+            async def wrapper(*args, tenant: str = None, ctx: Context = None, **kwargs):
+                # Time spent waiting for a thread counts against the queue timeout
+                call_lane = lane_of(args, kwargs)
+                call = ToolCall(fn.__name__, self.config.queue_timeout, call_lane)
+                tenant = self._resolve_tenant(tenant, ctx)
+                if tenant not in self.odoo_server.tenants:
+                    return self._unknown_tenant(tenant)
+                if takes_context:
+                    kwargs["ctx"] = ctx
+                async with self._lane_limiters[call_lane]:
+                    return await anyio.to_thread.run_sync(
+                        functools.partial(run, tenant, call, *args, **kwargs), limiter=self._limiter
+                    )
+
+            if self.config.multi_tenant:
+                wrapper.__signature__ = self._with_tenant_parameters(fn)
+
+            return self.mcp.tool()(wrapper)
+
+        return decorator
+
+    @staticmethod
+    def _with_tenant_parameters(fn) -> inspect.Signature:
+        """``fn``'s signature plus the ``tenant`` argument and the MCP context."""
+        signature = inspect.signature(fn)
+        parameters = [p for p in signature.parameters.values() if p.name != "ctx"]
+        return signature.replace(
+            parameters=[
+                *parameters,
+                inspect.Parameter(
+                    "tenant",
+                    inspect.Parameter.KEYWORD_ONLY,
+                    default=None,
+                    annotation=Annotated[
+                        Optional[str],
+                        Field(description="Odoo tenant (database) to use; see select_tenant."),
+                    ],
+                ),
+                inspect.Parameter(
+                    "ctx", inspect.Parameter.KEYWORD_ONLY, default=None, annotation=Context
+                ),
+            ]
+        )
+
+    @staticmethod
+    def _session(ctx):
         try:
-            return self.odoo_server.models.execute_kw(
-                self.config.odoo_database,
-                self.odoo_server.uid,
-                self.config.odoo_password,
+            return ctx.session if ctx is not None else None
+        except ValueError:
+            # Called outside of an MCP request
+            return None
+
+    def _resolve_tenant(self, tenant: str, ctx) -> str:
+        """
+        Pick the tenant of a tool call: the ``tenant`` argument, else the one
+        selected for the MCP session, else the ``X-Odoo-Tenant`` HTTP header,
+        else the default tenant.
+        """
+        if tenant:
+            return tenant
+        session = self._session(ctx)
+        if session is not None and session in self._session_tenants:
+            return self._session_tenants[session]
+        if session is not None:
+            request = getattr(ctx.request_context, "request", None)
+            header = getattr(request, "headers", {}).get("x-odoo-tenant")
+            if header:
+                return header
+        return self.odoo_server.tenants.default
+
+    @staticmethod
+    def _report_progress(ctx, progress: float, total: float = None, message: str = None):
+        """Send an MCP progress notification from a tool body, if the client asked for them."""
+        if ctx is None:
+            return
+        try:
+            anyio.from_thread.run(functools.partial(ctx.report_progress, progress, total, message))
+        except (ValueError, RuntimeError):
+            # Called outside of an MCP request
+            pass
+
+    def _unknown_tenant(self, tenant: str) -> str:
+        return f"Unknown tenant: {tenant}. Available tenants: {', '.join(self.odoo_server.tenants.names())}"
+
+    def _is_default_tenant(self) -> bool:
+        tenants = self.odoo_server.tenants
+        return (current_tenant.get() or tenants.default) == tenants.default
+
+    def _schema(self):
+        """
+        The schema cache of the current tenant, or None if disabled. On the
+        tenant's first use it is created and loads in the background.
+        """
+        if not self.config.schema_cache:
+            return None
+        tenants = self.odoo_server.tenants
+        tenant = current_tenant.get() or tenants.default
+        with self._schemas_lock:
+            schema = self.schemas.get(tenant)
+            if schema is not None:
+                return schema
+            profile = tenants.profiles[tenant]
+            schema = self.schemas[tenant] = SchemaCache(
+                self._call_odoo,
+                state_file=os.path.join(
+                    self.config.schema_dir, f"schema-{profile.database}-{tenant}.json"
+                ),
+                identity={
+                    "url": profile.url,
+                    "database": profile.database,
+                    "username": profile.username,
+                },
+            )
+        # The copied context keeps the tenant for the background calls
+        context = contextvars.copy_context()
+        threading.Thread(
+            target=context.run, args=(schema.load,), name="odoo-schema", daemon=True
+        ).start()
+        return schema
+
+    def _project(self, model: str, requested: List[str], default: List[str]) -> List[str]:
+        """
+        The fields to read from ``model``: ``requested`` or ``default``, checked
+        against the schema cache, plus 'id'. Raises ``UnknownFields``.
+        """
+        schema = self._schema()
+        if schema is None:
+            return project([f for f in requested or () if f != "*"], default)
+        return project(schema.select(model, requested, default), ())
+
+    def _admission(self):
+        """The adaptive limiter of the current tenant's Odoo calls, or None if disabled."""
+        if not self.config.adaptive_concurrency:
+            return None
+        tenants = self.odoo_server.tenants
+        name = current_tenant.get() or tenants.default
+        limiter = self.limiters.get(name)
+        if limiter is None:
+            with self._limiters_lock:
+                limiter = self.limiters.get(name)
+                if limiter is None:
+                    profile = tenants.profiles.get(name)
+                    limiter = self.limiters[name] = AdaptiveLimiter(
+                        name,
+                        getattr(profile, "pool_size", None) or self.config.pool_size,
+                        max_queue=self.config.queue_size,
+                        weights=self.config.lane_weights,
+                    )
+        return limiter
+
+    def _call_odoo(self, model: str, method: str, args, kwargs: dict) -> Any:
+        """
+        Run ``execute_kw`` on a pooled connection of the current tenant; no
+        caching, errors propagate.
+        """
+        failure = None
+        connection = None
+
+        def execute(pooled, uid):
+            nonlocal connection
+            connection = pooled
+            return connection.execute_kw(
+                tenant.profile.database,
+                uid,
+                tenant.profile.password,
                 model,
                 method,
                 args,
                 kwargs,
             )
+
+        limiter = self._admission()
+        call = current_call.get() or ToolCall(BACKGROUND, self.config.queue_timeout, BULK)
+        if limiter is not None:
+            limiter.acquire(call.tool, call.deadline, call.lane)
+        start = time.perf_counter()
+        try:
+            with self.odoo_server.tenants.lease(current_tenant.get()) as tenant:
+                result = tenant.call(execute)
+            if method not in READ_METHODS:
+                call.wrote()
+            return result
+        except Exception as e:
+            failure = e
+            raise
+        finally:
+            if limiter is not None:
+                # Calls stopped before reaching Odoo, e.g. by the breaker, say nothing of its load
+                limiter.release(
+                    call.lane,
+                    time.perf_counter() - start if connection is not None else None,
+                    failure is not None and is_connection_failure(failure),
+                )
+            call.restart()
+            if self.metrics is not None:
+                self.metrics.observe_odoo_call(
+                    model,
+                    method,
+                    time.perf_counter() - start,
+                    failure is not None,
+                    getattr(connection, "last_request_bytes", 0),
+                    getattr(connection, "last_response_bytes", 0),
+                )
+
+    def _execute_odoo(self, model: str, method: str, args, **kwargs) -> Any:
+        """
+        Helper to safely execute Odoo RPC calls over the configured protocol.
+
+        Reads on synced models are answered from their local replica when it
+        is fresh enough, reads on cached models from ``self.cache``, and
+        identical reads already in flight share one round trip; any other
+        call invalidates the cached and replicated reads of that model.
+
+        Odoo's errors are raised, as ``OdooUnavailable`` if it did not answer,
+        so that a rejected query is not taken for an empty result.
+        """
+        # Replicas are only kept for the default tenant
+        if self.sync is not None and method in READ_METHODS and self._is_default_tenant():
+            served = self.sync.serve(model, method, args, kwargs)
+            if served is not MISS:
+                return served
+
+        scope = current_tenant.get() or self.odoo_server.tenants.default
+        cache_key = self.cache.key(model, method, args, kwargs, scope) if self.cache else None
+        if cache_key is not None:
+            cached = self.cache.get(cache_key, model)
+            if cached is not MISS:
+                return cached
+            # Taken before the read, so a write landing during it keeps the result out
+            generation = self.cache.generation(model)
+
+        try:
+            if self.singleflight is not None and method in READ_METHODS:
+                result = self.singleflight.do(
+                    call_key(model, method, args, kwargs, scope),
+                    model,
+                    lambda: self._call_odoo(model, method, args, kwargs),
+                )
+            else:
+                result = self._call_odoo(model, method, args, kwargs)
+        except OdooUnavailable:
+            # Surface the outage to the client instead of an empty result
+            raise
+        except Exception as e:
+            print(f"[Error] Odoo call failed for {model}.{method}: {e}", file=sys.stderr)
+            if is_connection_failure(e) or isinstance(e, PoolExhausted):
+                # A timeout is not an empty result either
+                raise OdooUnavailable(f"Odoo did not answer ({e}); retry later.") from e
+            raise
+        finally:
+            if method not in READ_METHODS:
+                self._invalidate(model)
+
+        if cache_key is not None:
+            self.cache.set(cache_key, model, result, generation)
+        return result
+
+    def _invalidate(self, model: str):
+        """Drop what the cache, in-flight reads, replicas and name indexes hold of ``model``."""
+        # In-flight reads first: a read starting after the cache generation
+        # moved on must not join one that started before the write
+        if self.singleflight is not None:
+            self.singleflight.forget(model)
+        if self.cache:
+            self.cache.invalidate(model)
+        if self.sync is not None:
+            self.sync.notify_write(model)
+        models = (model, *RELATED_MODELS.get(model, ()))
+        for index in (self.product_index, self.partner_index):
+            if index is not None and index.model in models:
+                # Lookups go to Odoo until the index has caught up
+                index.mark_written()
+                index.ensure_fresh()
+
+    def _write_odoo(self, model: str, method: str, args, **kwargs) -> Any:
+        """
+        Make a writing Odoo call like ``_execute_odoo``, but raise Odoo's error
+        instead of returning an empty result, so it can be reported.
+
+        A call that timed out or lost its connection raises ``OdooUnavailable``
+        saying so: Odoo may have applied it, so it must not be sent again blindly.
+        """
+        try:
+            return self._call_odoo(model, method, args, kwargs)
+        except PoolExhausted as e:
+            raise OdooUnavailable(f"Odoo is busy ({e}); retry later.") from e
+        except Exception as e:
+            if is_connection_failure(e):
+                raise OdooUnavailable(
+                    f"Odoo did not answer ({e}); the {method} may have been applied, "
+                    f"check before retrying."
+                ) from e
+            raise
+        finally:
+            self._invalidate(model)
+
+    @staticmethod
+    def _odoo_error(error: Exception) -> str:
+        """The message of an Odoo fault without its exception class prefix."""
+        message = error.faultString if isinstance(error, xmlrpc.client.Fault) else str(error)
+        return message.strip().splitlines()[-1] if message.strip() else repr(error)
+
+    def _bisect_batch(self, batch, call, budget: List[int] = None) -> Dict[int, Any]:
+        """
+        Run ``call(items)``, which returns one result per item, over ``batch``,
+        a list of ``(index, item)``, in one Odoo call. If Odoo rejects it with
+        a fault, e.g. a validation error, split it in halves and retry each,
+        down to single items, so one bad item fails alone. Returns index ->
+        result, or the error as an ``Exception``.
+
+        ``budget`` holds the number of retries left, shared by the batches of
+        one tool call (default ``BULK_RETRY_CALLS``); once it is spent, the
+        items of a rejected batch all fail with its error. Any other error is
+        never retried, as Odoo may have applied the batch, e.g. before a
+        timeout: its items get the error (``OdooUnavailable`` as raised), and
+        the results of the halves already done are kept.
+        """
+        if budget is None:
+            budget = [BULK_RETRY_CALLS]
+        try:
+            results = call([item for _, item in batch])
+            return dict(zip((index for index, _ in batch), results))
+        except OdooUnavailable as e:
+            return {index: e for index, _ in batch}
+        except xmlrpc.client.Fault as e:
+            if len(batch) == 1 or budget[0] <= 0:
+                error = Exception(self._odoo_error(e))
+                return {index: error for index, _ in batch}
+            budget[0] -= 2
+        except Exception as e:
+            error = Exception(self._odoo_error(e))
+            return {index: error for index, _ in batch}
+        middle = len(batch) // 2
+        return {
+            **self._bisect_batch(batch[:middle], call, budget),
+            **self._bisect_batch(batch[middle:], call, budget),
+        }
+
+    def _run_parallel(self, *calls):
+        """
+        Run independent zero-argument callables concurrently and return their
+        results in order, so their Odoo round trips overlap.
+        """
+        # Each call gets a copy of the context so round trips count towards the tool
+        futures = [self._executor.submit(contextvars.copy_context().run, call) for call in calls]
+        return [future.result() for future in futures]
+
+    def _fetch_user_context(self):
+        """The Odoo user's context (``lang``, ``tz``), or None if Odoo could not be asked."""
+        try:
+            return self._call_odoo("res.users", "context_get", [], {})
         except Exception as e:
-            print(f"[Error] Odoo call failed for {model}.{method}: {e}")
-            return []
+            print(f"[Error] Could not read the Odoo user's timezone: {e}", file=sys.stderr)
+            return None
 
     def _format_datetime(self, utc_string: str) -> str:
-        """Convert UTC time string from Odoo to Riyadh local time."""
-        utc_time = datetime.strptime(utc_string, "%Y-%m-%d %H:%M:%S")
-        local_tz = pytz.timezone("Asia/Riyadh")
-        return (
-            utc_time.replace(tzinfo=pytz.utc)
-            .astimezone(local_tz)
-            .strftime("%Y-%m-%d %H:%M:%S")
-        )
+        """Convert UTC time string from Odoo to the configured or user's local time."""
+        return self.timezones.format(utc_string, current_tenant.get())
 
-    def _get_order_lines(self, order_line_ids: List[int]) -> str:
-        """Retrieve and format order line details."""
+    def _format_datetimes(self, utc_strings: List[str]) -> List[str]:
+        """Convert many UTC time strings from Odoo at once; see ``_format_datetime``."""
+        return self.timezones.format_many(utc_strings, current_tenant.get())
 
-        order_lines = self._execute_odoo(
-            "sale.order.line",
-            "read",
-            [order_line_ids],
-            **{
-                "fields": [
-                    "product_id",
-                    "name",
-                    "price_unit",
-                    "product_uom_qty",
-                    "price_subtotal",
-                ],
-                "context": {"lang": "en_US"},
-            },
-        )
+    def _read_order_lines(self, orders: List[dict]) -> Dict[int, List[dict]]:
+        """
+        Retrieve the order lines of several orders at once.
+
+        All ``order_line`` ids are read in a few chunked ``read`` calls instead
+        of one call per order, then grouped back to their orders in memory.
+        Returns a mapping of order id to its line records.
+        """
 
-        if not order_lines:
-            return f"- No order items found for {order_line_ids}"
+        line_ids = [line_id for order in orders for line_id in order.get("order_line", [])]
+        fields = self._project("sale.order.line", None, ORDER_LINE_FIELDS)
 
-        lines_text = []
-        for item in order_lines:
-            lines_text.append(
-                f"- {item['product_id'][1]}, Qty: {item['product_uom_qty']}, "
-                f"Price: {item['price_unit']} each"
+        lines_by_id = {}
+        for start in range(0, len(line_ids), ORDER_LINE_CHUNK_SIZE):
+            chunk = line_ids[start : start + ORDER_LINE_CHUNK_SIZE]
+            order_lines = self._execute_odoo(
+                "sale.order.line",
+                "read",
+                [chunk],
+                **{
+                    "fields": fields,
+                    "context": {"lang": "en_US"},
+                },
             )
-        return "\n".join(lines_text)
+            for item in order_lines:
+                lines_by_id[item["id"]] = item
+
+        return {
+            order["id"]: [lines_by_id[i] for i in order.get("order_line", []) if i in lines_by_id]
+            for order in orders
+        }
+
+    def _get_order_lines(self, orders: List[dict]) -> Dict[int, str]:
+        """Retrieve and format the order lines of several orders; order id -> text."""
+        lines_by_order = self._read_order_lines(orders)
+
+        results = {}
+        for order in orders:
+            order_line_ids = order.get("order_line", [])
+            items = lines_by_order[order["id"]]
+
+            if not items:
+                results[order["id"]] = f"- No order items found for {order_line_ids}"
+                continue
+
+            results[order["id"]] = "\n".join(
+                f"- {compact_value(item.get('product_id'))}, Qty: {item.get('product_uom_qty')}, "
+                f"Price: {item.get('price_unit')} each"
+                for item in items
+            )
+        return results
+
+    def _iter_products(
+        self,
+        lang: str,
+        after_id: int = 0,
+        chunk_size: int = PRODUCT_FETCH_CHUNK_SIZE,
+        fields: List[str] = PRODUCT_FIELDS,
+    ):
+        """
+        Yield the products with an id above ``after_id`` in chunks, ordered by id.
+
+        Uses an ``id > last_id`` keyset (``iter_by_id``) instead of offsets.
+        """
+        return iter_by_id(
+            lambda model, method, args, kwargs: self._execute_odoo(model, method, args, **kwargs),
+            "product.product",
+            [],
+            fields,
+            chunk_size,
+            after_id,
+            context={"lang": lang},
+        )
+
+    def _index_ready(self, index) -> bool:
+        """
+        True if ``index`` can answer lookups on its own; starts a background
+        refresh if one is due, which lookups do not wait for.
+        """
+        # Indexes are only kept for the default tenant
+        if index is None or not self._is_default_tenant():
+            return False
+        index.ensure_fresh()
+        return index.loaded and not index.stale
 
     def _get_partner_id_by_name(self, name):
         """
         Fetches the partner ID from Odoo given a contact (customer) name.
         Returns the partner ID if found, otherwise None.
         """
+        if self._index_ready(self.partner_index):
+            matches = self.partner_index.search(name, limit=1)
+            return matches[0][0] if matches else None
+
         partners = self._execute_odoo(
             "res.partner",
             "search_read",
@@ -88,6 +818,42 @@ class OdooTools:
             return partners[0]["id"]
         return None
 
+    def _get_partner_ids_by_names(self, names: List[str]) -> Dict[str, int]:
+        """
+        Resolve several contact names with a single ``res.partner`` search.
+
+        Each name maps to the first partner whose name contains it (like
+        ``_get_partner_id_by_name``), or None if there is none. The search
+        reads at most ``PARTNER_MATCHES_PER_NAME`` partners per name; if it
+        was cut short, names it did not match are looked up one by one.
+        """
+        if not names:
+            return {}
+
+        if self._index_ready(self.partner_index):
+            return {name: self._get_partner_id_by_name(name) for name in names}
+
+        domain = ["|"] * (len(names) - 1) + [["name", "ilike", name] for name in names]
+        limit = PARTNER_MATCHES_PER_NAME * len(names)
+        partners = self._execute_odoo(
+            "res.partner",
+            "search_read",
+            [domain],
+            **{"fields": ["id", "name"], "limit": limit},
+        )
+
+        found = {
+            name: next(
+                (p["id"] for p in partners if name.lower() in (p["name"] or "").lower()),
+                None,
+            )
+            for name in names
+        }
+        if len(partners) >= limit:
+            for name in [name for name, partner_id in found.items() if partner_id is None]:
+                found[name] = self._get_partner_id_by_name(name)
+        return found
+
     def _get_default_journal_and_payment_method(self):
         journals = self._execute_odoo(
             "account.journal",
@@ -111,18 +877,61 @@ class OdooTools:
                 return journal["id"], journal["inbound_payment_method_line_ids"][0]
         return None
 
-    def _add_mcp_tools(self):
+    def _add_tenant_tools(self):
 
         @self.mcp.tool()
-        def get_products(product_names_lang: str = "en", limits: int = None) -> dict:
+        async def select_tenant(tenant: str, ctx: Context) -> str:
+            """
+            Use an Odoo tenant (database) for the following tool calls of this session.
+
+            Args:
+                tenant: the tenant name.
+
+            Returns:
+                A confirmation, or the available tenants if the name is unknown.
+            """
+            if tenant not in self.odoo_server.tenants:
+                return self._unknown_tenant(tenant)
+            session = self._session(ctx)
+            if session is None:
+                return "No MCP session; pass 'tenant' to each tool call instead."
+            self._session_tenants[session] = tenant
+            return f"Using tenant {tenant} for this session."
+
+    def _add_mcp_tools(self):
+
+        if self.config.multi_tenant:
+            self._add_tenant_tools()
+
+        @self._tool()
+        def get_products(
+            product_names_lang: str = "en",
+            limits: int = None,
+            page_size: int = None,
+            cursor: str = None,
+            fields: List[str] = None,
+            response_format: str = "records",
+            max_bytes: int = None,
+        ):
             """
             Returns a list of products from Odoo.
             Args:
                 product_names_lang: the language to use for the product names.
-                limits: the number of products to return, if None, all products are returned.
+                limits: the number of products to return in a single response.
+                    If None, the catalog is returned one page at a time.
+                page_size: the number of products per page (default 200).
+                cursor: the 'next_cursor' value of the previous page, to continue from it.
+                fields: the product fields to return (default 'name' and 'list_price');
+                    'id' is always included and related records are given by name.
+                response_format: 'records' (a dictionary per product) or 'columns'
+                    (the field names once under 'columns', then one list per product
+                    under 'rows'), which is smaller.
+                max_bytes: size budget of the response (default from ODOO_MAX_RESPONSE_BYTES).
+                    Products beyond it are left out and 'truncated' is set.
 
             Returns:
-                A dictionary with a list of products, each product is a dictionary with 'name' and 'list_price' keys.
+                A dictionary with the products and 'truncated'. In paged mode it also
+                has a 'next_cursor' key, which is None on the last page.
             """
 
             supported_languages = {
@@ -138,40 +947,102 @@ class OdooTools:
             else:
                 product_names_lang = "en_US"
 
-            products = self._execute_odoo(
-                "product.product",
-                "search_read",
-                [[]],
-                **{
-                    "fields": ["name", "list_price"],
-                    "context": {"lang": product_names_lang},
-                    **({"limit": limits} if limits else {}),
-                },
-            )
+            error = check_format(response_format, ("records", "columns"))
+            if error:
+                return error
+            try:
+                read_fields = self._project("product.product", fields, PRODUCT_FIELDS)
+            except UnknownFields as e:
+                return str(e)
+            budget = max_bytes or self.config.max_response_bytes
+
+            if limits and not (page_size or cursor):
+                products = self._execute_odoo(
+                    "product.product",
+                    "search_read",
+                    [[]],
+                    **{
+                        "fields": read_fields,
+                        "context": {"lang": product_names_lang},
+                        "limit": limits,
+                    },
+                )
+
+                if not products:
+                    return "No products available."
+
+                shaped, kept = shape_within_budget(products, read_fields, response_format, budget)
+                # Compact JSON, the form the budget was measured in
+                return to_json({"products": shaped, "truncated": kept < len(products)})
+
+            # --- Paged mode: keyset pagination on id ---
+            try:
+                after_id = _decode_cursor(cursor) if cursor else 0
+            except ValueError:
+                return "Invalid cursor, start again without one."
+
+            size = page_size or PRODUCT_PAGE_SIZE
+            products = []
+            for page in self._iter_products(
+                product_names_lang, after_id, min(size, PRODUCT_FETCH_CHUNK_SIZE), read_fields
+            ):
+                products.extend(page[: size - len(products)])
+                if len(products) >= size:
+                    break
 
-            if not products:
+            if not products and not cursor:
                 return "No products available."
 
-            return {"products": products}
+            shaped, kept = shape_within_budget(products, read_fields, response_format, budget)
+            truncated = kept < len(products)
+            # A page cut short by the budget continues after its last product
+            next_cursor = (
+                _encode_cursor(products[kept - 1]["id"])
+                if truncated or len(products) == size
+                else None
+            )
+            return to_json({"products": shaped, "next_cursor": next_cursor, "truncated": truncated})
 
-        @self.mcp.tool()
-        def get_product_details(product_name: str):
+        @self._tool()
+        def get_product_details(
+            product_name: str, fields: List[str] = None, response_format: str = "text"
+        ):
             """
             Get product details from Odoo by product name.
 
             Args:
                 product_name: the name of the product to search for.
+                fields: the product fields to return (default 'name', 'list_price'
+                    and 'description_sale').
+                response_format: 'text', 'records' (a dictionary) or 'columns'
+                    (field names under 'columns' and the values under 'rows').
 
             Returns:
-                A string with product details.
+                A string with product details, or the product's fields as compact JSON.
             """
 
             if not product_name:
                 return "Product name is required."
 
+            error = check_format(response_format)
+            if error:
+                return error
+            try:
+                read_fields = self._project("product.product", fields, PRODUCT_DETAIL_FIELDS)
+            except UnknownFields as e:
+                return str(e)
+
             language_fallbacks = ["en_US", "ar_001"]
             product_data = None
 
+            # The index only holds some fields; other projections go to Odoo
+            if set(read_fields) - {"id"} <= set(PRODUCT_DETAIL_FIELDS) and self._index_ready(
+                self.product_index
+            ):
+                matches = self.product_index.search(product_name, limit=1, fuzzy=True)
+                product_data = {"id": matches[0][0], **matches[0][2]} if matches else None
+                language_fallbacks = []
+
             for lang in language_fallbacks:
 
                 searched_products = self._execute_odoo(
@@ -179,7 +1050,7 @@ class OdooTools:
                     "search_read",
                     [[["name", "ilike", product_name]]],
                     **{
-                        "fields": ["id", "name", "list_price", "description_sale"],
+                        "fields": read_fields,
                         "limit": 1,
                         "context": {"lang": (lang)},
                     },
@@ -192,15 +1063,35 @@ class OdooTools:
             if not product_data:
                 return f"No product found with the name: {product_name}"
 
-            return (
-                f"Product Name: {product_data['name']}\n"
-                f"Price: ${product_data['list_price']}\n"
-                f"Description: {product_data.get('description_sale', 'No description available.')}"
-            )
+            if response_format != "text":
+                shaped = shape_records([product_data], read_fields, response_format)
+                return to_json(shaped if response_format == "columns" else shaped[0])
 
-        @self.mcp.tool()
+            lines = []
+            for field in read_fields:
+                match field:
+                    case "id":
+                        continue
+                    case "name":
+                        lines.append(f"Product Name: {product_data['name']}")
+                    case "list_price":
+                        lines.append(f"Price: ${product_data['list_price']}")
+                    case "description_sale":
+                        lines.append(
+                            f"Description: {product_data.get('description_sale', 'No description available.')}"
+                        )
+                    case _:
+                        lines.append(f"{field}: {compact_value(product_data.get(field))}")
+            return "\n".join(lines)
+
+        @self._tool(lane=_order_details_lane)
         def get_order_details(
-            limits=1, order_ids: List[Any] = None, fields: List[str] = None
+            limits=1,
+            order_ids: List[Any] = None,
+            fields: List[str] = None,
+            response_format: str = "text",
+            offset: int = 0,
+            max_bytes: int = None,
         ):
             """
             Retrieve and format order details from Odoo.
@@ -210,12 +1101,51 @@ class OdooTools:
                 order_ids (List[int], optional): Specific order IDs to fetch.
                 fields (List[str], optional): Specific fields to include in the output.
                                             If None, full order details are returned.
+                                            Text accepts the fields it can render;
+                                            structured formats accept any sale.order field.
+                response_format (str, optional): 'text', 'records' (a dictionary per
+                    order) or 'columns' (the field names once under 'columns' and
+                    'line_columns', then one list per order under 'rows').
+                offset (int, optional): Number of matching orders to skip.
+                max_bytes (int, optional): Size budget of the response (default from
+                    ODOO_MAX_RESPONSE_BYTES). Orders beyond it are left out, with the
+                    offset to continue from.
 
             Returns:
-                str: Human-readable formatted order details.
+                str: Human-readable formatted order details, or a compact JSON object
+                with 'orders' (or 'columns'/'rows'), 'truncated' and 'next_offset'.
             """
 
-            search_domain = [] if order_ids is None else ["id", "in", order_ids]
+            error = check_format(response_format)
+            if error:
+                return error
+
+            search_domain = [] if order_ids is None else [["id", "in", order_ids]]
+
+            if response_format == "text":
+                # Only these fields have a text rendering
+                unsupported = [f for f in fields or [] if f not in ORDER_DISPLAY_FIELDS]
+                if unsupported:
+                    return (
+                        f"Unsupported text fields: {', '.join(unsupported)}. Use any of "
+                        f"{', '.join(ORDER_DISPLAY_FIELDS)}, or the records or columns "
+                        f"format for other fields."
+                    )
+
+                # Determine which fields to display
+                display_fields = fields or ORDER_DISPLAY_FIELDS
+
+                # Only request the columns that are rendered below
+                read_fields = [f for f in ORDER_DISPLAY_FIELDS if f in display_fields]
+                if "amount_total" in read_fields and "currency_id" not in read_fields:
+                    read_fields.append("currency_id")
+            else:
+                try:
+                    display_fields = read_fields = self._project(
+                        "sale.order", fields, ORDER_DISPLAY_FIELDS
+                    )
+                except UnknownFields as e:
+                    return str(e)
 
             orders = self._execute_odoo(
                 "sale.order",
@@ -226,55 +1156,327 @@ class OdooTools:
                         *search_domain
                     ]
                 ],
-                **{"limit": limits},
+                **{"fields": read_fields, "limit": limits, "offset": offset},
             )
 
             if not orders:
                 return "No orders available."
 
-            results = []
-            for order in orders:
-                formatted_order = []
+            local_dates = (
+                self._format_datetimes([order["date_order"] for order in orders])
+                if "date_order" in display_fields
+                else [None] * len(orders)
+            )
+            budget = max_bytes or self.config.max_response_bytes
+
+            if response_format != "text":
+                lines_by_order = (
+                    self._read_order_lines(orders) if "order_line" in read_fields else {}
+                )
+                records = []
+                for order, local_date in zip(orders, local_dates):
+                    # Copies, as orders may be shared with the cache
+                    record = dict(order)
+                    if local_date is not None:
+                        record["date_order"] = local_date
+                    if "order_line" in read_fields:
+                        lines = shape_records(
+                            lines_by_order[order["id"]], ORDER_LINE_OUTPUT_FIELDS, response_format
+                        )
+                        record["order_line"] = lines["rows"] if response_format == "columns" else lines
+                    records.append(record)
 
-                # Common values
-                formatted_date = self._format_datetime(order["date_order"])
-                order_items = self._get_order_lines(order.get("order_line", []))
+                shaped, kept = shape_within_budget(records, read_fields, response_format, budget)
+                if response_format == "columns":
+                    result = dict(shaped)
+                    if "order_line" in read_fields:
+                        result["line_columns"] = ORDER_LINE_OUTPUT_FIELDS
+                else:
+                    result = {"orders": shaped}
+                truncated = kept < len(orders)
+                result["truncated"] = truncated
+                result["next_offset"] = offset + kept if truncated else None
+                return to_json(result)
 
-                # Determine which fields to display
-                display_fields = fields or [
-                    "name",
-                    "date_order",
-                    "state",
-                    "order_line",
-                    "amount_total",
-                    "currency_id",
-                ]
+            order_items_by_order = (
+                self._get_order_lines(orders) if "order_line" in display_fields else {}
+            )
+
+            results = []
+            for order, local_date in zip(orders, local_dates):
+                formatted_order = []
 
                 for field in display_fields:
                     match field:
                         case "name":
                             formatted_order.append(f"Order ID: {order['name']}")
                         case "date_order":
-                            formatted_order.append(f"Date: {formatted_date}")
+                            formatted_order.append(f"Date: {local_date}")
                         case "state":
                             formatted_order.append(f"State: {order['state']}")
                         case "order_line":
+                            order_items = order_items_by_order[order["id"]]
                             formatted_order.append(f"Order Items:\n{order_items}")
                         case "amount_total":
                             formatted_order.append(
-                                f"Total Amount: {order['amount_total']} {order['currency_id'][1]}"
+                                f"Total Amount: {order['amount_total']} {compact_value(order.get('currency_id'))}"
                             )
                         case "currency_id":
                             if "amount_total" not in display_fields:
                                 formatted_order.append(
-                                    f"Currency: {order['currency_id'][1]}"
+                                    f"Currency: {compact_value(order.get('currency_id'))}"
                                 )
 
                 results.append("\n".join(formatted_order))
 
-            return "\n\n".join(results)
+            kept = fit_to_budget(results, budget)
+            text = "\n\n".join(results[:kept])
+            if kept < len(results):
+                text += (
+                    f"\n\n[{len(results) - kept} more orders not shown; "
+                    f"call again with offset={offset + kept}]"
+                )
+            return text
 
-        @self.mcp.tool()
+        @self._tool(lane=BULK)
+        def get_sales_summary(
+            group_by: List[str] = None,
+            measures: List[str] = None,
+            date_from: str = None,
+            date_to: str = None,
+            states: List[str] = None,
+            domain: List[Any] = None,
+            limit: int = SALES_SUMMARY_LIMIT,
+            response_format: str = "records",
+            max_bytes: int = None,
+        ):
+            """
+            Aggregate sales in Odoo (``read_group`` on the sales analysis report),
+            so only the totals are returned instead of every order and line.
+
+            Args:
+                group_by (List[str], optional): Any of 'partner', 'product',
+                    'salesperson', 'state' and 'date' with an optional granularity
+                    ('date:day', 'date:week', 'date:month', 'date:quarter',
+                    'date:year'; 'date' means 'date:month'). None gives one overall total.
+                measures (List[str], optional): Any of 'amount_total', 'amount_untaxed',
+                    'quantity', 'quantity_delivered' and 'quantity_invoiced'
+                    (default ['amount_total']).
+                date_from (str, optional): First order date to include, 'YYYY-MM-DD'.
+                date_to (str, optional): Last order date to include, 'YYYY-MM-DD'.
+                states (List[str], optional): Order states to include, e.g. ['sale'].
+                    Cancelled orders are excluded by default.
+                domain (List, optional): Extra Odoo domain leaves on ``sale.report`` fields.
+                limit (int, optional): Maximum number of groups (default 100),
+                    largest first by the first measure.
+                response_format (str, optional): 'records' (a dictionary per group) or
+                    'columns' (the names once under 'columns', then one list per group).
+                max_bytes (int, optional): Size budget of the response (default from
+                    ODOO_MAX_RESPONSE_BYTES); smaller groups beyond it are left out.
+
+            Returns:
+                A dictionary with one row per group ('groups'), each holding the
+                group values, the measures and 'line_count', plus 'truncated'.
+            """
+
+            error = check_format(response_format, ("records", "columns"))
+            if error:
+                return error
+
+            groupby = []
+            labels = []
+            for group in group_by or []:
+                name, _, granularity = group.strip().lower().partition(":")
+                if name not in SALES_GROUP_FIELDS:
+                    return f"Unsupported group_by: {group}. Use one of {', '.join(SALES_GROUP_FIELDS)}."
+                if name == "date":
+                    granularity = granularity or "month"
+                    if granularity not in DATE_GRANULARITIES:
+                        return f"Unsupported date granularity: {granularity}."
+                    groupby.append(f"date:{granularity}")
+                    labels.append(granularity)
+                else:
+                    groupby.append(SALES_GROUP_FIELDS[name])
+                    labels.append(name)
+
+            measures = measures or ["amount_total"]
+            unknown = [m for m in measures if m not in SALES_MEASURE_FIELDS]
+            if unknown:
+                return f"Unsupported measures: {', '.join(unknown)}. Use any of {', '.join(SALES_MEASURE_FIELDS)}."
+
+            search_domain = list(domain or [])
+            if date_from:
+                search_domain.append(["date", ">=", f"{date_from} 00:00:00"])
+            if date_to:
+                search_domain.append(["date", "<=", f"{date_to} 23:59:59"])
+            if states:
+                search_domain.append(["state", "in", states])
+            else:
+                search_domain.append(["state", "!=", "cancel"])
+
+            options = {"lazy": False}
+            if groupby:
+                # One group more than the limit tells whether there are more
+                options["orderby"] = f"{SALES_MEASURE_FIELDS[measures[0]]} desc"
+                options["limit"] = limit + 1
+
+            rows = self._execute_odoo(
+                "sale.report",
+                "read_group",
+                [
+                    search_domain,
+                    [f"{SALES_MEASURE_FIELDS[m]}:sum" for m in measures],
+                    groupby,
+                ],
+                **options,
+            )
+
+            groups = []
+            for row in rows[:limit]:
+                group = {}
+                for label, field in zip(labels, groupby):
+                    value = row.get(field)
+                    # many2one groups come back as [id, display name]
+                    group[label] = value[1] if isinstance(value, (list, tuple)) else value
+                for measure in measures:
+                    group[measure] = round(row.get(SALES_MEASURE_FIELDS[measure]) or 0, 2)
+                group["line_count"] = row.get("__count", 0)
+                groups.append(group)
+
+            shaped, kept = shape_within_budget(
+                groups,
+                [*labels, *measures, "line_count"],
+                response_format,
+                max_bytes or self.config.max_response_bytes,
+            )
+            return to_json({"groups": shaped, "truncated": len(rows) > limit or kept < len(groups)})
+
+        @self._tool(lane=BULK)
+        def export_records(
+            model: str,
+            domain: List[Any] = None,
+            fields: List[str] = None,
+            file_format: str = "ndjson",
+            filename: str = None,
+            chunk_size: int = None,
+            ctx: Context = None,
+        ) -> dict:
+            """
+            Export every record of an Odoo model matching a domain to a file,
+            for datasets too large for the other tools (e.g. all orders of a quarter).
+
+            Args:
+                model (str): Odoo model, e.g. 'sale.order' or 'res.partner'.
+                domain (List, optional): Odoo domain selecting the records (default all).
+                fields (List[str], optional): Fields to export (default every stored
+                    or related field but binary and HTML ones). Dates are in UTC.
+                file_format (str, optional): 'ndjson' (one JSON object per line) or 'csv'.
+                filename (str, optional): Name of the file in the export directory.
+                chunk_size (int, optional): Records read per Odoo call.
+
+            Returns:
+                A dictionary with the number of 'records', the file 'path', its
+                'resource' URI and the 'seconds' taken.
+            """
+
+            if file_format not in EXPORT_FORMATS:
+                return f"Unsupported file_format: {file_format}. Use one of {', '.join(EXPORT_FORMATS)}."
+            filename = filename or (
+                f"{model.replace('.', '_')}-{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
+                f".{file_format}"
+            )
+            if os.path.basename(filename) != filename or filename.startswith("."):
+                return f"Invalid filename: {filename}. Give a plain file name."
+
+            schema = self._schema()
+            if schema is not None:
+                schema.ensure(model)
+            try:
+                read_fields = self._project(model, fields or ["*"], [])
+            except UnknownFields as e:
+                return str(e)
+            if read_fields == ["id"] and not fields:
+                # No schema to choose from; Odoo returns every field
+                read_fields = None
+            types = schema.fields(model) if schema is not None else None
+
+            tenant = current_tenant.get()
+            call = current_call.get()
+
+            def fetch(model, method, args, kwargs):
+                # Runs in the export's own threads, which start without the tenant
+                token = current_tenant.set(tenant)
+                call_token = current_call.set(call)
+                try:
+                    return self._call_odoo(model, method, args, kwargs)
+                finally:
+                    current_call.reset(call_token)
+                    current_tenant.reset(token)
+
+            path = os.path.join(self.config.export_dir, filename)
+            # Unique, so that exports to the same file do not write into each other
+            partial_path = f"{path}.{uuid.uuid4().hex}.part"
+            os.makedirs(self.config.export_dir, exist_ok=True)
+            start = time.perf_counter()
+            try:
+                with open(partial_path, "w", encoding="utf-8", newline="") as f:
+                    writer = WRITERS[file_format](
+                        f,
+                        read_fields,
+                        {name: field.get("type") for name, field in (types or {}).items()},
+                    )
+                    count = export_model(
+                        fetch,
+                        model,
+                        list(domain or []),
+                        read_fields,
+                        writer,
+                        chunk_size or self.config.export_chunk_size,
+                        self.config.export_workers,
+                        lambda done, total: self._report_progress(
+                            ctx, done, total, f"{done} of {total} {model} records"
+                        ),
+                    )
+            except Exception as e:
+                # The error may have come before the file was opened
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(partial_path)
+                print(f"[Error] Export of {model} failed: {e}", file=sys.stderr)
+                return f"Export of {model} failed: {e}"
+            os.replace(partial_path, path)
+
+            return {
+                "records": count,
+                "path": path,
+                "resource": f"odoo://exports/{filename}",
+                "pages": page_count(path),
+                "seconds": round(time.perf_counter() - start, 2),
+            }
+
+        @self.mcp.resource("odoo://exports/{filename}", mime_type="text/plain")
+        def read_export(filename: str) -> str:
+            """A file written by export_records, if it fits in one page."""
+            path = os.path.join(self.config.export_dir, os.path.basename(filename))
+            pages = page_count(path)
+            if pages > 1:
+                raise ValueError(
+                    f"{filename} is larger than {EXPORT_PAGE_BYTES} bytes; read its "
+                    f"{pages} pages as odoo://exports/{filename}/0 to /{pages - 1}"
+                )
+            return read_page(path, 0)
+
+        @self.mcp.resource("odoo://exports/{filename}/{page}", mime_type="text/plain")
+        def read_export_page(filename: str, page: str) -> str:
+            """
+            One page of a file written by export_records: the whole lines
+            starting in its ``page``-th megabyte. A CSV header is in page 0.
+            """
+            path = os.path.join(self.config.export_dir, os.path.basename(filename))
+            if not page.isdigit() or int(page) >= page_count(path):
+                raise ValueError(f"{filename} has no page {page}")
+            return read_page(path, int(page))
+
+        @self._tool(lane=WRITE)
         def create_order(
             customer_name: str, product_id, create_invoice=False, finish_payment=False
         ) -> dict:
@@ -289,8 +1491,22 @@ class OdooTools:
 
             Returns:
                 Dict[str, Any]: A structured result containing success status,
-                order/invoice IDs, total amount, and messages.
+                order/invoice IDs, total amount, and messages. When a step fails
+                after the order was created, the result still holds the ids
+                created so far and ``failed_step``, so that a retry does not
+                create the order again.
             """
+            order_id = invoice_id = None
+            step = None
+
+            def failed(message: str) -> dict:
+                result = {"success": False, "message": message}
+                if order_id:
+                    result.update(order_id=order_id, failed_step=step)
+                if invoice_id:
+                    result["invoice_id"] = invoice_id
+                return result
+
             try:
                 if not product_id:
                     return {
@@ -304,15 +1520,26 @@ class OdooTools:
                         "message": "Customer name is required to create an order.",
                     }
 
-                # --- Check product existance ---
-                check_product_existance = self._execute_odoo(
-                    "product.product",
-                    "search_read",
-                    [[["id", "ilike", product_id]]],
-                    **{
-                        "fields": ["id", "name", "list_price", "description_sale"],
-                        "limit": 1,
-                    },
+                # --- Independent lookups run concurrently ---
+                check_product_existance, partner_id, journal = self._run_parallel(
+                    # --- Check product existance ---
+                    lambda: self._execute_odoo(
+                        "product.product",
+                        "search_read",
+                        [[["id", "ilike", product_id]]],
+                        **{
+                            "fields": ["id", "name", "list_price", "description_sale"],
+                            "limit": 1,
+                        },
+                    ),
+                    # --- Get or validate customer (partner) ---
+                    lambda: self._get_partner_id_by_name(customer_name),
+                    # --- Get default journal and payment method ---
+                    lambda: (
+                        self._get_default_journal_and_payment_method()
+                        if create_invoice and finish_payment
+                        else None
+                    ),
                 )
 
                 if not check_product_existance:
@@ -321,16 +1548,19 @@ class OdooTools:
                         "message": f"No product found with the ID: {product_id}",
                     }
 
-                # --- Get or validate customer (partner) ---
-                partner_id = self._get_partner_id_by_name(customer_name)
-
                 if partner_id is None:
                     return {
                         "success": False,
                         "message": f"No customer found with the name: {customer_name}",
                     }
 
-                # --- Create sales order --
+                if create_invoice and finish_payment and journal is None:
+                    return {
+                        "success": False,
+                        "message": "No Bank or Cash journal with an inbound payment method found.",
+                    }
+
+                # --- Create sales order with its line in one call ---
                 order_id = self._execute_odoo(
                     "sale.order",
                     "create",
@@ -338,113 +1568,424 @@ class OdooTools:
                         {
                             "partner_id": partner_id,
                             "state": "draft",
+                            "order_line": [
+                                (0, 0, {"product_id": product_id, "product_uom_qty": 1})
+                            ],
                         }
                     ],
                 )
 
-                order_line_data = {
-                    "order_id": order_id,
-                    "product_id": product_id,
-                    "product_uom_qty": 1,
-                }
+                if not order_id:
+                    return {"success": False, "message": "Odoo did not create the order."}
+
+                # --- Confirm order (and fetch its line for the invoice) ---
+                step = "confirm"
+                if not create_invoice:
+                    self._execute_odoo("sale.order", "action_confirm", [order_id])
+                    return {
+                        "success": True,
+                        "message": "Order created successfully.",
+                        "order_id": order_id,
+                    }
 
-                # --- Confirm order ---
-                self._execute_odoo("sale.order", "action_confirm", [order_id])
+                _confirmed, line_ids = self._run_parallel(
+                    lambda: self._execute_odoo("sale.order", "action_confirm", [order_id]),
+                    lambda: self._execute_odoo(
+                        "sale.order.line", "search", [[["order_id", "=", order_id]]]
+                    ),
+                )
 
                 # --- Create and post invoice ---
+                step = "invoice"
+                invoice_id = self._execute_odoo(
+                    "account.move",
+                    "create",
+                    [
+                        {
+                            "move_type": "out_invoice",
+                            "partner_id": partner_id,  # Customer being invoiced
+                            "invoice_line_ids": [  # --- Create invoice lines ---
+                                (
+                                    0,
+                                    0,
+                                    {
+                                        "product_id": product_id,
+                                        "quantity": 1,
+                                        "sale_line_ids": [(6, 0, line_ids)],
+                                    },
+                                )
+                            ],
+                        }
+                    ],
+                )
 
-                if create_invoice:
-
-                    line_id = self._execute_odoo(
-                        "sale.order.line", "create", [order_line_data]
-                    )
+                # --- Post the invoice ---
+                step = "post_invoice"
+                self._execute_odoo("account.move", "action_post", [invoice_id])
 
-                    invoice_id = self._execute_odoo(
-                        "account.move",
+                # --- Retrieve total amount and register payment ---
+                def register_payment():
+                    journal_id, payment_method_line_id = journal
+                    return self._execute_odoo(
+                        "account.payment.register",
                         "create",
                         [
                             {
-                                "move_type": "out_invoice",
-                                "partner_id": partner_id,  # Customer being invoiced
-                                "invoice_line_ids": [  # --- Create invoice lines ---
-                                    (
-                                        0,
-                                        0,
-                                        {
-                                            "product_id": product_id,
-                                            "quantity": 1,
-                                            "sale_line_ids": [(6, 0, [line_id])],
-                                        },
-                                    )
-                                ],
+                                "journal_id": journal_id,
+                                "payment_method_line_id": payment_method_line_id,
                             }
                         ],
+                        **{
+                            "context": {
+                                "active_model": "account.move",
+                                "active_ids": [invoice_id],
+                            }
+                        },
                     )
-                    
-                    # --- Post the invoice ---
-                    self._execute_odoo("account.move", "action_post", [invoice_id])
 
-                    # --- Retrieve total amount ---
-                    invoice_data = self._execute_odoo(
+                step = "payment"
+                invoice_data, payment_register_id = self._run_parallel(
+                    lambda: self._execute_odoo(
                         "account.move", "read", [[invoice_id], ["amount_total"]]
-                    )
-                    total_amount = invoice_data[0].get("amount_total", 0.0)
-
-                    # --- Register payment ---
-                    if finish_payment:
-                        
-                        # --- Get default journal and payment method ---
-                        journal_id, payment_method_line_id = self._get_default_journal_and_payment_method()
-                        
-                        payment_register_id = self._execute_odoo(
-                            "account.payment.register",
-                            "create",
-                            [
-                                {
-                                    "journal_id": journal_id,
-                                    "payment_method_line_id": payment_method_line_id,
-                                }
-                            ],
-                            **{
-                                "context": {
-                                    "active_model": "account.move",
-                                    "active_ids": [invoice_id],
-                                }
-                            },
-                        )
-
-                        self._execute_odoo(
-                            "account.payment.register",
-                            "action_create_payments",
-                            [[payment_register_id]],
-                        )
+                    ),
+                    register_payment if finish_payment else lambda: None,
+                )
+                total_amount = invoice_data[0].get("amount_total", 0.0) if invoice_data else 0.0
 
-                    return {
-                        "success": True,
-                        "message": "Order and invoice created successfully.",
-                        "order_id": order_id,
-                        "invoice_id": invoice_id,
-                        "total_amount": total_amount or 0
-                    }
+                if finish_payment:
+                    self._execute_odoo(
+                        "account.payment.register",
+                        "action_create_payments",
+                        [[payment_register_id]],
+                    )
 
                 return {
                     "success": True,
-                    "message": "Order created successfully.",
+                    "message": "Order and invoice created successfully.",
                     "order_id": order_id,
+                    "invoice_id": invoice_id,
+                    "total_amount": total_amount or 0
                 }
 
             except xmlrpc.client.Fault as e:
                 err_msg = str(e)
                 if "Record does not exist or has been deleted" in err_msg:
-                    print(f"[Error] Missing product record: {err_msg}")
-                    return {
-                        "success": False,
-                        "message": "One of the products does not exist in Odoo.",
-                    }
-                print(f"[XML-RPC Fault] {err_msg}")
-                return {"success": False, "message": f"Odoo fault: {err_msg}"}
+                    print(f"[Error] Missing product record: {err_msg}", file=sys.stderr)
+                    return failed("One of the products does not exist in Odoo.")
+                print(f"[XML-RPC Fault] {err_msg}", file=sys.stderr)
+                return failed(f"Odoo fault: {err_msg}")
+
+            except OdooUnavailable as e:
+                return failed(str(e))
 
             except Exception as e:
-                print(f"[Exception] {e}")
+                print(f"[Exception] {e}", file=sys.stderr)
                 traceback.print_exc()
-                return {"success": False, "message": f"Unexpected error: {e}"}
+                return failed(f"Unexpected error: {e}")
+
+        @self._tool(lane=BULK)
+        def create_orders_bulk(orders: List[Dict[str, Any]]) -> dict:
+            """
+            Creates and confirms many sales orders with a few batched Odoo calls.
+
+            Args:
+                orders (List[dict]): Order specs, each with 'customer_name',
+                    'product_id' and an optional positive 'quantity' (default 1).
+
+            Returns:
+                Dict[str, Any]: Overall success flag and one result per order spec,
+                in input order, with its 'order_id' and/or an error 'message'
+                (an order Odoo created but did not confirm has both).
+            """
+            if not orders:
+                return {"success": False, "message": "At least one order is required."}
+
+            results = [None] * len(orders)
+            valid = []
+            for index, spec in enumerate(orders):
+                customer_name = (spec.get("customer_name") or "").strip()
+                quantity = 1 if spec.get("quantity") is None else spec["quantity"]
+                message = None
+                if not spec.get("product_id") or not customer_name:
+                    message = "Both customer_name and product_id are required."
+                elif (
+                    isinstance(quantity, bool)
+                    or not isinstance(quantity, (int, float))
+                    or quantity <= 0
+                ):
+                    message = f"quantity must be a positive number, got {quantity!r}."
+                else:
+                    try:
+                        spec = {**spec, "product_id": int(spec["product_id"]), "quantity": quantity}
+                    except (TypeError, ValueError):
+                        message = f"product_id must be an integer, got {spec['product_id']!r}."
+                if message is None:
+                    valid.append((index, spec, customer_name))
+                    continue
+                results[index] = {"index": index, "success": False, "message": message}
+
+            if valid:
+                # --- Resolve every product and customer in two concurrent calls ---
+                product_ids = sorted({spec["product_id"] for _, spec, _ in valid})
+                existing_products, partner_ids = self._run_parallel(
+                    lambda: self._execute_odoo(
+                        "product.product", "search", [[["id", "in", product_ids]]]
+                    ),
+                    lambda: self._get_partner_ids_by_names(
+                        sorted({name for _, _, name in valid})
+                    ),
+                )
+                existing_products = set(existing_products)
+
+                pending = []
+                for index, spec, customer_name in valid:
+                    if spec["product_id"] not in existing_products:
+                        message = f"No product found with the ID: {spec['product_id']}"
+                    elif partner_ids.get(customer_name) is None:
+                        message = f"No customer found with the name: {customer_name}"
+                    else:
+                        pending.append(
+                            (
+                                index,
+                                {
+                                    "partner_id": partner_ids[customer_name],
+                                    "state": "draft",
+                                    "order_line": [
+                                        (
+                                            0,
+                                            0,
+                                            {
+                                                "product_id": spec["product_id"],
+                                                "product_uom_qty": spec["quantity"],
+                                            },
+                                        )
+                                    ],
+                                },
+                            )
+                        )
+                        continue
+                    results[index] = {"index": index, "success": False, "message": message}
+
+                # --- Create and confirm orders, one batch per call ---
+                # Like bulk_create, a batch Odoo rejects is split so only the
+                # bad orders fail, each with Odoo's error
+                budget = [BULK_RETRY_CALLS]
+                unavailable = None
+                for start in range(0, len(pending), ORDER_BULK_CHUNK_SIZE):
+                    batch = pending[start : start + ORDER_BULK_CHUNK_SIZE]
+                    if unavailable is not None:
+                        # Once Odoo is down or overloaded, the remaining orders are not sent
+                        for index, _ in batch:
+                            results[index] = {
+                                "index": index,
+                                "success": False,
+                                "message": str(unavailable),
+                            }
+                        continue
+
+                    created = self._bisect_batch(
+                        batch,
+                        lambda values_list: self._write_odoo("sale.order", "create", [values_list]),
+                        budget,
+                    )
+                    order_ids = []
+                    for index, _ in batch:
+                        result = created.get(index, Exception("Odoo did not create this order."))
+                        if isinstance(result, Exception):
+                            results[index] = {"index": index, "success": False, "message": str(result)}
+                            if isinstance(result, OdooUnavailable) and unavailable is None:
+                                unavailable = OdooUnavailable(NOT_SENT)
+                        else:
+                            order_ids.append((index, result))
+                    if not order_ids:
+                        continue
+
+                    confirmed = self._bisect_batch(
+                        order_ids,
+                        lambda ids: [self._write_odoo("sale.order", "action_confirm", [ids])]
+                        * len(ids),
+                        budget,
+                    )
+                    for index, order_id in order_ids:
+                        results[index] = {"index": index, "success": True, "order_id": order_id}
+                        error = confirmed.get(index)
+                        if isinstance(error, Exception):
+                            print(
+                                f"[Error] Could not confirm order {order_id}: {error}",
+                                file=sys.stderr,
+                            )
+                            results[index].update(
+                                success=False, message=f"Order created but not confirmed: {error}"
+                            )
+                            if isinstance(error, OdooUnavailable) and unavailable is None:
+                                unavailable = OdooUnavailable(NOT_SENT)
+
+            return {
+                "success": all(result["success"] for result in results),
+                "orders": results,
+            }
+
+        @self._tool(lane=BULK)
+        def bulk_create(
+            model: str,
+            records: List[Dict[str, Any]],
+            chunk_size: int = None,
+            ctx: Context = None,
+        ) -> dict:
+            """
+            Creates many records of an Odoo model, many per Odoo call.
+
+            Args:
+                model (str): Odoo model, e.g. 'res.partner'.
+                records (List[dict]): Field values of each record to create.
+                chunk_size (int, optional): Records per Odoo call, each its own
+                    transaction (default from ODOO_BULK_CHUNK_SIZE).
+
+            Returns:
+                Dict[str, Any]: Overall success flag, the number 'created', the new
+                'ids' in input order (None where creation failed) and 'errors',
+                each with the 'index' of the record and a 'message'.
+            """
+            if not records:
+                return {"success": False, "message": "At least one record is required."}
+
+            schema = self._schema()
+            if schema is not None:
+                schema.ensure(model)
+
+            ids = [None] * len(records)
+            errors = []
+            valid = []
+            for index, values in enumerate(records):
+                if not values:
+                    errors.append({"index": index, "message": "No field values given."})
+                    continue
+                try:
+                    if schema is not None:
+                        schema.check(model, values)
+                except UnknownFields as e:
+                    errors.append({"index": index, "message": str(e)})
+                    continue
+                valid.append((index, values))
+
+            size = chunk_size or self.config.bulk_chunk_size
+            budget = [BULK_RETRY_CALLS]
+            unavailable = None
+            for start in range(0, len(valid), size):
+                batch = valid[start : start + size]
+                # Once Odoo is down or overloaded, the remaining chunks are not sent
+                outcome = (
+                    self._bisect_batch(
+                        batch,
+                        lambda values_list: self._write_odoo(model, "create", [values_list]),
+                        budget,
+                    )
+                    if unavailable is None
+                    else {index: unavailable for index, _ in batch}
+                )
+                for index, _ in batch:
+                    result = outcome.get(index, Exception("Odoo returned no id for this record."))
+                    if isinstance(result, Exception):
+                        errors.append({"index": index, "message": str(result)})
+                        if isinstance(result, OdooUnavailable) and unavailable is None:
+                            unavailable = OdooUnavailable(NOT_SENT)
+                    else:
+                        ids[index] = result
+                self._report_progress(ctx, start + len(batch), len(valid))
+
+            errors.sort(key=lambda error: error["index"])
+            return {
+                "success": not errors,
+                "created": len(records) - len(errors),
+                "ids": ids,
+                "errors": errors,
+            }
+
+        @self._tool(lane=BULK)
+        def bulk_write(
+            model: str,
+            updates: List[Dict[str, Any]],
+            chunk_size: int = None,
+            ctx: Context = None,
+        ) -> dict:
+            """
+            Updates many records of an Odoo model. Records getting the same
+            values are written together, many per Odoo call.
+
+            Args:
+                model (str): Odoo model, e.g. 'product.product'.
+                updates (List[dict]): One dictionary per record with its 'id' and
+                    the field values to write, e.g. {"id": 7, "list_price": 9.5}.
+                    Each record may appear once.
+                chunk_size (int, optional): Records per Odoo call, each its own
+                    transaction (default from ODOO_BULK_CHUNK_SIZE).
+
+            Returns:
+                Dict[str, Any]: Overall success flag, the number 'updated' and
+                'errors', each with the 'index' of the update and a 'message'.
+            """
+            if not updates:
+                return {"success": False, "message": "At least one update is required."}
+
+            schema = self._schema()
+            if schema is not None:
+                schema.ensure(model)
+
+            errors = []
+            seen = set()
+            groups = {}  # serialized values -> (values, [(index, id)])
+            for index, update in enumerate(updates):
+                record_id = update.get("id")
+                values = {k: v for k, v in update.items() if k != "id"}
+                if not isinstance(record_id, int) or not values:
+                    message = "Expected an integer 'id' and at least one field value."
+                elif record_id in seen:
+                    message = f"Record {record_id} is updated more than once."
+                else:
+                    try:
+                        if schema is not None:
+                            schema.check(model, values)
+                    except UnknownFields as e:
+                        message = str(e)
+                    else:
+                        seen.add(record_id)
+                        key = json.dumps(values, sort_keys=True, default=str)
+                        groups.setdefault(key, (values, []))[1].append((index, record_id))
+                        continue
+                errors.append({"index": index, "message": message})
+
+            size = chunk_size or self.config.bulk_chunk_size
+            budget = [BULK_RETRY_CALLS]
+            unavailable = None
+            done, total = 0, len(seen)
+            for values, batch_items in groups.values():
+                for start in range(0, len(batch_items), size):
+                    batch = batch_items[start : start + size]
+                    # Once Odoo is down or overloaded, the remaining chunks are not sent
+                    outcome = (
+                        self._bisect_batch(
+                            batch,
+                            lambda record_ids, values=values: [
+                                self._write_odoo(model, "write", [record_ids, values])
+                            ]
+                            * len(record_ids),
+                            budget,
+                        )
+                        if unavailable is None
+                        else {index: unavailable for index, _ in batch}
+                    )
+                    for index, _ in batch:
+                        result = outcome.get(index)
+                        if isinstance(result, Exception):
+                            errors.append({"index": index, "message": str(result)})
+                            if isinstance(result, OdooUnavailable) and unavailable is None:
+                                unavailable = OdooUnavailable(NOT_SENT)
+                    done += len(batch)
+                    self._report_progress(ctx, done, total)
+
+            errors.sort(key=lambda error: error["index"])
+            return {
+                "success": not errors,
+                "updated": len(updates) - len(errors),
+                "errors": errors,
+            }
@@ -0,0 +1,226 @@
+import gzip
+import http.client
+import itertools
+import json
+import select
+import time
+import xmlrpc.client
+from urllib.parse import urlsplit
+
+try:
+    import orjson
+except ImportError:  # optional, falls back to the standard library codec
+    orjson = None
+
+PROTOCOLS = ("xmlrpc", "jsonrpc")
+
+
+def _dumps(payload) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode()
+
+
+def _loads(body: bytes):
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def _socket_is_stale(sock, last_used: float, idle_timeout: float) -> bool:
+    """
+    Return True if a cached keep-alive socket should not be reused: it sat
+    idle longer than ``idle_timeout`` or the peer closed it.
+    """
+    if sock is None:
+        return False
+    if time.monotonic() - last_used > idle_timeout:
+        return True
+    # An idle keep-alive socket is only readable if the server hung up
+    readable, _, _ = select.select([sock], [], [], 0)
+    return bool(readable)
+
+
+class JsonRpcFault(xmlrpc.client.Fault):
+    """
+    Error returned by Odoo's ``/jsonrpc`` endpoint.
+
+    Subclasses ``xmlrpc.client.Fault`` so callers handle server-side errors
+    the same way whichever protocol is configured.
+    """
+
+
+class _PooledTransportMixin:
+    """
+    Keep-alive transport that honours a socket timeout and records the size
+    of the last request and response bodies.
+    """
+
+    def __init__(self, timeout: float, **kwargs):
+        super().__init__(**kwargs)
+        self.timeout = timeout
+        self.last_request_bytes = 0
+        self.last_response_bytes = 0
+
+    def make_connection(self, host):
+        connection = super().make_connection(host)
+        # xmlrpc.client never passes a timeout to http.client itself
+        connection.timeout = self.timeout
+        return connection
+
+    def send_content(self, connection, request_body):
+        self.last_request_bytes = len(request_body)
+        super().send_content(connection, request_body)
+
+    def parse_response(self, response):
+        self.last_response_bytes = int(response.getheader("Content-Length") or 0)
+        return super().parse_response(response)
+
+    @property
+    def sock(self):
+        return self._connection[1].sock if self._connection[1] else None
+
+
+class PooledTransport(_PooledTransportMixin, xmlrpc.client.Transport):
+    pass
+
+
+class PooledSafeTransport(_PooledTransportMixin, xmlrpc.client.SafeTransport):
+    pass
+
+
+def make_transport(url: str, timeout: float) -> xmlrpc.client.Transport:
+    """Create a keep-alive transport matching the URL scheme."""
+    if url.startswith("https://"):
+        return PooledSafeTransport(timeout)
+    return PooledTransport(timeout)
+
+
+class XmlRpcConnection:
+    """
+    One persistent connection to Odoo's ``/xmlrpc/2`` endpoints.
+    """
+
+    protocol = "xmlrpc"
+
+    def __init__(self, url: str, timeout: float = 30):
+        common_url = f"{url}/xmlrpc/2/common"
+        object_url = f"{url}/xmlrpc/2/object"
+        self._common = xmlrpc.client.ServerProxy(
+            common_url, transport=make_transport(common_url, timeout)
+        )
+        self._models = xmlrpc.client.ServerProxy(
+            object_url, transport=make_transport(object_url, timeout)
+        )
+        self.last_used = time.monotonic()
+
+    def authenticate(self, database: str, username: str, password: str):
+        return self._common.authenticate(database, username, password, {})
+
+    def execute_kw(self, *args):
+        return self._models.execute_kw(*args)
+
+    @property
+    def last_request_bytes(self) -> int:
+        return self._models("transport").last_request_bytes
+
+    @property
+    def last_response_bytes(self) -> int:
+        return self._models("transport").last_response_bytes
+
+    def is_stale(self, idle_timeout: float) -> bool:
+        return _socket_is_stale(self._models("transport").sock, self.last_used, idle_timeout)
+
+    def close(self):
+        self._common("close")()
+        self._models("close")()
+
+
+class JsonRpcConnection:
+    """
+    One persistent connection to Odoo's ``/jsonrpc`` endpoint.
+
+    JSON is cheaper to encode and decode than XML-RPC and produces smaller
+    payloads; ``orjson`` is used when installed. With ``compress`` enabled,
+    gzip-encoded responses are requested and transparently decompressed.
+    """
+
+    protocol = "jsonrpc"
+
+    def __init__(self, url: str, timeout: float = 30, compress: bool = True):
+        parts = urlsplit(url)
+        connection_class = (
+            http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        )
+        self._url = f"{url}/jsonrpc"
+        self._path = f"{parts.path.rstrip('/')}/jsonrpc"
+        self._connection = connection_class(parts.hostname, parts.port, timeout=timeout)
+        self._headers = {
+            "Content-Type": "application/json",
+            "Accept-Encoding": "gzip" if compress else "identity",
+        }
+        self._ids = itertools.count(1)
+        self.last_used = time.monotonic()
+        self.last_request_bytes = 0
+        self.last_response_bytes = 0
+
+    def _post(self, body: bytes) -> http.client.HTTPResponse:
+        # Retry once if the server dropped the keep-alive connection
+        for attempt in range(2):
+            try:
+                self._connection.request("POST", self._path, body, self._headers)
+                return self._connection.getresponse()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                self._connection.close()
+                if attempt:
+                    raise
+
+    def _call(self, service: str, method: str, *args):
+        body = _dumps(
+            {
+                "jsonrpc": "2.0",
+                "method": "call",
+                "params": {"service": service, "method": method, "args": list(args)},
+                "id": next(self._ids),
+            }
+        )
+        response = self._post(body)
+        data = response.read()
+        self.last_request_bytes = len(body)
+        self.last_response_bytes = len(data)
+        if response.status != 200:
+            raise xmlrpc.client.ProtocolError(
+                self._url, response.status, response.reason, dict(response.getheaders())
+            )
+        if response.getheader("Content-Encoding") == "gzip":
+            data = gzip.decompress(data)
+
+        reply = _loads(data)
+        error = reply.get("error")
+        if error:
+            details = error.get("data") or {}
+            raise JsonRpcFault(
+                error.get("code", 0), details.get("message") or error.get("message", "")
+            )
+        return reply.get("result")
+
+    def authenticate(self, database: str, username: str, password: str):
+        return self._call("common", "authenticate", database, username, password, {})
+
+    def execute_kw(self, *args):
+        return self._call("object", "execute_kw", *args)
+
+    def is_stale(self, idle_timeout: float) -> bool:
+        return _socket_is_stale(self._connection.sock, self.last_used, idle_timeout)
+
+    def close(self):
+        self._connection.close()
+
+
+def create_connection(protocol: str, url: str, timeout: float = 30, compress: bool = True):
+    """Open a connection to ``url`` speaking the configured ``protocol``."""
+    if protocol == "jsonrpc":
+        return JsonRpcConnection(url, timeout, compress)
+    if protocol == "xmlrpc":
+        return XmlRpcConnection(url, timeout)
+    raise ValueError(f"Unsupported Odoo protocol: {protocol}")